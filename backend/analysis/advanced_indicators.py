@@ -234,18 +234,30 @@ class AdvancedIndicators:
     def calculate_support_resistance_levels(self, high: pd.Series, low: pd.Series, close: pd.Series, 
                                           lookback: int = 20, min_touches: int = 2) -> Dict[str, List[float]]:
         """지지/저항선 계산 (고도화)"""
-        # 피벗 포인트 찾기
-        highs = []
-        lows = []
+        # 피벗 포인트 찾기 (Series는 한 번만 ndarray로 변환하고 앞뒤 lookback 구간 최대/최소와 한꺼번에 비교)
+        high_values = high.to_numpy(dtype=np.float64)
+        low_values = low.to_numpy(dtype=np.float64)
         
-        for i in range(lookback, len(high) - lookback):
-            # 고점 찾기
-            if all(high.iloc[i] >= high.iloc[i-lookback:i]) and all(high.iloc[i] >= high.iloc[i+1:i+lookback+1]):
-                highs.append(high.iloc[i])
+        pivots = np.arange(lookback, len(high_values) - lookback)
+        if len(pivots) == 0:
+            highs, lows = [], []
+        else:
+            # windows[j] = values[j:j+lookback] -> 앞 구간은 pivots-lookback, 뒤 구간은 pivots+1에서 시작
+            high_windows = np.lib.stride_tricks.sliding_window_view(high_values, lookback)
+            low_windows = np.lib.stride_tricks.sliding_window_view(low_values, lookback)
+            
+            # 고점: 앞뒤 구간의 모든 값 이상 (NaN이 섞이면 비교가 False가 되어 제외)
+            pivot_highs = high_values[pivots]
+            is_high = ((pivot_highs >= high_windows[pivots - lookback].max(axis=1)) &
+                       (pivot_highs >= high_windows[pivots + 1].max(axis=1)))
+            
+            # 저점: 앞뒤 구간의 모든 값 이하
+            pivot_lows = low_values[pivots]
+            is_low = ((pivot_lows <= low_windows[pivots - lookback].min(axis=1)) &
+                      (pivot_lows <= low_windows[pivots + 1].min(axis=1)))
             
-            # 저점 찾기
-            if all(low.iloc[i] <= low.iloc[i-lookback:i]) and all(low.iloc[i] <= low.iloc[i+1:i+lookback+1]):
-                lows.append(low.iloc[i])
+            highs = list(pivot_highs[is_high])
+            lows = list(pivot_lows[is_low])
         
         # 클러스터링으로 유사한 레벨들 그룹화
         def cluster_levels(levels, tolerance=0.01):
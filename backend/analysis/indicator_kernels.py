@@ -0,0 +1,86 @@
+"""
+지표 커널 - 백테스트 지표 캐시와 실시간 분석기가 함께 쓰는 Numba EMA/RSI
+
+결과는 TA-Lib EMA/RSI와 같다. 커널은 시그니처를 명시해 import 시점에 컴파일한다.
+"""
+import numpy as np
+from typing import Optional
+from numba import njit
+
+
+@njit('float64[:](float64[:], int64)', cache=True, fastmath={'contract'})
+def ema_nb(x: np.ndarray, n: int) -> np.ndarray:
+    """지수이동평균 (TA-Lib EMA와 동일 - 첫 값은 n개 단순평균)
+    
+    TA-Lib 빌드처럼 곱셈-덧셈을 FMA로 합치도록 contract만 허용
+    """
+    size = x.shape[0]
+    out = np.full(size, np.nan)
+    if n < 1 or size < n:
+        return out
+    
+    total = 0.0
+    for i in range(n):
+        total += x[i]
+    prev = total / n
+    out[n - 1] = prev
+    
+    k = 2.0 / (n + 1)
+    for i in range(n, size):
+        prev = (x[i] - prev) * k + prev
+        out[i] = prev
+    
+    return out
+
+
+@njit('float64[:](float64[:], int64)', cache=True)
+def rsi_nb(x: np.ndarray, n: int) -> np.ndarray:
+    """RSI (TA-Lib RSI와 동일 - Wilder 평활, 첫 값은 n개 변화량 평균)"""
+    size = x.shape[0]
+    out = np.full(size, np.nan)
+    if n < 2 or size <= n:
+        return out
+    
+    prev_gain = 0.0
+    prev_loss = 0.0
+    for i in range(1, n + 1):
+        diff = x[i] - x[i - 1]
+        if diff < 0:
+            prev_loss -= diff
+        else:
+            prev_gain += diff
+    # TA-Lib과 비트 단위로 같도록 나눗셈 대신 역수 곱 사용
+    inv_n = 1.0 / n
+    prev_gain *= inv_n
+    prev_loss *= inv_n
+    
+    total = prev_gain + prev_loss
+    out[n] = 100.0 * (prev_gain / total) if not (-1e-8 < total < 1e-8) else 0.0
+    
+    for i in range(n + 1, size):
+        diff = x[i] - x[i - 1]
+        prev_gain *= n - 1
+        prev_loss *= n - 1
+        if diff < 0:
+            prev_loss -= diff
+        else:
+            prev_gain += diff
+        prev_gain *= inv_n
+        prev_loss *= inv_n
+        
+        total = prev_gain + prev_loss
+        out[i] = 100.0 * (prev_gain / total) if not (-1e-8 < total < 1e-8) else 0.0
+    
+    return out
+
+
+def last_rsi(prices: np.ndarray, period: int = 14) -> Optional[float]:
+    """마지막 바의 RSI (가격이 period개 이하이거나 최근 period+1개 가격이 변하지 않았으면 None)
+    
+    rsi_nb는 TA-Lib처럼 상승/하락 합이 0이면 0을 돌려주므로, 같은 가격만 반복된
+    실시간 히스토리를 과매도로 읽지 않도록 움직임이 없으면 값을 내지 않는다
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    if prices.shape[0] <= period or np.ptp(prices[-(period + 1):]) == 0:
+        return None
+    return float(rsi_nb(prices, period)[-1])
@@ -365,12 +365,12 @@ class MLSignalGenerator:
         }
         joblib.dump(model_data, filepath)
     
-    def load_models(self, filepath: str):
-        """모델 로드"""
+    def load_models(self, filepath: str, mmap_mode: Optional[str] = None):
+        """모델 로드 (mmap_mode='r'이면 모델의 큰 배열을 복사 없이 메모리 맵으로 읽음)"""
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {filepath}")
         
-        model_data = joblib.load(filepath)
+        model_data = joblib.load(filepath, mmap_mode=mmap_mode)
         self.models = model_data['models']
         self.scalers = model_data['scalers']
         self.feature_columns = model_data['feature_columns']
@@ -9,6 +9,11 @@ from dataclasses import dataclass
 from enum import Enum
 
 
+def _as_double(data: pd.Series) -> np.ndarray:
+    """TA-Lib 입력용 float64 연속 배열 변환 (float32 입력 허용)"""
+    return np.ascontiguousarray(data.values, dtype=np.float64)
+
+
 class SignalType(Enum):
     """신호 타입"""
     BUY = "buy"
@@ -46,22 +51,22 @@ class TechnicalAnalyzer:
     
     def calculate_sma(self, data: pd.Series, period: int) -> pd.Series:
         """단순이동평균선 계산"""
-        result = talib.SMA(data.values, timeperiod=period)
+        result = talib.SMA(_as_double(data), timeperiod=period)
         return pd.Series(result, index=data.index)
     
     def calculate_ema_talib(self, data: pd.Series, period: int) -> pd.Series:
         """지수이동평균선 계산 (TA-Lib)"""
-        result = talib.EMA(data.values, timeperiod=period)
+        result = talib.EMA(_as_double(data), timeperiod=period)
         return pd.Series(result, index=data.index)
     
     def calculate_rsi(self, data: pd.Series, period: int = 14) -> pd.Series:
         """RSI 계산"""
-        result = talib.RSI(data.values, timeperiod=period)
+        result = talib.RSI(_as_double(data), timeperiod=period)
         return pd.Series(result, index=data.index)
     
     def calculate_macd(self, data: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, pd.Series]:
         """MACD 계산"""
-        macd, macd_signal, macd_hist = talib.MACD(data.values, fastperiod=fast, slowperiod=slow, signalperiod=signal)
+        macd, macd_signal, macd_hist = talib.MACD(_as_double(data), fastperiod=fast, slowperiod=slow, signalperiod=signal)
         return {
             'macd': pd.Series(macd, index=data.index),
             'signal': pd.Series(macd_signal, index=data.index),
@@ -70,7 +75,7 @@ class TechnicalAnalyzer:
     
     def calculate_bollinger_bands(self, data: pd.Series, period: int = 20, std_dev: float = 2.0) -> Dict[str, pd.Series]:
         """볼린저 밴드 계산"""
-        upper, middle, lower = talib.BBANDS(data.values, timeperiod=period, nbdevup=std_dev, nbdevdn=std_dev)
+        upper, middle, lower = talib.BBANDS(_as_double(data), timeperiod=period, nbdevup=std_dev, nbdevdn=std_dev)
         return {
             'upper': pd.Series(upper, index=data.index),
             'middle': pd.Series(middle, index=data.index),
@@ -80,7 +85,7 @@ class TechnicalAnalyzer:
     def calculate_stochastic(self, high: pd.Series, low: pd.Series, close: pd.Series, 
                            k_period: int = 14, d_period: int = 3) -> Dict[str, pd.Series]:
         """스토캐스틱 계산"""
-        k, d = talib.STOCH(high.values, low.values, close.values, 
+        k, d = talib.STOCH(_as_double(high), _as_double(low), _as_double(close), 
                           fastk_period=k_period, slowk_period=d_period, slowd_period=d_period)
         return {
             'k': pd.Series(k, index=high.index),
@@ -89,17 +94,17 @@ class TechnicalAnalyzer:
     
     def calculate_atr(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
         """ATR (Average True Range) 계산"""
-        result = talib.ATR(high.values, low.values, close.values, timeperiod=period)
+        result = talib.ATR(_as_double(high), _as_double(low), _as_double(close), timeperiod=period)
         return pd.Series(result, index=high.index)
     
     def calculate_cci(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
         """CCI (Commodity Channel Index) 계산"""
-        result = talib.CCI(high.values, low.values, close.values, timeperiod=period)
+        result = talib.CCI(_as_double(high), _as_double(low), _as_double(close), timeperiod=period)
         return pd.Series(result, index=high.index)
     
     def calculate_obv(self, close: pd.Series, volume: pd.Series) -> pd.Series:
         """OBV (On Balance Volume) 계산"""
-        result = talib.OBV(close.values, volume.values)
+        result = talib.OBV(_as_double(close), _as_double(volume))
         return pd.Series(result, index=close.index)
     
     def calculate_vwap(self, high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Series) -> pd.Series:
@@ -150,8 +155,9 @@ class TechnicalAnalyzer:
             'val': volume_by_price.quantile(0.2)   # Value Area Low
         }
     
-    def generate_signals(self, data: pd.DataFrame) -> List[TechnicalSignal]:
-        """종합 기술적 분석 신호 생성"""
+    def generate_signals(self, data: pd.DataFrame, 
+                         indicators: Optional[Dict[str, pd.Series]] = None) -> List[TechnicalSignal]:
+        """종합 기술적 분석 신호 생성 (calculate_all_indicators 결과가 있으면 재사용)"""
         signals = []
         
         if len(data) < 50:  # 최소 데이터 요구량
@@ -163,7 +169,7 @@ class TechnicalAnalyzer:
         volume = data['volume']
         
         # RSI 신호
-        rsi = self.calculate_rsi(close)
+        rsi = indicators['rsi_14'] if indicators else self.calculate_rsi(close)
         if not pd.isna(rsi.iloc[-1]):
             if rsi.iloc[-1] < 30:
                 signals.append(TechnicalSignal(
@@ -187,7 +193,14 @@ class TechnicalAnalyzer:
                 ))
         
         # MACD 신호
-        macd_data = self.calculate_macd(close)
+        if indicators:
+            macd_data = {
+                'macd': indicators['macd'],
+                'signal': indicators['macd_signal'],
+                'histogram': indicators['macd_histogram']
+            }
+        else:
+            macd_data = self.calculate_macd(close)
         if not pd.isna(macd_data['macd'].iloc[-1]) and not pd.isna(macd_data['signal'].iloc[-1]):
             if macd_data['macd'].iloc[-1] > macd_data['signal'].iloc[-1] and macd_data['histogram'].iloc[-1] > 0:
                 signals.append(TechnicalSignal(
@@ -211,7 +224,14 @@ class TechnicalAnalyzer:
                 ))
         
         # 볼린저 밴드 신호
-        bb_data = self.calculate_bollinger_bands(close)
+        if indicators:
+            bb_data = {
+                'upper': indicators['bb_upper'],
+                'middle': indicators['bb_middle'],
+                'lower': indicators['bb_lower']
+            }
+        else:
+            bb_data = self.calculate_bollinger_bands(close)
         if not pd.isna(bb_data['upper'].iloc[-1]) and not pd.isna(bb_data['lower'].iloc[-1]):
             current_price = close.iloc[-1]
             if current_price <= bb_data['lower'].iloc[-1]:
@@ -294,8 +294,7 @@ async def select_strategy(request: StrategySelectionRequest, background_tasks: B
                 # 모든 포지션 강제 정리
                 if hasattr(trading_engine, 'positions'):
                     trading_engine.positions.clear()
-                if hasattr(trading_engine, 'trades'):
-                    trading_engine.trades.clear()
+                trading_engine.reset_trades()
             
             logger.info("✅ AI 추천: 기존 거래 강력 중지 완료")
         
@@ -635,8 +634,7 @@ async def select_traditional_strategy(strategy_type: str, symbols: List[str] = N
                 # 모든 포지션 강제 정리
                 if hasattr(trading_engine, 'positions'):
                     trading_engine.positions.clear()
-                if hasattr(trading_engine, 'trades'):
-                    trading_engine.trades.clear()
+                trading_engine.reset_trades()
             
             logger.info("✅ 기존 거래 강력 중지 완료")
         
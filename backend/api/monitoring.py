@@ -163,7 +163,7 @@ async def get_ai_strategy_details():
         
         # 최근 거래 내역 포맷팅
         recent_trades = []
-        for trade in trading_engine.trades[-10:]:  # 최근 10개 거래
+        for trade in trading_engine.recent_trades(10):  # 최근 10개 거래
             try:
                 if hasattr(trade, 'id'):
                     recent_trades.append({
@@ -229,7 +229,7 @@ async def get_ai_strategy_details():
                 "pnl_percentage": portfolio_summary.get("pnl_percentage", 0),
                 "total_return": portfolio_summary.get("total_pnl", 0),
                 "open_positions": len(trading_engine.positions),
-                "total_trades": len(trading_engine.trades),
+                "total_trades": trading_engine.total_trades_count,
                 "win_rate": portfolio_summary.get("win_rate", 0),
                 "max_drawdown": portfolio_summary.get("max_drawdown", 0)
             },
@@ -265,7 +265,7 @@ async def get_traditional_strategy_details():
         if trading_engine:
             status = trading_engine.get_status()
             positions = list(trading_engine.positions.values()) if hasattr(trading_engine, 'positions') else []
-            trades = trading_engine.trades[-50:] if hasattr(trading_engine, 'trades') else []
+            trades = trading_engine.recent_trades(50) if hasattr(trading_engine, 'trades') else []
         else:
             status = {}
             positions = []
@@ -0,0 +1,64 @@
+"""
+백테스팅 엔진 수치 커널 - Numba JIT 컴파일
+
+시그니처를 명시해 첫 호출이 아닌 import 시점에 컴파일 (cache=True로 컴파일 결과는 디스크에 재사용)
+"""
+import numpy as np
+from numba import njit
+
+
+# 청산 사유 코드
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+
+
+@njit('int8[:](boolean[:], float64[:], float64)', cache=True)
+def exit_codes(is_long: np.ndarray, entry_prices: np.ndarray, price: float) -> np.ndarray:
+    """미청산 거래별 손절/익절 여부 (롱: 2% 손절/4% 익절, 숏: 2% 손절/4% 익절)"""
+    n = entry_prices.shape[0]
+    codes = np.zeros(n, dtype=np.int8)
+    
+    for i in range(n):
+        entry_price = entry_prices[i]
+        if is_long[i]:
+            if price <= entry_price * 0.98:
+                codes[i] = EXIT_STOP_LOSS
+            elif price >= entry_price * 1.04:
+                codes[i] = EXIT_TAKE_PROFIT
+        else:
+            if price >= entry_price * 1.02:
+                codes[i] = EXIT_STOP_LOSS
+            elif price <= entry_price * 0.96:
+                codes[i] = EXIT_TAKE_PROFIT
+    
+    return codes
+
+
+@njit('float64[:](float64[:])', cache=True)
+def equity_returns(equity: np.ndarray) -> np.ndarray:
+    """자본 곡선의 기간별 수익률"""
+    n = equity.shape[0]
+    returns = np.empty(max(n - 1, 0), dtype=np.float64)
+    
+    for i in range(1, n):
+        returns[i - 1] = (equity[i] - equity[i - 1]) / equity[i - 1]
+    
+    return returns
+
+
+@njit('float64(float64[:])', cache=True)
+def max_drawdown(equity: np.ndarray) -> float:
+    """자본 곡선의 최대 낙폭"""
+    peak = equity[0]
+    max_dd = 0.0
+    
+    for i in range(equity.shape[0]):
+        value = equity[i]
+        if value > peak:
+            peak = value
+        drawdown = (peak - value) / peak
+        if drawdown > max_dd:
+            max_dd = drawdown
+    
+    return max_dd
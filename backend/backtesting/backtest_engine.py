@@ -3,13 +3,21 @@
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
 from strategies.base_strategy import BaseStrategy, TradingSignal, SignalType
 from core.commission import CommissionCalculator, ExchangeType
+from backtesting.indicators import IndicatorCache
+from backtesting._engine_kernel import (
+    EXIT_STOP_LOSS, EXIT_TAKE_PROFIT, exit_codes, equity_returns, max_drawdown
+)
+
+
+# ndarray 입력 시 열 순서
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
 
 
 class TradeStatus(Enum):
@@ -77,6 +85,7 @@ class BacktestEngine:
                  exchange: ExchangeType = ExchangeType.BITHUMB):
         self.initial_capital = initial_capital
         self.current_capital = initial_capital
+        self.commission_rate = commission_rate
         self.commission_calculator = CommissionCalculator()
         self.exchange = exchange
         self.trades: List[Trade] = []
@@ -85,18 +94,23 @@ class BacktestEngine:
         
     def run_backtest(self, 
                     strategy: BaseStrategy, 
-                    data: pd.DataFrame,
+                    data: Union[pd.DataFrame, np.ndarray],
                     start_date: Optional[datetime] = None,
-                    end_date: Optional[datetime] = None) -> BacktestResult:
-        """백테스트 실행"""
-        # 데이터 필터링
-        if start_date:
-            data = data[data.index >= start_date]
-        if end_date:
-            data = data[data.index <= end_date]
-        
-        if data.empty:
-            raise ValueError("No data available for backtesting")
+                    end_date: Optional[datetime] = None,
+                    index: Optional[Union[pd.Index, np.ndarray]] = None,
+                    indicators: Optional[IndicatorCache] = None) -> BacktestResult:
+        """백테스트 실행
+        
+        data는 DataFrame 또는 OHLCV_COLUMNS 순서의 (n, 5) ndarray (이 경우 index에 타임스탬프 전달)
+        indicators는 필터링 후 data의 종가로 만든 IndicatorCache (전략의 EMA/RSI 계산을 재사용)
+        """
+        data = self._prepare_data(data, start_date, end_date, index)
+        
+        if indicators is not None:
+            if len(indicators) != len(data):
+                raise ValueError("indicators length does not match backtest data")
+            if indicators.index is None:
+                indicators.index = data.index
         
         # 백테스트 초기화
         self._reset_backtest()
@@ -104,27 +118,18 @@ class BacktestEngine:
         # 전략 시작
         strategy.start()
         
-        # 백테스트 실행
-        for i in range(len(data)):
-            current_data = data.iloc[:i+1]
-            current_time = data.index[i]
-            
-            # 전략 분석
-            signals = strategy.analyze(current_data)
-            
-            # 신호 처리
-            for signal in signals:
-                self._process_signal(signal, current_data, current_time)
-            
-            # 기존 포지션 관리
-            self._manage_positions(strategy, current_data, current_time)
-            
-            # 자본 업데이트
-            self._update_capital()
-            
-            # 자본 곡선 기록
-            self.equity_curve.append(self.current_capital)
-            self.timestamps.append(current_time)
+        # 종가는 연속 배열로 한 번만 꺼내 포지션 관리에서 스칼라로 사용
+        closes = np.ascontiguousarray(data['close'].to_numpy(), dtype=np.float64)
+        
+        # 지표 캐시 연결 (백테스트가 끝나면 해제)
+        strategy.indicator_cache = indicators
+        try:
+            # 백테스트 실행
+            for i in range(len(data)):
+                self._step(strategy, data.iloc[:i+1], data.index[i], closes[i])
+        
+        finally:
+            strategy.indicator_cache = None
         
         # 전략 중지
         strategy.stop()
@@ -134,6 +139,104 @@ class BacktestEngine:
         
         return result
     
+    def run_backtest_batch(self, 
+                           strategies: List[BaseStrategy], 
+                           data: Union[pd.DataFrame, np.ndarray],
+                           start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None,
+                           index: Optional[Union[pd.Index, np.ndarray]] = None,
+                           indicators: Optional[IndicatorCache] = None) -> List[BacktestResult]:
+        """같은 데이터로 여러 전략을 바 순회 한 번에 함께 백테스트 (결과는 strategies 순서)
+        
+        전략마다 이 엔진과 같은 설정의 엔진을 따로 두고, 바별 데이터 구간과 지표 캐시는 모든 전략이 공유
+        indicators를 주지 않으면 필터링 후 종가로 하나 만들어 사용 (이 엔진의 거래 상태는 바뀌지 않음)
+        """
+        data = self._prepare_data(data, start_date, end_date, index)
+        
+        closes = np.ascontiguousarray(data['close'].to_numpy(), dtype=np.float64)
+        
+        if indicators is None:
+            indicators = IndicatorCache(closes, data.index)
+        elif len(indicators) != len(data):
+            raise ValueError("indicators length does not match backtest data")
+        elif indicators.index is None:
+            indicators.index = data.index
+        
+        engines = [BacktestEngine(self.initial_capital, self.commission_rate, self.exchange)
+                   for _ in strategies]
+        
+        for strategy in strategies:
+            strategy.start()
+        
+        # 지표 캐시 연결 (백테스트가 끝나면 해제)
+        for strategy in strategies:
+            strategy.indicator_cache = indicators
+        try:
+            for i in range(len(data)):
+                current_data = data.iloc[:i+1]
+                current_time = data.index[i]
+                current_price = closes[i]
+                
+                for engine, strategy in zip(engines, strategies):
+                    engine._step(strategy, current_data, current_time, current_price)
+        
+        finally:
+            for strategy in strategies:
+                strategy.indicator_cache = None
+        
+        for strategy in strategies:
+            strategy.stop()
+        
+        return [engine._calculate_results() for engine in engines]
+    
+    def _prepare_data(self, 
+                      data: Union[pd.DataFrame, np.ndarray],
+                      start_date: Optional[datetime],
+                      end_date: Optional[datetime],
+                      index: Optional[Union[pd.Index, np.ndarray]]) -> pd.DataFrame:
+        """백테스트 입력을 DataFrame으로 변환하고 기간 필터링"""
+        if isinstance(data, np.ndarray):
+            if index is None:
+                raise ValueError("index is required when data is an ndarray")
+            data = pd.DataFrame(data, index=pd.DatetimeIndex(index), columns=OHLCV_COLUMNS, copy=False)
+        
+        # 데이터 필터링
+        if start_date:
+            data = data[data.index >= start_date]
+        if end_date:
+            data = data[data.index <= end_date]
+        
+        if data.empty:
+            raise ValueError("No data available for backtesting")
+        
+        return data
+    
+    def _step(self, strategy: BaseStrategy, current_data: pd.DataFrame, current_time: datetime,
+              current_price: float):
+        """바 하나 처리 - 신호 처리, 포지션 관리, 자본 기록"""
+        # 전략 분석
+        signals = strategy.analyze(current_data)
+        
+        # 신호 처리
+        for signal in signals:
+            self._process_signal(signal, current_data, current_time)
+        
+        # 기존 포지션 관리
+        self._manage_positions(strategy, current_data, current_time, current_price)
+        
+        # 자본 업데이트
+        self._update_capital()
+        
+        # 자본 곡선 기록
+        self.equity_curve.append(self.current_capital)
+        self.timestamps.append(current_time)
+    
+    def reset(self, commission_rate: Optional[float] = None):
+        """엔진을 다시 만들지 않고 거래 상태 초기화 (수수료율 변경 가능)"""
+        self._reset_backtest()
+        if commission_rate is not None:
+            self.commission_rate = commission_rate
+    
     def _reset_backtest(self):
         """백테스트 초기화"""
         self.current_capital = self.initial_capital
@@ -157,7 +260,7 @@ class BacktestEngine:
         
         # 진입 수수료 계산
         entry_commission = self.commission_calculator.calculate_commission(
-            signal.quantity, signal.price, self.exchange
+            signal.quantity, signal.price, self.exchange, rate=self.commission_rate
         )
         
         # 총 진입 비용
@@ -190,7 +293,7 @@ class BacktestEngine:
         
         # 진입 수수료 계산
         entry_commission = self.commission_calculator.calculate_commission(
-            signal.quantity, signal.price, self.exchange
+            signal.quantity, signal.price, self.exchange, rate=self.commission_rate
         )
         
         # 총 진입 비용
@@ -222,31 +325,32 @@ class BacktestEngine:
             if trade.status == TradeStatus.OPEN:
                 self._close_position(trade, signal.price, timestamp, "manual_close")
     
-    def _manage_positions(self, strategy: BaseStrategy, data: pd.DataFrame, timestamp: datetime):
+    def _manage_positions(self, strategy: BaseStrategy, data: pd.DataFrame, timestamp: datetime,
+                          current_price: Optional[float] = None):
         """포지션 관리"""
-        for trade in self.trades:
-            if trade.status != TradeStatus.OPEN:
-                continue
-            
+        if current_price is None:
+            current_price = data['close'].iloc[-1]
+        
+        open_trades = [trade for trade in self.trades if trade.status == TradeStatus.OPEN]
+        if not open_trades:
+            return
+        
+        # 손절/익절 확인 (미청산 거래 전체를 커널에서 한 번에 판정)
+        is_long = np.array([trade.side == "long" for trade in open_trades], dtype=np.bool_)
+        entry_prices = np.array([trade.entry_price for trade in open_trades], dtype=np.float64)
+        codes = exit_codes(is_long, entry_prices, float(current_price))
+        
+        for trade, code in zip(open_trades, codes):
             # 청산 조건 확인
             should_close = False
             exit_reason = ""
             
-            # 손절/익절 확인
-            if trade.side == "long":
-                if data['close'].iloc[-1] <= trade.entry_price * 0.98:  # 2% 손절
-                    should_close = True
-                    exit_reason = "stop_loss"
-                elif data['close'].iloc[-1] >= trade.entry_price * 1.04:  # 4% 익절
-                    should_close = True
-                    exit_reason = "take_profit"
-            else:  # short
-                if data['close'].iloc[-1] >= trade.entry_price * 1.02:  # 2% 손절
-                    should_close = True
-                    exit_reason = "stop_loss"
-                elif data['close'].iloc[-1] <= trade.entry_price * 0.96:  # 4% 익절
-                    should_close = True
-                    exit_reason = "take_profit"
+            if code == EXIT_STOP_LOSS:
+                should_close = True
+                exit_reason = "stop_loss"
+            elif code == EXIT_TAKE_PROFIT:
+                should_close = True
+                exit_reason = "take_profit"
             
             # 전략 기반 청산 확인
             if not should_close:
@@ -262,7 +366,7 @@ class BacktestEngine:
             
             # 포지션 청산
             if should_close:
-                self._close_position(trade, data['close'].iloc[-1], timestamp, exit_reason)
+                self._close_position(trade, current_price, timestamp, exit_reason)
     
     def _close_position(self, trade: Trade, exit_price: float, timestamp: datetime, reason: str):
         """포지션 청산"""
@@ -271,7 +375,7 @@ class BacktestEngine:
         
         # 청산 수수료 계산
         exit_commission = self.commission_calculator.calculate_commission(
-            trade.entry_amount, exit_price, self.exchange
+            trade.entry_amount, exit_price, self.exchange, rate=self.commission_rate
         )
         
         # 거래 정보 업데이트
@@ -404,28 +508,16 @@ class BacktestEngine:
         if len(self.equity_curve) < 2:
             return 0.0
         
-        peak = self.equity_curve[0]
-        max_dd = 0.0
-        
-        for value in self.equity_curve:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak
-            max_dd = max(max_dd, drawdown)
-        
-        return max_dd
+        return float(max_drawdown(np.asarray(self.equity_curve, dtype=np.float64)))
     
     def _calculate_sharpe_ratio(self) -> float:
         """샤프 비율 계산"""
         if len(self.equity_curve) < 2:
             return 0.0
         
-        returns = []
-        for i in range(1, len(self.equity_curve)):
-            ret = (self.equity_curve[i] - self.equity_curve[i-1]) / self.equity_curve[i-1]
-            returns.append(ret)
+        returns = equity_returns(np.asarray(self.equity_curve, dtype=np.float64))
         
-        if not returns:
+        if len(returns) == 0:
             return 0.0
         
         mean_return = np.mean(returns)
@@ -444,18 +536,15 @@ class BacktestEngine:
         if len(self.equity_curve) < 2:
             return 0.0
         
-        returns = []
-        for i in range(1, len(self.equity_curve)):
-            ret = (self.equity_curve[i] - self.equity_curve[i-1]) / self.equity_curve[i-1]
-            returns.append(ret)
+        returns = equity_returns(np.asarray(self.equity_curve, dtype=np.float64))
         
-        if not returns:
+        if len(returns) == 0:
             return 0.0
         
         mean_return = np.mean(returns)
-        negative_returns = [r for r in returns if r < 0]
+        negative_returns = returns[returns < 0]
         
-        if not negative_returns:
+        if len(negative_returns) == 0:
             return float('inf')
         
         downside_std = np.std(negative_returns)
@@ -0,0 +1,47 @@
+"""
+백테스트용 지표 캐시 - 전체 시계열에 대해 Numba로 한 번만 계산하고 구간별로 재사용
+
+EMA/RSI는 인과적(과거 값만 사용)이므로 전체 시계열 결과의 앞부분은
+같은 구간 데이터로 TA-Lib을 다시 호출한 결과와 동일하다.
+커널은 analysis.indicator_kernels에 있다.
+"""
+import numpy as np
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from analysis.indicator_kernels import ema_nb, rsi_nb
+
+
+class IndicatorCache:
+    """종가 시계열에 대한 지표를 (지표, 기간) 키로 한 번만 계산해 재사용"""
+    
+    def __init__(self, close: np.ndarray, index: Optional[Sequence[Any]] = None):
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.index = index  # 종가의 타임스탬프 (백테스트 엔진이 연결, 구간 앞부분 여부 확인에 사용)
+        self._values: Dict[Tuple[str, int], np.ndarray] = {}
+    
+    def __len__(self) -> int:
+        return self.close.shape[0]
+    
+    def is_prefix(self, index: Sequence[Any]) -> bool:
+        """index가 캐시 구간의 0번 바부터 시작하는 앞부분인지 (tail 등 중간 구간이면 False)
+        
+        EMA/RSI는 시작 바에 따라 값이 달라지므로 앞부분일 때만 캐시 결과를 그대로 쓸 수 있다
+        """
+        n = len(index)
+        if self.index is None or n == 0 or n > len(self):
+            return False
+        return index[0] == self.index[0] and index[n - 1] == self.index[n - 1]
+    
+    def ema(self, period: int) -> np.ndarray:
+        """전체 구간 EMA"""
+        key = ('ema', period)
+        if key not in self._values:
+            self._values[key] = ema_nb(self.close, period)
+        return self._values[key]
+    
+    def rsi(self, period: int) -> np.ndarray:
+        """전체 구간 RSI"""
+        key = ('rsi', period)
+        if key not in self._values:
+            self._values[key] = rsi_nb(self.close, period)
+        return self._values[key]
@@ -143,18 +143,22 @@ class BithumbOptimizer:
         return self.commission_rates['maker']
     
     def optimize_order_splitting(self, total_amount: float, market_depth: Dict) -> List[Dict]:
-        """주문 분할 최적화"""
+        """주문 분할 최적화
+        
+        market_depth는 'bid_prices'/'bid_volumes' 배열(호가 순) 또는 {'price', 'volume'} 딕셔너리 리스트인 'bids'
+        """
         optimal_splits = []
+        bid_prices, bid_volumes = self._bid_levels(market_depth)
         
-        # 시장 깊이 분석
-        available_volume = sum([level['volume'] for level in market_depth['bids'][:5]])
+        # 시장 깊이 분석 (상위 5호가 잔량)
+        available_volume = bid_volumes[:5].sum()
         
         if total_amount <= available_volume * 0.1:  # 시장 깊이의 10% 이하
             # 단일 지정가 주문
             optimal_splits.append({
                 'type': 'limit',
                 'amount': total_amount,
-                'price': market_depth['bids'][0]['price'] * 0.999,  # 약간 낮은 가격
+                'price': float(bid_prices[0]) * 0.999,  # 약간 낮은 가격
                 'expected_commission': total_amount * self.commission_rates['maker']
             })
         else:
@@ -167,7 +171,7 @@ class BithumbOptimizer:
             optimal_splits.append({
                 'type': 'limit',
                 'amount': first_amount,
-                'price': market_depth['bids'][0]['price'] * 0.999,
+                'price': float(bid_prices[0]) * 0.999,
                 'expected_commission': first_amount * self.commission_rates['maker']
             })
             
@@ -182,6 +186,17 @@ class BithumbOptimizer:
         
         return optimal_splits
     
+    @staticmethod
+    def _bid_levels(market_depth: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """매수 호가 가격/잔량 배열 (배열로 주어지면 그대로 사용)"""
+        if 'bid_prices' in market_depth:
+            return (np.asarray(market_depth['bid_prices'], dtype=np.float64),
+                    np.asarray(market_depth['bid_volumes'], dtype=np.float64))
+        
+        bids = market_depth['bids']
+        return (np.fromiter((level['price'] for level in bids), dtype=np.float64, count=len(bids)),
+                np.fromiter((level['volume'] for level in bids), dtype=np.float64, count=len(bids)))
+    
     def calculate_timing_optimization(self, order_data: pd.DataFrame) -> Dict:
         """거래 타이밍 최적화"""
         # 시간대별 수수료 패턴 분석
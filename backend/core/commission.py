@@ -1,7 +1,7 @@
 """
 매매 수수료 계산 시스템
 """
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -52,8 +52,9 @@ class CommissionCalculator:
                            amount: float, 
                            price: float, 
                            exchange: ExchangeType = ExchangeType.BITHUMB,
-                           is_maker: bool = False) -> float:
-        """수수료 계산"""
+                           is_maker: bool = False,
+                           rate: Optional[float] = None) -> float:
+        """수수료 계산 (rate를 지정하면 거래소 메이커/테이커 수수료율 대신 사용)"""
         if amount <= 0 or price <= 0:
             return 0.0
         
@@ -65,7 +66,8 @@ class CommissionCalculator:
         if not commission_rate:
             return 0.0
         
-        rate = commission_rate.maker_rate if is_maker else commission_rate.taker_rate
+        if rate is None:
+            rate = commission_rate.maker_rate if is_maker else commission_rate.taker_rate
         
         # 수수료 계산
         commission = trade_value * rate
@@ -76,6 +78,28 @@ class CommissionCalculator:
         
         return commission
     
+    def commission_function(self,
+                            exchange: ExchangeType = ExchangeType.BITHUMB,
+                            is_maker: bool = False) -> Callable[[float, float], float]:
+        """거래소/메이커 여부를 고정한 수수료 함수 (수수료율을 미리 찾아 두어 주문마다 조회하지 않음)
+        
+        반환 함수는 calculate_commission(amount, price, exchange, is_maker)와 같은 값을 낸다
+        """
+        commission_rate = self.commission_rates.get(exchange)
+        if not commission_rate:
+            return lambda amount, price: 0.0
+        
+        rate = commission_rate.maker_rate if is_maker else commission_rate.taker_rate
+        min_commission = commission_rate.min_commission
+        max_commission = commission_rate.max_commission
+        
+        def commission(amount: float, price: float) -> float:
+            if amount <= 0 or price <= 0:
+                return 0.0
+            return min(max(amount * price * rate, min_commission), max_commission)
+        
+        return commission
+    
     def calculate_net_profit(self, 
                           entry_amount: float,
                           entry_price: float,
@@ -15,6 +15,7 @@ from concurrent.futures import ThreadPoolExecutor
 import time
 import sys
 import os
+from collections import deque
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from services.bithumb_client import BithumbClient
 from core.database import get_timescale_db
@@ -60,15 +61,38 @@ class SocialSentiment:
     source: str  # 'twitter', 'reddit', 'telegram'
 
 
+class BatchedCallback:
+    """구독 데이터를 batch_size개씩 모아 리스트로 한 번에 전달하는 콜백 래퍼"""
+    
+    def __init__(self, callback: Callable, batch_size: int):
+        self.callback = callback
+        self.batch_size = batch_size
+        self.batch: List[Any] = []
+    
+    async def __call__(self, data: Any):
+        self.batch.append(data)
+        if len(self.batch) >= self.batch_size:
+            await self.flush()
+    
+    async def flush(self):
+        """모인 데이터가 있으면 바로 전달"""
+        if self.batch:
+            batch, self.batch = self.batch, []
+            await self.callback(batch)
+
+
 class RealtimeDataCollector:
     """실시간 데이터 수집기"""
     
+    MAX_BUFFER_SIZE = 100  # 심볼별로 유지하는 최근 시장 데이터 수
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.websocket_connections = {}
-        self.data_buffer = {}
+        self.data_buffer: Dict[str, deque] = {}
         self.subscribers = {}
         self.running = False
+        self._data_event = asyncio.Event()  # 시장 데이터가 버퍼에 추가될 때마다 설정
         # 환경 변수에서 API 키 로드
         api_key = os.getenv('BITHUMB_API_KEY')
         secret_key = os.getenv('BITHUMB_SECRET_KEY')
@@ -238,15 +262,12 @@ class RealtimeDataCollector:
         """시장 데이터 처리"""
         symbol = data['symbol']
         
-        # 데이터 버퍼에 저장
+        # 데이터 버퍼에 저장 (deque가 최근 MAX_BUFFER_SIZE개만 유지)
         if symbol not in self.data_buffer:
-            self.data_buffer[symbol] = []
+            self.data_buffer[symbol] = deque(maxlen=self.MAX_BUFFER_SIZE)
         
         self.data_buffer[symbol].append(data)
-        
-        # 최근 100개 데이터만 유지
-        if len(self.data_buffer[symbol]) > 100:
-            self.data_buffer[symbol] = self.data_buffer[symbol][-100:]
+        self._data_event.set()
         
         # 데이터베이스에 저장
         await self._save_to_database(data)
@@ -448,19 +469,21 @@ class RealtimeDataCollector:
                 except Exception as e:
                     self.logger.error(f"소셜 센티먼트 콜백 오류: {e}")
     
-    def subscribe(self, symbol: str, callback: Callable):
-        """데이터 구독"""
+    def subscribe(self, symbol: str, callback: Callable, batch_size: int = 1):
+        """데이터 구독 (batch_size > 1이면 데이터를 batch_size개씩 리스트로 전달, 남은 데이터는 수집 중지 시 전달)"""
         if symbol not in self.subscribers:
             self.subscribers[symbol] = []
+        if batch_size > 1:
+            callback = BatchedCallback(callback, batch_size)
         self.subscribers[symbol].append(callback)
     
     def unsubscribe(self, symbol: str, callback: Callable):
         """데이터 구독 해제"""
         if symbol in self.subscribers:
-            try:
-                self.subscribers[symbol].remove(callback)
-            except ValueError:
-                pass
+            self.subscribers[symbol] = [
+                subscriber for subscriber in self.subscribers[symbol]
+                if subscriber is not callback and getattr(subscriber, 'callback', None) is not callback
+            ]
     
     def get_latest_data(self, symbol: str, data_type: str = 'market') -> Optional[Any]:
         """최신 데이터 조회"""
@@ -496,6 +519,12 @@ class RealtimeDataCollector:
             self.logger.error(f"빗썸 잔고 조회 실패: {e}")
             return None
     
+    async def wait_for_data(self, symbols: List[str], count: int = 1):
+        """심볼마다 시장 데이터가 count개 이상 버퍼에 쌓일 때까지 대기 (타임아웃은 asyncio.wait_for로 지정)"""
+        while any(len(self.data_buffer.get(symbol, ())) < count for symbol in symbols):
+            self._data_event.clear()
+            await self._data_event.wait()
+    
     def get_historical_data(self, symbol: str, hours: int = 24) -> List[Dict]:
         """과거 데이터 조회"""
         if symbol not in self.data_buffer:
@@ -509,6 +538,15 @@ class RealtimeDataCollector:
         """데이터 수집 중지"""
         self.running = False
         
+        # 배치 구독자에게 남은 데이터 전달
+        for subscribers in self.subscribers.values():
+            for subscriber in subscribers:
+                if isinstance(subscriber, BatchedCallback):
+                    try:
+                        await subscriber.flush()
+                    except Exception as e:
+                        self.logger.error(f"구독자 콜백 오류: {e}")
+        
         # 웹소켓 연결 종료
         for ws in self.websocket_connections.values():
             await ws.close()
@@ -3,7 +3,7 @@
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -70,6 +70,17 @@ class RebalancingSignal:
     urgency: str  # 'low', 'medium', 'high'
 
 
+def _sample_std(values: np.ndarray) -> Any:
+    """NaN을 제외한 (열별) 표본 표준편차 - pandas std와 같이 ddof=1, 값이 2개 미만이면 NaN (pandas와 결과가 부동소수점 반올림 오차 범위에서 같음)"""
+    if np.min(np.count_nonzero(~np.isnan(values), axis=0), initial=2) >= 2:
+        return np.nanstd(values, axis=0, ddof=1)
+    
+    # 값이 2개 미만인 열은 pandas처럼 경고 없이 NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanstd(values, axis=0, ddof=1)
+
+
 class PortfolioManager:
     """포트폴리오 관리자"""
     
@@ -107,15 +118,28 @@ class PortfolioManager:
             expected_return=0.0
         )
     
+    def add_assets(self, symbols: List[str], names: List[str], target_weights: List[float]) -> None:
+        """여러 자산 한 번에 추가 (가격은 update_asset_prices로 설정)"""
+        if not len(symbols) == len(names) == len(target_weights):
+            raise ValueError("symbols, names, target_weights의 길이가 같아야 합니다")
+        
+        for symbol, name, target_weight in zip(symbols, names, target_weights):
+            self.add_asset(symbol, name, target_weight)
+    
     def update_asset_prices(self, price_data: Dict[str, float]) -> None:
         """자산 가격 업데이트"""
         for symbol, price in price_data.items():
             if symbol in self.assets:
                 self.assets[symbol].current_price = price
     
-    def calculate_portfolio_metrics(self, returns_data: pd.DataFrame) -> PortfolioMetrics:
-        """포트폴리오 지표 계산"""
-        if returns_data.empty:
+    def calculate_portfolio_metrics(self, returns_data: Union[pd.DataFrame, np.ndarray]) -> PortfolioMetrics:
+        """포트폴리오 지표 계산
+        
+        returns_data는 DataFrame 또는 자산 순서 열의 (n, 자산 수) ndarray (NaN은 pandas처럼 건너뜀)
+        """
+        returns = np.asarray(returns_data, dtype=np.float64)
+        
+        if returns.size == 0:
             return PortfolioMetrics(
                 total_value=self.current_capital,
                 total_return=0.0,
@@ -132,12 +156,12 @@ class PortfolioManager:
         
         # 포트폴리오 수익률 계산
         weights = np.array([asset.weight for asset in self.assets.values()])
-        portfolio_returns = (returns_data * weights).sum(axis=1)
+        portfolio_returns = np.nansum(returns * weights, axis=1)
         
         # 기본 지표
-        total_return = (1 + portfolio_returns).prod() - 1
+        total_return = np.prod(1 + portfolio_returns) - 1
         annualized_return = (1 + total_return) ** (252 / len(portfolio_returns)) - 1
-        volatility = portfolio_returns.std() * np.sqrt(252)
+        volatility = _sample_std(portfolio_returns) * np.sqrt(252)
         
         # 샤프 비율
         risk_free_rate = 0.02  # 2% 무위험 수익률
@@ -145,12 +169,12 @@ class PortfolioManager:
         
         # 소르티노 비율
         downside_returns = portfolio_returns[portfolio_returns < 0]
-        downside_volatility = downside_returns.std() * np.sqrt(252) if len(downside_returns) > 0 else 0
+        downside_volatility = _sample_std(downside_returns) * np.sqrt(252) if len(downside_returns) > 0 else 0
         sortino_ratio = (annualized_return - risk_free_rate) / downside_volatility if downside_volatility > 0 else 0
         
         # 최대 낙폭
-        cumulative_returns = (1 + portfolio_returns).cumprod()
-        running_max = cumulative_returns.expanding().max()
+        cumulative_returns = np.cumprod(1 + portfolio_returns)
+        running_max = np.maximum.accumulate(cumulative_returns)
         drawdown = (cumulative_returns - running_max) / running_max
         max_drawdown = drawdown.min()
         
@@ -159,7 +183,7 @@ class PortfolioManager:
         cvar_95 = portfolio_returns[portfolio_returns <= var_95].mean()
         
         # 다양화 비율
-        diversification_ratio = self._calculate_diversification_ratio(returns_data, weights)
+        diversification_ratio = self._calculate_diversification_ratio(returns, weights, portfolio_returns)
         
         # 집중도 리스크
         concentration_risk = self._calculate_concentration_risk(weights)
@@ -178,18 +202,18 @@ class PortfolioManager:
             concentration_risk=concentration_risk
         )
     
-    def _calculate_diversification_ratio(self, returns_data: pd.DataFrame, weights: np.ndarray) -> float:
+    def _calculate_diversification_ratio(self, returns: np.ndarray, weights: np.ndarray,
+                                         portfolio_returns: np.ndarray) -> float:
         """다양화 비율 계산"""
-        if returns_data.empty:
+        if returns.size == 0:
             return 0.0
         
         # 개별 자산의 가중 평균 변동성
-        individual_volatilities = returns_data.std() * np.sqrt(252)
+        individual_volatilities = _sample_std(returns) * np.sqrt(252)
         weighted_avg_volatility = np.sum(weights * individual_volatilities)
         
         # 포트폴리오 변동성
-        portfolio_returns = (returns_data * weights).sum(axis=1)
-        portfolio_volatility = portfolio_returns.std() * np.sqrt(252)
+        portfolio_volatility = _sample_std(portfolio_returns) * np.sqrt(252)
         
         return weighted_avg_volatility / portfolio_volatility if portfolio_volatility > 0 else 0
     
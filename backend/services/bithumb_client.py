@@ -210,14 +210,25 @@ class BithumbClient:
     
     # WebSocket 연결 관리 (빗썸 WebSocket API 사용)
     async def connect_websocket(self, symbols: List[str], callback):
-        """WebSocket 연결 및 실시간 데이터 수신"""
+        """WebSocket 연결 및 실시간 데이터 수신
+        
+        ping_interval/ping_timeout으로 응답 없는 연결을 감지해 반환하므로
+        호출 측에서 재연결하면 된다 (PING/PONG 응답은 websockets가 처리)
+        """
         try:
             # 빗썸 WebSocket URL 구성
             ws_url = f"{self.ws_url}?symbols={','.join(symbols)}"
             
-            async with websockets.connect(ws_url) as websocket:
+            async with websockets.connect(ws_url, ping_interval=20, ping_timeout=20) as websocket:
                 print(f"WebSocket 연결 성공: {ws_url}")
                 
+                # 티커 구독 요청 (24H 기준 누적 거래량)
+                await websocket.send(json.dumps({
+                    "type": "ticker",
+                    "symbols": symbols,
+                    "tickTypes": ["24H"]
+                }))
+                
                 # 메시지 수신 루프
                 async for message in websocket:
                     try:
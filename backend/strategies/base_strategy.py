@@ -8,6 +8,8 @@ from datetime import datetime
 import pandas as pd
 from enum import Enum
 
+from analysis.technical_indicators import technical_analyzer
+
 
 class StrategyType(Enum):
     """전략 타입"""
@@ -62,6 +64,19 @@ class BaseStrategy(ABC):
         self.positions = []
         self.trade_history = []
         self.performance_metrics = {}
+        self.indicator_cache: Optional[Any] = None  # 백테스트 중 엔진이 연결하는 IndicatorCache
+    
+    def calculate_ema(self, close: pd.Series, period: int) -> pd.Series:
+        """EMA 계산 (close가 지표 캐시 구간의 앞부분이면 전체 구간 계산 결과 사용, tail 등은 TA-Lib)"""
+        if self.indicator_cache is not None and self.indicator_cache.is_prefix(close.index):
+            return pd.Series(self.indicator_cache.ema(period)[:len(close)], index=close.index)
+        return technical_analyzer.calculate_ema_talib(close, period)
+    
+    def calculate_rsi(self, close: pd.Series, period: int = 14) -> pd.Series:
+        """RSI 계산 (close가 지표 캐시 구간의 앞부분이면 전체 구간 계산 결과 사용, tail 등은 TA-Lib)"""
+        if self.indicator_cache is not None and self.indicator_cache.is_prefix(close.index):
+            return pd.Series(self.indicator_cache.rsi(period)[:len(close)], index=close.index)
+        return technical_analyzer.calculate_rsi(close, period)
     
     @abstractmethod
     def analyze(self, data: pd.DataFrame) -> List[TradingSignal]:
@@ -143,9 +143,9 @@ class LowFrequencyStrategy(CommissionOptimizedStrategy):
         from analysis.technical_indicators import TechnicalAnalyzer
         ti = TechnicalAnalyzer()
         
-        ema_short = ti.calculate_ema_talib(close, self.ema_short)
-        ema_long = ti.calculate_ema_talib(close, self.ema_long)
-        rsi = ti.calculate_rsi(close, self.rsi_period)
+        ema_short = self.calculate_ema(close, self.ema_short)
+        ema_long = self.calculate_ema(close, self.ema_long)
+        rsi = self.calculate_rsi(close, self.rsi_period)
         
         # 변동성 계산
         returns = close.pct_change()
@@ -338,7 +338,7 @@ class MeanReversionStrategy(CommissionOptimizedStrategy):
         ti = TechnicalAnalyzer()
         
         bollinger = ti.calculate_bollinger_bands(close, self.bollinger_period, self.bollinger_std)
-        rsi = ti.calculate_rsi(close, self.rsi_period)
+        rsi = self.calculate_rsi(close, self.rsi_period)
         
         # 현재 값들
         current_price = close.iloc[-1]
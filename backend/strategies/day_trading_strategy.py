@@ -115,11 +115,11 @@ class DayTradingStrategy(BaseStrategy):
         volume = data['volume']
         
         # EMA 계산
-        ema_short = technical_analyzer.calculate_ema_talib(close, self.ema_short)
-        ema_long = technical_analyzer.calculate_ema_talib(close, self.ema_long)
+        ema_short = self.calculate_ema(close, self.ema_short)
+        ema_long = self.calculate_ema(close, self.ema_long)
         
         # RSI 계산
-        rsi = technical_analyzer.calculate_rsi(close, self.rsi_period)
+        rsi = self.calculate_rsi(close, self.rsi_period)
         
         # 볼린저 밴드 계산
         bb_data = technical_analyzer.calculate_bollinger_bands(close, self.bb_period, self.bb_std)
@@ -297,8 +297,8 @@ class DayTradingStrategy(BaseStrategy):
         
         # 3. 트렌드 반전 시 청산
         if len(data) >= 10:
-            ema_short = technical_analyzer.calculate_ema_talib(data['close'], self.ema_short)
-            ema_long = technical_analyzer.calculate_ema_talib(data['close'], self.ema_long)
+            ema_short = self.calculate_ema(data['close'], self.ema_short)
+            ema_long = self.calculate_ema(data['close'], self.ema_long)
             
             if not pd.isna(ema_short.iloc[-1]) and not pd.isna(ema_long.iloc[-1]):
                 if position.get('side') == 'long' and ema_short.iloc[-1] < ema_long.iloc[-1]:
@@ -32,8 +32,8 @@ class LongTermStrategy(BaseStrategy):
         current_price = close.iloc[-1]
         
         # 장기 이동평균선 계산
-        ema_long = technical_analyzer.calculate_ema_talib(close, self.ema_long)
-        ema_trend = technical_analyzer.calculate_ema_talib(close, self.ema_trend)
+        ema_long = self.calculate_ema(close, self.ema_long)
+        ema_trend = self.calculate_ema(close, self.ema_trend)
         
         # 현재 할당률 계산
         current_allocation = (current_balance * self.target_allocation) / current_price
@@ -111,11 +111,11 @@ class LongTermStrategy(BaseStrategy):
         current_price = close.iloc[-1]
         
         # 장기 이동평균선 계산
-        ema_long = technical_analyzer.calculate_ema_talib(close, self.ema_long)
-        ema_trend = technical_analyzer.calculate_ema_talib(close, self.ema_trend)
+        ema_long = self.calculate_ema(close, self.ema_long)
+        ema_trend = self.calculate_ema(close, self.ema_trend)
         
         # RSI 계산 (장기)
-        rsi = technical_analyzer.calculate_rsi(close, 14)
+        rsi = self.calculate_rsi(close, 14)
         
         # 변동성 계산
         returns = close.pct_change().dropna()
@@ -247,8 +247,8 @@ class LongTermStrategy(BaseStrategy):
         
         # 2. 장기 트렌드 반전 시 청산
         if len(data) >= 50:
-            ema_long = technical_analyzer.calculate_ema_talib(data['close'], self.ema_long)
-            ema_trend = technical_analyzer.calculate_ema_talib(data['close'], self.ema_trend)
+            ema_long = self.calculate_ema(data['close'], self.ema_long)
+            ema_trend = self.calculate_ema(data['close'], self.ema_trend)
             
             if not pd.isna(ema_long.iloc[-1]) and not pd.isna(ema_trend.iloc[-1]):
                 if position.get('side') == 'long' and ema_long.iloc[-1] < ema_trend.iloc[-1]:
@@ -37,11 +37,11 @@ class ScalpingStrategy(BaseStrategy):
         volume = data['volume']
         
         # EMA 계산
-        ema_short = technical_analyzer.calculate_ema_talib(close, self.ema_short)
-        ema_long = technical_analyzer.calculate_ema_talib(close, self.ema_long)
+        ema_short = self.calculate_ema(close, self.ema_short)
+        ema_long = self.calculate_ema(close, self.ema_long)
         
         # RSI 계산
-        rsi = technical_analyzer.calculate_rsi(close, self.rsi_period)
+        rsi = self.calculate_rsi(close, self.rsi_period)
         
         # 볼린저 밴드 계산
         bb_data = technical_analyzer.calculate_bollinger_bands(close, 20, 2.0)
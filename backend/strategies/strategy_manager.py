@@ -1,7 +1,8 @@
 """
 전략 매니저 - 여러 전략을 관리하고 실행
 """
-from typing import Dict, List, Optional, Any
+import contextlib
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime, timedelta
 import pandas as pd
 from dataclasses import dataclass
@@ -213,6 +214,16 @@ class StrategyManager:
         
         return True
     
+    @contextlib.contextmanager
+    def scoped_strategy(self, name: str, strategy_type: StrategyType,
+                        config: StrategyConfig) -> Iterator[str]:
+        """블록 안에서만 유지되는 전략 생성 (블록을 벗어나면 삭제)"""
+        strategy_id = self.create_strategy(name, strategy_type, config)
+        try:
+            yield strategy_id
+        finally:
+            self.delete_strategy(strategy_id)
+    
     def execute_strategies(self, data: pd.DataFrame) -> Dict[str, List[TradingSignal]]:
         """모든 활성 전략 실행"""
         results = {}
@@ -38,9 +38,9 @@ class SwingTradingStrategy(BaseStrategy):
         volatility = (high.max() - low.min()) / close.mean()
         
         # 이동평균선 기반 트렌드
-        ema_short = technical_analyzer.calculate_ema_talib(close, self.ema_short)
-        ema_long = technical_analyzer.calculate_ema_talib(close, self.ema_long)
-        ema_trend = technical_analyzer.calculate_ema_talib(close, self.ema_trend)
+        ema_short = self.calculate_ema(close, self.ema_short)
+        ema_long = self.calculate_ema(close, self.ema_long)
+        ema_trend = self.calculate_ema(close, self.ema_trend)
         
         trend_signals = 0
         total_signals = 0
@@ -151,12 +151,12 @@ class SwingTradingStrategy(BaseStrategy):
         # EMA 계산
         from analysis.technical_indicators import TechnicalAnalyzer
         ti = TechnicalAnalyzer()
-        ema_short = ti.calculate_ema_talib(close, self.ema_short)
-        ema_long = ti.calculate_ema_talib(close, self.ema_long)
-        ema_trend = ti.calculate_ema_talib(close, self.ema_trend)
+        ema_short = self.calculate_ema(close, self.ema_short)
+        ema_long = self.calculate_ema(close, self.ema_long)
+        ema_trend = self.calculate_ema(close, self.ema_trend)
         
         # RSI 계산
-        rsi = ti.calculate_rsi(close, self.rsi_period)
+        rsi = self.calculate_rsi(close, self.rsi_period)
         
         # 볼륨 분석
         volume_ma = volume.rolling(self.volume_ma_period).mean()
@@ -2,6 +2,7 @@
 실시간 모니터링 대시보드 테스트
 """
 import asyncio
+import io
 import websockets
 import json
 import traceback
@@ -21,41 +22,46 @@ async def test_websocket_connection():
             
             # 10초간 실시간 데이터 수신
             print("📡 실시간 데이터 수신 중... (10초)")
+            # 프레임별 출력은 버퍼에 모았다가 수신 종료 후 한 번에 기록
+            buf = io.StringIO()
             for i in range(10):
                 try:
                     # 메시지 수신 (타임아웃 2초)
                     message = await asyncio.wait_for(websocket.recv(), timeout=2.0)
                     data = json.loads(message)
                     
-                    print(f"📊 데이터 수신 ({i+1}/10):")
-                    print(f"   타입: {data.get('type', 'unknown')}")
-                    print(f"   타임스탬프: {data.get('timestamp', 'unknown')}")
+                    print(f"📊 데이터 수신 ({i+1}/10):", file=buf)
+                    print(f"   타입: {data.get('type', 'unknown')}", file=buf)
+                    print(f"   타임스탬프: {data.get('timestamp', 'unknown')}", file=buf)
                     
                     if 'dashboard' in data:
                         dashboard = data['dashboard']
-                        print(f"   💰 총 잔고: {dashboard.get('total_balance', 0):,.0f}원")
-                        print(f"   📈 총 수익률: {dashboard.get('total_return', 0):.2f}%")
-                        print(f"   📊 일일 PnL: {dashboard.get('daily_pnl', 0):,.0f}원")
-                        print(f"   🎯 활성 전략: {dashboard.get('active_strategies', 0)}개")
-                        print(f"   📍 오픈 포지션: {dashboard.get('open_positions', 0)}개")
-                        print(f"   🔄 총 거래: {dashboard.get('total_trades', 0)}회")
-                        print(f"   🏆 승률: {dashboard.get('win_rate', 0):.1f}%")
-                        print(f"   📊 샤프 비율: {dashboard.get('sharpe_ratio', 0):.2f}")
-                        print(f"   📉 최대 낙폭: {dashboard.get('max_drawdown', 0):.2f}%")
+                        print(f"   💰 총 잔고: {dashboard.get('total_balance', 0):,.0f}원", file=buf)
+                        print(f"   📈 총 수익률: {dashboard.get('total_return', 0):.2f}%", file=buf)
+                        print(f"   📊 일일 PnL: {dashboard.get('daily_pnl', 0):,.0f}원", file=buf)
+                        print(f"   🎯 활성 전략: {dashboard.get('active_strategies', 0)}개", file=buf)
+                        print(f"   📍 오픈 포지션: {dashboard.get('open_positions', 0)}개", file=buf)
+                        print(f"   🔄 총 거래: {dashboard.get('total_trades', 0)}회", file=buf)
+                        print(f"   🏆 승률: {dashboard.get('win_rate', 0):.1f}%", file=buf)
+                        print(f"   📊 샤프 비율: {dashboard.get('sharpe_ratio', 0):.2f}", file=buf)
+                        print(f"   📉 최대 낙폭: {dashboard.get('max_drawdown', 0):.2f}%", file=buf)
                     
                     if 'performance' in data:
                         performance = data['performance']
-                        print(f"   📈 연환산 수익률: {performance.get('annualized_return', 0):.2f}%")
-                        print(f"   📊 변동성: {performance.get('volatility', 0):.2f}")
-                        print(f"   🎯 수익 팩터: {performance.get('profit_factor', 0):.2f}")
-                        print(f"   💸 수수료 영향: {performance.get('commission_impact', 0):.2f}%")
+                        print(f"   📈 연환산 수익률: {performance.get('annualized_return', 0):.2f}%", file=buf)
+                        print(f"   📊 변동성: {performance.get('volatility', 0):.2f}", file=buf)
+                        print(f"   🎯 수익 팩터: {performance.get('profit_factor', 0):.2f}", file=buf)
+                        print(f"   💸 수수료 영향: {performance.get('commission_impact', 0):.2f}%", file=buf)
                     
-                    print("   " + "="*50)
+                    print("   " + "="*50, file=buf)
                     
                 except asyncio.TimeoutError:
-                    print(f"   ⏰ 타임아웃 ({i+1}/10)")
+                    print(f"   ⏰ 타임아웃 ({i+1}/10)", file=buf)
                 except Exception as e:
-                    print(f"   ❌ 데이터 수신 오류: {e}")
+                    print(f"   ❌ 데이터 수신 오류: {e}", file=buf)
+            
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
             
             print("✅ WebSocket 테스트 완료")
             
@@ -55,9 +55,13 @@ async def test_realtime_simple():
         await engine.start(symbols=['BTC', 'ETH'])
         print('✅ 거래 엔진 시작')
         
-        # 5. 잠시 실행 후 상태 확인
-        print('5. 3초 대기 중...')
-        await asyncio.sleep(3)
+        # 5. 첫 시장 데이터 수신까지 대기 (최대 3초)
+        print('5. 첫 시장 데이터 대기 중 (최대 3초)...')
+        try:
+            await asyncio.wait_for(engine.first_tick_event.wait(), timeout=3.0)
+            print('✅ 첫 시장 데이터 수신')
+        except asyncio.TimeoutError:
+            print('⚠️ 3초 내 시장 데이터 미수신 (네트워크 없음)')
         
         portfolio_after = engine.get_portfolio_summary()
         print(f'✅ 실행 후 포트폴리오 상태: {portfolio_after}')
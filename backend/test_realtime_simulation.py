@@ -3,10 +3,11 @@
 빗썸 API 1.0을 활용한 실시간 거래 시스템 시뮬레이션 테스트
 """
 import asyncio
+import importlib.util
 import os
+import pandas as pd
 from dotenv import load_dotenv
 from trading.realtime_engine import RealtimeTradingEngine, TradingMode
-from strategies.strategy_manager import StrategyManager
 from strategies.commission_optimized_strategy import LowFrequencyStrategy, BreakoutStrategy
 from strategies.base_strategy import StrategyConfig, StrategyType
 from data.realtime_collector import RealtimeDataCollector
@@ -15,6 +16,16 @@ from core.commission import ExchangeType
 # 환경 변수 로드
 load_dotenv('../.env')
 
+async def load_recent_candles(engine: RealtimeTradingEngine, symbol: str, interval: str = '1m') -> int:
+    """빗썸 공개 API의 최근 캔들을 고속 시뮬레이션 재생 데이터로 등록 (캔들 수 반환)"""
+    response = await engine.data_collector.bithumb_client.get_candlestick(f"{symbol}_KRW", interval)
+    
+    # 빗썸 캔들 형식: [timestamp, open, close, high, low, volume]
+    candles = pd.DataFrame(response['data'], columns=['timestamp', 'open', 'close', 'high', 'low', 'volume'])
+    candles.index = pd.to_datetime(candles.pop('timestamp').astype('int64'), unit='ms')
+    engine.load_replay(symbol, candles.astype(float))
+    return len(candles)
+
 async def test_realtime_simulation():
     """실시간 거래 시뮬레이션 테스트"""
     print("=== 실시간 거래 시뮬레이션 테스트 ===")
@@ -35,18 +46,18 @@ async def test_realtime_simulation():
         return
     
     try:
-        # 실시간 거래 엔진 생성 (시뮬레이션 모드)
+        # 실시간 거래 엔진 생성 (가상 시계 기반 고속 시뮬레이션 모드)
         print("🔧 실시간 거래 엔진 생성 중...")
         trading_engine = RealtimeTradingEngine(
-            mode=TradingMode.SIMULATION,  # 시뮬레이션 모드
+            mode=TradingMode.FAST_SIMULATION,  # 고속 시뮬레이션 모드
             initial_capital=1000000,  # 100만원
             commission_rate=0.0015  # 빗썸 수수료율
         )
         print("✅ 실시간 거래 엔진 생성 완료")
         
-        # 전략 매니저 설정
+        # 전략 매니저 설정 (엔진이 실행하는 매니저에 전략을 등록)
         print("🔧 전략 매니저 설정 중...")
-        strategy_manager = StrategyManager()
+        strategy_manager = trading_engine.strategy_manager
         print("✅ 전략 매니저 설정 완료")
     except Exception as e:
         print(f"❌ 엔진/매니저 생성 중 에러: {e}")
@@ -105,15 +116,30 @@ async def test_realtime_simulation():
     try:
         print(f"✅ 활성화된 전략 수: {len([s for s in strategy_manager.strategies.values() if s.status.value == 'active'])}")
         
+        # 최근 1분봉을 가상 시계에 맞춰 재생
+        print("🔧 재생용 캔들 로드 중...")
+        candle_count = await load_recent_candles(trading_engine, "BTC", '1m')
+        print(f"✅ BTC 1분봉 {candle_count}개 로드 완료 (시작: {trading_engine.virtual_time})")
+        
         # 실시간 거래 엔진 시작
         print("\n🚀 실시간 거래 엔진 시작...")
         await trading_engine.start(["BTC"], [low_freq_strategy_id, breakout_strategy_id])
         print("✅ 실시간 거래 엔진 시작 완료")
         
-        # 30초간 시뮬레이션 실행
-        print("⏱️ 30초간 시뮬레이션 실행 중...")
-        await asyncio.sleep(30)
-        print("✅ 시뮬레이션 실행 완료")
+        # 실제 대기 없이 1분봉 간격으로 틱을 돌리다가 거래 5건, 1000틱 또는 캔들 소진 시 바로 종료 (최대 30초)
+        print("⏱️ 시뮬레이션 실행 중...")
+        ticker = asyncio.create_task(trading_engine.run_ticks(1000, tick_interval=60))
+        try:
+            await asyncio.wait_for(
+                trading_engine.until(lambda e: not e.is_running or e.replay_finished
+                                     or e.total_trades_count >= 5 or e.ticks_processed >= 1000),
+                timeout=30
+            )
+        except asyncio.TimeoutError:
+            print("⚠️ 30초 안에 종료 조건에 도달하지 못했습니다.")
+        finally:
+            ticker.cancel()
+        print(f"✅ 시뮬레이션 실행 완료 ({trading_engine.ticks_processed}틱)")
         
         # 포트폴리오 상태 확인
         print("🔧 포트폴리오 상태 확인 중...")
@@ -178,33 +204,44 @@ async def test_api_endpoints():
         
         base_url = "http://localhost:8000"
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        # h2 패키지가 설치되어 있으면 HTTP/2로 연결 하나에서 요청을 다중화
+        http2 = importlib.util.find_spec("h2") is not None
+        
+        async with httpx.AsyncClient(timeout=10.0, http2=http2, base_url=base_url) as client:
+            # 세 엔드포인트는 서로 독립적이므로 동시에 요청하고 결과는 순서대로 확인
+            health, status, dashboard = await asyncio.gather(
+                client.get("/health"),
+                client.get("/api/v1/realtime/status"),
+                client.get("/api/v1/monitoring/dashboard"),
+                return_exceptions=True
+            )
+            
             # 서버 상태 확인
             print("1. 서버 상태 확인...")
-            try:
-                response = await client.get(f"{base_url}/health")
-                print(f"   상태: {response.status_code}")
-            except Exception as e:
-                print(f"   ❌ 서버 연결 실패: {e}")
+            if isinstance(health, Exception):
+                print(f"   ❌ 서버 연결 실패: {health}")
                 return
+            print(f"   상태: {health.status_code}")
             
             # 실시간 거래 상태 확인
             print("2. 실시간 거래 상태 확인...")
             try:
-                response = await client.get(f"{base_url}/api/v1/realtime/status")
-                print(f"   상태: {response.status_code}")
-                if response.status_code == 200:
-                    print(f"   응답: {response.json()}")
+                if isinstance(status, Exception):
+                    raise status
+                print(f"   상태: {status.status_code}")
+                if status.status_code == 200:
+                    print(f"   응답: {status.json()}")
             except Exception as e:
                 print(f"   ❌ 실시간 거래 상태 확인 실패: {e}")
             
             # 포트폴리오 대시보드
             print("3. 포트폴리오 대시보드...")
             try:
-                response = await client.get(f"{base_url}/api/v1/monitoring/dashboard")
-                print(f"   상태: {response.status_code}")
-                if response.status_code == 200:
-                    data = response.json()
+                if isinstance(dashboard, Exception):
+                    raise dashboard
+                print(f"   상태: {dashboard.status_code}")
+                if dashboard.status_code == 200:
+                    data = dashboard.json()
                     print(f"   총 자산: {data.get('total_value', 0):,.0f}원")
                     print(f"   오픈 포지션: {data.get('open_positions_count', 0)}개")
             except Exception as e:
@@ -214,8 +251,10 @@ async def test_api_endpoints():
         print(f"❌ API 테스트 에러: {e}")
         print("💡 서버가 실행되지 않았을 수 있습니다. 'python main.py'로 서버를 시작하세요.")
 
+async def run_all_tests():
+    """시뮬레이션 테스트와 API 테스트를 하나의 이벤트 루프에서 동시에 실행 (서로 공유하는 상태 없음)"""
+    await asyncio.gather(test_realtime_simulation(), test_api_endpoints())
+
 if __name__ == "__main__":
     print("빗썸 API 1.0 실시간 거래 시뮬레이션 테스트 시작...")
-    asyncio.run(test_realtime_simulation())
-    print("\n" + "="*50)
-    asyncio.run(test_api_endpoints())
+    asyncio.run(run_all_tests())
@@ -1,11 +1,14 @@
 """
 간단한 API 테스트 서버
 """
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
-app = FastAPI(title="AutoTrade Test API", version="1.0.0")
+app = FastAPI(title="AutoTrade Test API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS 설정
 app.add_middleware(
@@ -65,6 +68,15 @@ async def get_dashboard():
     }
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools 사용, 다중 워커는 import 문자열로만 지정 가능
+    uvicorn.run(
+        "test_simple_api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=max(1, (os.cpu_count() or 2) // 2),
+        log_level="warning"
+    )
 
 
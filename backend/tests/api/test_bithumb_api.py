@@ -4,14 +4,15 @@
 """
 import asyncio
 import os
+from typing import Optional
 from dotenv import load_dotenv
 from services.bithumb_client import BithumbClient, BithumbAPIError
 
 # 환경 변수 로드
 load_dotenv('../.env')
 
-async def test_bithumb_api():
-    """빗썸 API 연동 테스트"""
+async def test_bithumb_api(client: Optional[BithumbClient] = None):
+    """빗썸 API 연동 테스트 (client를 주입하면 연결을 재사용하고 닫지 않음)"""
     print("=== 빗썸 API 1.0 연동 테스트 ===")
     
     # API 키 확인
@@ -25,32 +26,31 @@ async def test_bithumb_api():
         print("❌ API 키가 설정되지 않았습니다.")
         return
     
-    # 빗썸 클라이언트 생성
-    client = BithumbClient(api_key, secret_key)
+    # 빗썸 클라이언트 생성 (주입되지 않은 경우에만)
+    owns_client = client is None
+    if owns_client:
+        client = BithumbClient(api_key, secret_key)
     
     try:
-        print("\n1. 공개 API 테스트 (현재가 정보)")
-        ticker = await client.get_ticker("BTC")
+        # 서로 독립적인 요청은 그룹별로 동시에 실행
+        print("\n1-3. 공개 API 테스트 (현재가, 호가, 체결 내역)")
+        ticker, orderbook, transactions = await asyncio.gather(
+            client.get_ticker("BTC"),
+            client.get_orderbook("BTC"),
+            client.get_transaction_history("BTC")
+        )
         print(f"✅ BTC 현재가: {ticker}")
-        
-        print("\n2. 공개 API 테스트 (호가 정보)")
-        orderbook = await client.get_orderbook("BTC")
         print(f"✅ BTC 호가: {orderbook}")
-        
-        print("\n3. 공개 API 테스트 (체결 내역)")
-        transactions = await client.get_transaction_history("BTC")
         print(f"✅ BTC 체결 내역: {transactions}")
         
-        print("\n4. 개인 API 테스트 (잔고 조회)")
-        balance = await client.get_balance()
+        print("\n4-6. 개인 API 테스트 (잔고, 주문 조회, 체결 내역)")
+        balance, orders, user_transactions = await asyncio.gather(
+            client.get_balance(),
+            client.get_orders("BTC", "KRW"),
+            client.get_user_transactions("BTC", "KRW")
+        )
         print(f"✅ 잔고 정보: {balance}")
-        
-        print("\n5. 개인 API 테스트 (주문 조회)")
-        orders = await client.get_orders("BTC", "KRW")
         print(f"✅ 주문 조회: {orders}")
-        
-        print("\n6. 개인 API 테스트 (체결 내역)")
-        user_transactions = await client.get_user_transactions("BTC", "KRW")
         print(f"✅ 사용자 체결 내역: {user_transactions}")
         
         print("\n✅ 모든 API 테스트 성공!")
@@ -60,10 +60,11 @@ async def test_bithumb_api():
     except Exception as e:
         print(f"❌ 일반 에러: {e}")
     finally:
-        await client.http_client.aclose()
+        if owns_client:
+            await client.http_client.aclose()
 
-async def test_order_placement():
-    """주문 테스트 (시뮬레이션)"""
+async def test_order_placement(client: Optional[BithumbClient] = None):
+    """주문 테스트 (시뮬레이션, client를 주입하면 연결을 재사용하고 닫지 않음)"""
     print("\n=== 주문 테스트 (시뮬레이션) ===")
     
     api_key = os.getenv("BITHUMB_API_KEY")
@@ -73,7 +74,9 @@ async def test_order_placement():
         print("❌ API 키가 설정되지 않았습니다.")
         return
     
-    client = BithumbClient(api_key, secret_key)
+    owns_client = client is None
+    if owns_client:
+        client = BithumbClient(api_key, secret_key)
     
     try:
         # 시뮬레이션 주문 (실제로는 실행되지 않음)
@@ -93,11 +96,20 @@ async def test_order_placement():
         print(f"❌ 주문 API 에러: {e}")
     except Exception as e:
         print(f"❌ 주문 에러: {e}")
+    finally:
+        if owns_client:
+            await client.http_client.aclose()
+
+async def _run():
+    """하나의 클라이언트(TLS 연결 풀)로 전체 테스트 실행"""
+    client = BithumbClient(os.getenv("BITHUMB_API_KEY"), os.getenv("BITHUMB_SECRET_KEY"))
+    try:
+        await test_bithumb_api(client)
+        print("\n" + "="*50)
+        await test_order_placement(client)
     finally:
         await client.http_client.aclose()
 
 if __name__ == "__main__":
     print("빗썸 API 1.0 연동 테스트 시작...")
-    asyncio.run(test_bithumb_api())
-    print("\n" + "="*50)
-    asyncio.run(test_order_placement())
+    asyncio.run(_run())
@@ -37,21 +37,17 @@ async def test_bithumb_client():
         print(f"   BTC 현재가: {ticker['data']['closing_price']}원")
         print("✅ 공개 API 정상 작동")
         
-        # 2. 개인 API 테스트
-        print("\n2. 개인 API 테스트...")
-        balance = await client.get_balance()
+        # 2-4. 개인 API 테스트 (잔고, 주문, 체결 내역 동시 조회)
+        print("\n2-4. 개인 API 테스트...")
+        balance, orders, transactions = await asyncio.gather(
+            client.get_balance(),
+            client.get_orders("BTC", "KRW"),
+            client.get_user_transactions("BTC", "KRW")
+        )
         print(f"   잔고 정보: {balance}")
         print("✅ 개인 API 인증 성공!")
-        
-        # 3. 주문 조회 테스트
-        print("\n3. 주문 조회 테스트...")
-        orders = await client.get_orders("BTC", "KRW")
         print(f"   주문 정보: {orders}")
         print("✅ 주문 조회 성공!")
-        
-        # 4. 체결 내역 테스트
-        print("\n4. 체결 내역 테스트...")
-        transactions = await client.get_user_transactions("BTC", "KRW")
         print(f"   체결 내역: {transactions}")
         print("✅ 체결 내역 조회 성공!")
         
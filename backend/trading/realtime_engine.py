@@ -22,11 +22,12 @@ from data.realtime_collector import RealtimeDataCollector
 class TradingMode(Enum):
     """거래 모드"""
     SIMULATION = "simulation"  # 시뮬레이션
+    FAST_SIMULATION = "fast_simulation"  # 가상 시계 기반 고속 시뮬레이션 (run_ticks로 구동)
     LIVE = "live"             # 실제 거래
     PAPER = "paper"           # 페이퍼 트레이딩
 
 
-@dataclass
+@dataclass(slots=True)
 class RealtimeTrade:
     """실시간 거래 정보"""
     id: str
@@ -44,7 +45,7 @@ class RealtimeTrade:
     signal_confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """포지션 정보"""
     symbol: str
@@ -82,6 +83,11 @@ class RealtimeTradingEngine:
         # 데이터 수집
         self.data_collector = RealtimeDataCollector()
         self.current_data: Dict[str, pd.DataFrame] = {}
+        self._last_data_time: Dict[str, Any] = {}  # 심볼별 마지막으로 추가한 수집기 데이터 시각 (중복 추가 방지)
+        
+        # 고속 시뮬레이션용 과거 캔들 (load_replay로 등록, 가상 시계에 맞춰 한 봉씩 공급)
+        self.replay_data: Dict[str, pd.DataFrame] = {}
+        self._replay_pos: Dict[str, int] = {}
         
         # 콜백 함수들
         self.on_trade_callback: Optional[Callable] = None
@@ -94,9 +100,68 @@ class RealtimeTradingEngine:
         # 실행 상태
         self.is_running = False
         self.last_update = datetime.now()
+        self.ready_event = asyncio.Event()       # start() 완료 시 설정
+        self.first_tick_event = asyncio.Event()  # 첫 시장 데이터 수신 시 설정
+        self._tick_event = asyncio.Event()       # 틱 처리 완료 시마다 설정 (until에서 사용)
+        self.idle_event = asyncio.Event()        # 틱 처리 후 대기 중인 주문이 없으면 설정 (다음 틱 시작 시 해제)
+        self.ticks_processed = 0
+        
+        # 고속 시뮬레이션용 가상 시계 (load_replay 시 첫 캔들 시각으로 맞추고 run_ticks 호출 시 틱마다 전진)
+        self.virtual_time = datetime.now()
+    
+    @property
+    def is_simulated(self) -> bool:
+        """시뮬레이션 계열 모드 여부"""
+        return self.mode in (TradingMode.SIMULATION, TradingMode.FAST_SIMULATION)
+    
+    def _now(self) -> datetime:
+        """현재 시각 (고속 시뮬레이션 모드에서는 가상 시각)"""
+        if self.mode == TradingMode.FAST_SIMULATION:
+            return self.virtual_time
+        return datetime.now()
+    
+    @property
+    def replay_finished(self) -> bool:
+        """등록된 과거 캔들을 모두 공급했는지 (고속 시뮬레이션)"""
+        return bool(self.replay_data) and all(
+            self._replay_pos[symbol] >= len(candles) for symbol, candles in self.replay_data.items()
+        )
+    
+    def load_replay(self, symbol: str, candles: pd.DataFrame):
+        """고속 시뮬레이션용 과거 캔들 등록 (DatetimeIndex, open/high/low/close/volume 열)
+        
+        가상 시계는 등록된 캔들 중 가장 이른 시각에서 시작하고, 틱마다 그 시각까지의 캔들만 공급된다
+        """
+        if self.mode != TradingMode.FAST_SIMULATION:
+            raise ValueError("load_replay is only available in FAST_SIMULATION mode")
+        if candles.empty:
+            raise ValueError(f"No replay data for {symbol}")
+        
+        self.replay_data[symbol] = candles.sort_index()[['open', 'high', 'low', 'close', 'volume']]
+        self._replay_pos[symbol] = 0
+        self.virtual_time = min(data.index[0] for data in self.replay_data.values()).to_pydatetime()
+    
+    @property
+    def has_pending_orders(self) -> bool:
+        """체결 대기 중인 주문 존재 여부"""
+        return any(order.status == OrderStatus.PENDING for order in self.orders.values())
+    
+    @property
+    def total_trades_count(self) -> int:
+        """지금까지 체결된 거래 수"""
+        return len(self.trades)
+    
+    async def until(self, predicate: Callable[['RealtimeTradingEngine'], bool]):
+        """predicate(engine)가 참이 될 때까지 틱마다 확인하며 대기 (타임아웃은 asyncio.wait_for로 지정)"""
+        while not predicate(self):
+            self._tick_event.clear()
+            await self._tick_event.wait()
     
     async def start(self, symbols: List[str], strategies: List[str] = None):
-        """실시간 거래 시작"""
+        """실시간 거래 시작 (고속 시뮬레이션은 실시간 수집 대신 load_replay로 등록한 캔들 사용)"""
+        if self.mode == TradingMode.FAST_SIMULATION and not self.replay_data:
+            raise ValueError("FAST_SIMULATION requires load_replay() before start()")
+        
         try:
             self.logger.info(f"실시간 거래 엔진 시작 - 모드: {self.mode.value}")
             
@@ -107,11 +172,14 @@ class RealtimeTradingEngine:
                     self.strategy_manager.start_strategy(strategy_id)
             
             # 데이터 수집 시작
-            await self.data_collector.start_collection(symbols, ['market'])
+            if self.mode != TradingMode.FAST_SIMULATION:
+                await self.data_collector.start_collection(symbols, ['market'])
             
-            # 실시간 거래 루프를 백그라운드에서 시작
+            # 실시간 거래 루프를 백그라운드에서 시작 (고속 시뮬레이션은 run_ticks로 직접 구동)
             self.is_running = True
-            asyncio.create_task(self._trading_loop())
+            if self.mode != TradingMode.FAST_SIMULATION:
+                asyncio.create_task(self._trading_loop())
+            self.ready_event.set()
             
             self.logger.info("실시간 거래 엔진이 백그라운드에서 시작되었습니다.")
             
@@ -136,20 +204,7 @@ class RealtimeTradingEngine:
         """실시간 거래 루프"""
         while self.is_running:
             try:
-                # 최신 데이터 수집
-                await self._update_market_data()
-                
-                # 활성 전략 실행
-                await self._execute_strategies()
-                
-                # 포지션 관리
-                await self._manage_positions()
-                
-                # 주문 상태 확인
-                await self._check_order_status()
-                
-                # 업데이트 시간 기록
-                self.last_update = datetime.now()
+                await self._tick()
                 
                 # 1초 대기
                 await asyncio.sleep(1)
@@ -160,30 +215,104 @@ class RealtimeTradingEngine:
                     await self.on_error_callback(e)
                 await asyncio.sleep(5)  # 오류 시 5초 대기
     
+    async def _tick(self):
+        """거래 루프 1회 실행"""
+        self.idle_event.clear()
+        try:
+            # 최신 데이터 수집
+            await self._update_market_data()
+            
+            # 활성 전략 실행
+            await self._execute_strategies()
+            
+            # 포지션 관리
+            await self._manage_positions()
+            
+            # 주문 상태 확인
+            await self._check_order_status()
+            
+            # 업데이트 시간 기록
+            self.last_update = self._now()
+        finally:
+            # 틱 완료 알림 (오류가 난 틱도 처리된 것으로 집계)
+            self.ticks_processed += 1
+            self._tick_event.set()
+            if not self.has_pending_orders:
+                self.idle_event.set()
+    
+    async def run_ticks(self, n: int, tick_interval: float = 1.0):
+        """고속 시뮬레이션 - 실제 대기 없이 n틱 실행하며 가상 시계를 tick_interval초씩 전진
+        
+        tick_interval은 등록한 캔들 간격에 맞춰 지정 (캔들을 모두 공급하면 n틱 전이라도 종료)
+        """
+        if self.mode != TradingMode.FAST_SIMULATION:
+            raise ValueError("run_ticks is only available in FAST_SIMULATION mode")
+        
+        step = timedelta(seconds=tick_interval)
+        for _ in range(n):
+            if not self.is_running:
+                break
+            try:
+                await self._tick()
+            except Exception as e:
+                self.logger.error(f"거래 루프 오류: {e}")
+                if self.on_error_callback:
+                    await self.on_error_callback(e)
+            if self.replay_finished:
+                break
+            self.virtual_time += step
+            
+            # 다른 작업에 실행 기회 양보
+            await asyncio.sleep(0)
+    
     async def _update_market_data(self):
         """시장 데이터 업데이트"""
+        if self.mode == TradingMode.FAST_SIMULATION:
+            self._update_replay_data()
+            return
+        
         for symbol in self.data_collector.data_buffer.keys():
             latest_data = self.data_collector.get_latest_data(symbol)
             if latest_data:
-                # 데이터를 DataFrame으로 변환하여 저장
-                if symbol not in self.current_data:
-                    self.current_data[symbol] = pd.DataFrame()
+                self.first_tick_event.set()
+                
+                # 수집기가 아직 새 데이터를 받지 않았으면 같은 가격을 다시 쌓지 않음
+                if self._last_data_time.get(symbol) == latest_data['timestamp']:
+                    continue
+                self._last_data_time[symbol] = latest_data['timestamp']
                 
                 # 새로운 데이터 추가
-                new_row = pd.DataFrame([{
+                self._append_bars(symbol, pd.DataFrame([{
                     'timestamp': latest_data['timestamp'],
                     'open': latest_data['price'],
                     'high': latest_data['price'],
                     'low': latest_data['price'],
                     'close': latest_data['price'],
                     'volume': latest_data['volume']
-                }])
-                
-                self.current_data[symbol] = pd.concat([self.current_data[symbol], new_row], ignore_index=True)
-                
-                # 최근 100개 데이터만 유지
-                if len(self.current_data[symbol]) > 100:
-                    self.current_data[symbol] = self.current_data[symbol].tail(100)
+                }]))
+    
+    def _update_replay_data(self):
+        """고속 시뮬레이션 - 가상 시각까지 도달한 과거 캔들을 공급"""
+        for symbol, candles in self.replay_data.items():
+            pos = self._replay_pos[symbol]
+            end = candles.index.searchsorted(self.virtual_time, side='right')
+            if end <= pos:
+                continue
+            
+            self._replay_pos[symbol] = end
+            self.first_tick_event.set()
+            self._append_bars(symbol, candles.iloc[pos:end].rename_axis('timestamp').reset_index())
+    
+    def _append_bars(self, symbol: str, bars: pd.DataFrame):
+        """심볼 데이터에 봉 추가 (최근 100개만 유지)"""
+        if symbol not in self.current_data:
+            self.current_data[symbol] = bars
+        else:
+            self.current_data[symbol] = pd.concat([self.current_data[symbol], bars], ignore_index=True)
+        
+        # 최근 100개 데이터만 유지
+        if len(self.current_data[symbol]) > 100:
+            self.current_data[symbol] = self.current_data[symbol].tail(100)
     
     async def _execute_strategies(self):
         """전략 실행"""
@@ -218,14 +347,14 @@ class RealtimeTradingEngine:
     
     async def _place_buy_order(self, symbol: str, signal, strategy_id: str):
         """매수 주문"""
-        if self.mode == TradingMode.SIMULATION:
+        if self.is_simulated:
             await self._simulate_buy_order(symbol, signal, strategy_id)
         else:
             await self._execute_live_buy_order(symbol, signal, strategy_id)
     
     async def _place_sell_order(self, symbol: str, signal, strategy_id: str):
         """매도 주문"""
-        if self.mode == TradingMode.SIMULATION:
+        if self.is_simulated:
             await self._simulate_sell_order(symbol, signal, strategy_id)
         else:
             await self._execute_live_sell_order(symbol, signal, strategy_id)
@@ -252,7 +381,7 @@ class RealtimeTradingEngine:
             side="buy",
             amount=signal.quantity,
             price=signal.price,
-            timestamp=datetime.now(),
+            timestamp=self._now(),
             status="filled",
             commission=commission,
             net_amount=signal.quantity,
@@ -311,7 +440,7 @@ class RealtimeTradingEngine:
             side="sell",
             amount=sell_amount,
             price=signal.price,
-            timestamp=datetime.now(),
+            timestamp=self._now(),
             status="filled",
             commission=commission,
             net_amount=sell_amount,
@@ -413,11 +542,11 @@ class RealtimeTradingEngine:
             if symbol in self.current_data and not self.current_data[symbol].empty:
                 current_price = self.current_data[symbol]['close'].iloc[-1]
                 position.unrealized_pnl = position.amount * (current_price - position.avg_price)
-                position.last_update = datetime.now()
+                position.last_update = self._now()
     
     async def _check_order_status(self):
         """주문 상태 확인"""
-        if self.mode == TradingMode.SIMULATION:
+        if self.is_simulated:
             return  # 시뮬레이션 모드에서는 주문 상태 확인 불필요
         
         for order_id, order in self.orders.items():